@@ -14,9 +14,12 @@ import argparse
 import sys
 import os
 import csv
+import hashlib
+import itertools
+import json
 import yaml
 import tempfile
-import shutil
+import threading
 from pathlib import Path
 
 # Import musiclib modules
@@ -27,6 +30,12 @@ import logging
 
 logger = get_logger(__name__)
 
+# Prefer libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 DEFAULT_CONFIG_YAML = """# Global audio settings
 global:
@@ -51,6 +60,7 @@ pad_miner:
   max_candidates_per_file: 3            # How many pads to extract per source file
   loop_crossfade_ms: 100                # Loop smoothing crossfade (v0.8)
   window_hop_sec: 0.5                   # Hop size for sliding window analysis
+  workers: 1                            # Parallel processes for mining files (1 = serial)
 
 # Drone / pad / swell maker settings
 drones:
@@ -75,6 +85,7 @@ drones:
   pitch_shift_semitones: [0, 7, 12]     # Pitch shifts to apply (semitones)
   time_stretch_factors: [1.0, 1.5, 2.0]  # Time-stretch factors (1.0 = original)
   enable_reversal: true                 # Whether to create reversed variants
+  workers: 1                            # Parallel processes for pad source files (1 = serial)
 
 # Granular cloud settings
 clouds:
@@ -91,6 +102,7 @@ clouds:
   lowpass_hz: 8000                      # Post-processing low-pass (optional)
   clouds_per_source: 2                  # Number of cloud variations per source
   target_peak_dbfs: -3.0                # Gentler normalization for dense overlaps
+  workers: 1                            # Parallel processes for rendering clouds (1 = serial)
 
 # Hiss / air texture settings
 hiss:
@@ -103,6 +115,7 @@ hiss:
   tremolo_rate_hz: 3.0                  # Amplitude modulation rate
   tremolo_depth: 0.6                    # Tremolo depth (0-1)
   hiss_loops_per_source: 2              # Number of hiss loop variants
+  fir_taps: 0                           # >0: odd-length FIR via FFT convolution instead of IIR
 
   # Flicker burst parameters
   flicker_min_ms: 50                    # Minimum flicker duration
@@ -131,6 +144,7 @@ pre_analysis:
   enabled: true                         # Enable per-file quality analysis
   analysis_window_sec: 1.0              # Analysis window size (seconds)
   analysis_hop_sec: 0.5                 # Analysis hop size (seconds)
+  cache_results: false                  # Reuse per-file analysis from ~/.cache/afterglow/analysis
 
   # Stability filters (identify usable regions)
   max_onset_rate_hz: 3.0                # Max onsets per second (low = sustained)
@@ -166,6 +180,46 @@ reproducibility:
 """
 
 
+def _config_cache_file(config_path: str) -> Path:
+    """JSON cache location for a parsed config file."""
+    digest = hashlib.blake2b(os.path.abspath(config_path).encode(), digest_size=8).hexdigest()
+    return io_utils.get_cache_dir() / f"config-{digest}.json"
+
+
+def _load_yaml_config(config_path: str) -> dict:
+    """
+    Parse a YAML config, reusing a cached copy while the file is unchanged.
+
+    The cache is plain JSON (never pickle, so a writable cache directory
+    cannot inject code) keyed on the file's mtime and size. Configs that do
+    not survive a JSON round trip unchanged are not cached, and any problem
+    reading or writing the cache falls back to a plain YAML parse.
+    """
+    stat = os.stat(config_path)
+    key = [stat.st_mtime_ns, stat.st_size]
+    try:
+        cache_file = _config_cache_file(config_path)
+        with open(cache_file, 'r') as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return cached["config"]
+    except Exception:
+        cache_file = None
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    try:
+        payload = json.dumps({"key": key, "config": config})
+        if json.loads(payload)["config"] == config:
+            cache_file = cache_file or _config_cache_file(config_path)
+            with open(cache_file, 'w') as f:
+                f.write(payload)
+    except Exception as e:
+        logger.debug(f"Could not write config cache: {e}")
+    return config
+
+
 def load_or_create_config(config_path: str = "config.yaml") -> dict:
     """
     Load config from file or create default if missing.
@@ -177,18 +231,59 @@ def load_or_create_config(config_path: str = "config.yaml") -> dict:
         Configuration dictionary
     """
     if os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            logger.info(f"Loaded config from {config_path}")
-            return config
+        config = _load_yaml_config(config_path)
+        logger.info(f"Loaded config from {config_path}")
+        return config
     else:
         logger.info(f"Config not found, creating default at {config_path}")
         with open(config_path, 'w') as f:
             f.write(DEFAULT_CONFIG_YAML)
-        config = yaml.safe_load(DEFAULT_CONFIG_YAML)
+        config = yaml.load(DEFAULT_CONFIG_YAML, Loader=_YamlLoader)
         return config
 
 
+class ManifestWriter:
+    """
+    List-like manifest sink that streams rows to a temporary CSV.
+
+    Makers call ``manifest.append(row)`` as they save files; rows go straight
+    to disk instead of accumulating in memory. ``commit()`` atomically moves
+    the finished file into place (or discards it if nothing was written).
+    """
+
+    def __init__(self, export_dir: str):
+        self._tmp = tempfile.NamedTemporaryFile(mode='w', dir=export_dir, delete=False, newline="")
+        self._writer = csv.DictWriter(self._tmp, fieldnames=dsp_utils.MANIFEST_FIELDS)
+        self._writer.writeheader()
+        self._lock = threading.Lock()
+        self._rows = 0
+
+    def append(self, row: dict) -> None:
+        with self._lock:
+            self._writer.writerow(row)
+            self._rows += 1
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def commit(self, manifest_path: str) -> int:
+        """Finish the CSV and move it to manifest_path. Returns rows written."""
+        self._tmp.close()
+        if self._rows:
+            # Temp file lives in the export dir, so this is a same-filesystem
+            # rename: atomic on POSIX and Windows, no copy fallback needed
+            os.replace(self._tmp.name, manifest_path)
+        else:
+            os.unlink(self._tmp.name)
+        return self._rows
+
+    def discard(self) -> None:
+        """Drop the partial CSV (e.g. after a failed run)."""
+        self._tmp.close()
+        if os.path.exists(self._tmp.name):
+            os.unlink(self._tmp.name)
+
+
 def ensure_directories(config: dict) -> None:
     """Create required directories if they don't exist."""
     dirs_to_create = [
@@ -214,9 +309,13 @@ def run_mine_pads(config: dict) -> None:
 
 def run_make_drones(config: dict) -> None:
     """Execute drone/swell generation."""
-    drone_dict = drone_maker.process_pad_sources(config)
-    if drone_dict:
-        pads, swells = drone_maker.save_drone_outputs(drone_dict, config, manifest=config.get("_manifest"))
+    # Save each source's outputs as soon as it is processed
+    drone_sources = drone_maker.iter_pad_sources(config)
+    first = next(drone_sources, None)
+    if first is not None:
+        pads, swells = drone_maker.save_drone_outputs(
+            itertools.chain([first], drone_sources), config, manifest=config.get("_manifest")
+        )
         log_success(logger, f"\nSaved {pads} pad(s) and {swells} swell(s)")
     else:
         logger.warning(f"\nNo drone sources processed (check {config['paths']['pad_sources_dir']})")
@@ -413,9 +512,6 @@ Examples:
     # Validate config early to catch obvious errors
     validate_config(config)
 
-    # Manifest accumulator (shared across phases)
-    config["_manifest"] = []
-
     # Set random seed if specified (for reproducible results)
     reproducibility_config = config.get('reproducibility', {})
     random_seed = reproducibility_config.get('random_seed', None)
@@ -446,37 +542,31 @@ Examples:
     logger.info(" Music Texture Generator for TR-8S")
     logger.info("=" * 60)
 
+    # Manifest rows stream to a temp CSV as each phase saves files
+    export_dir = config['paths']['export_dir']
+    manifest = ManifestWriter(export_dir)
+    config["_manifest"] = manifest
+
     # Run requested operations
-    if 'mine_pads' in operations:
-        run_mine_pads(config)
+    try:
+        if 'mine_pads' in operations:
+            run_mine_pads(config)
 
-    if 'make_drones' in operations:
-        run_make_drones(config)
+        if 'make_drones' in operations:
+            run_make_drones(config)
 
-    if 'make_clouds' in operations:
-        run_make_clouds(config)
+        if 'make_clouds' in operations:
+            run_make_clouds(config)
 
-    if 'make_hiss' in operations:
-        run_make_hiss(config)
+        if 'make_hiss' in operations:
+            run_make_hiss(config)
+    except BaseException:
+        manifest.discard()
+        raise
 
     # Emit manifest if any rows were collected
-    manifest = config.get("_manifest", [])
-    if manifest:
-        export_dir = config['paths']['export_dir']
-        os.makedirs(export_dir, exist_ok=True)
-        manifest_path = os.path.join(export_dir, "manifest.csv")
-        fieldnames = sorted({k for row in manifest for k in row.keys()})
-
-        # Atomic write: write to temp file first, then move
-        # This prevents race conditions and partial writes if interrupted
-        with tempfile.NamedTemporaryFile(mode='w', dir=export_dir, delete=False, newline="") as tmp:
-            writer = csv.DictWriter(tmp, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(manifest)
-            tmp_path = tmp.name
-
-        # Atomic move (POSIX guarantees atomicity on same filesystem)
-        shutil.move(tmp_path, manifest_path)
+    manifest_path = os.path.join(export_dir, "manifest.csv")
+    if manifest.commit(manifest_path):
         logger.info(f"[manifest] Wrote {len(manifest)} rows to {manifest_path}")
 
     logger.info("\n" + "=" * 60)
@@ -3,13 +3,15 @@
 mine_drums.py: Extract transient (drum/percussion) sounds from audio.
 
 Usage:
-  python mine_drums.py
+  python mine_drums.py --source "path/to/audio.flac"
+  python mine_drums.py --sources a.flac b.flac c.flac
 """
 
 import os
 import sys
 import argparse
-import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 import librosa
 import soundfile as sf
@@ -19,7 +21,6 @@ from pathlib import Path
 # Import musiclib modules (assumes running from repo root)
 from musiclib import io_utils, dsp_utils, audio_analyzer
 from musiclib.logger import get_logger, log_success
-from musiclib.exceptions import SilentArtifact
 
 logger = get_logger(__name__)
 
@@ -44,6 +45,7 @@ DEFAULT_CONFIG = {
         "post_avg": 100,              # Moving average window after
         "delta": 0.05,                # Threshold for peak picking
         "wait": 30,                   # Wait N frames before picking next onset (prevents double hits)
+        "onset_chunk_sec": 30.0,      # Analyse long files in chunks of this length (bounds STFT memory)
         
         # Slicing parameters
         "slice_mode": "onset_to_onset",  # 'onset_to_onset' or 'fixed_length'
@@ -70,26 +72,121 @@ def deep_update(base: dict, override: dict) -> dict:
     return base
 
 
+def _onset_envelope(audio: np.ndarray, sr: int, chunk_sec: float,
+                    n_fft: int = 2048, hop_length: int = 512) -> np.ndarray:
+    """
+    librosa's default onset strength envelope, computed chunk by chunk.
+
+    The STFT for a long file is the dominant allocation in onset detection.
+    Here the centred STFT frames are computed over frame-aligned slices of
+    the padded signal and only the (much smaller) mel spectrogram is kept,
+    so peak memory is bounded by chunk_sec rather than the file length.
+    The envelope matches onset_strength(y=audio) to float precision.
+    """
+    chunk_frames = int(chunk_sec * sr) // hop_length
+    if chunk_frames <= 0 or len(audio) <= chunk_frames * hop_length:
+        return librosa.onset.onset_strength(y=audio, sr=sr, n_fft=n_fft, hop_length=hop_length)
+
+    padded = np.pad(audio, n_fft // 2)  # same constant padding as center=True
+    n_frames = 1 + len(audio) // hop_length
+    mel = None
+    for k0 in range(0, n_frames, chunk_frames):
+        k1 = min(k0 + chunk_frames, n_frames)
+        chunk_mel = librosa.feature.melspectrogram(
+            y=padded[k0 * hop_length:(k1 - 1) * hop_length + n_fft],
+            sr=sr, n_fft=n_fft, hop_length=hop_length, center=False,
+        )
+        if mel is None:
+            mel = np.empty((chunk_mel.shape[0], n_frames), dtype=chunk_mel.dtype)
+        mel[:, k0:k1] = chunk_mel
+
+    return librosa.onset.onset_strength(
+        S=librosa.power_to_db(mel), sr=sr, n_fft=n_fft, hop_length=hop_length
+    )
+
+
+def _slice_bounds(onsets: np.ndarray, n_samples: int, max_len: int, min_len: int) -> tuple:
+    """
+    Onset-to-onset slice boundaries, capped at max_len and dropping any
+    shorter than min_len. Returns (starts, ends) as int64 arrays.
+    """
+    starts = np.asarray(onsets, dtype=np.int64)
+    ends = np.minimum(np.append(starts[1:], n_samples), starts + max_len)
+    keep = (ends - starts) >= min_len
+    return starts[keep], ends[keep]
+
+
+@dsp_utils.njit(cache=True)
+def _slice_and_filter(audio, starts, ends, fade_in_ramp, fade_out_ramp,
+                      min_peak_lin, target_peak_lin, max_slices):
+    """
+    Gate, fade and normalize the given slices in one pass.
+
+    Slices never overlap, so they are packed back to back into a single
+    buffer no larger than the input; returns (buffer, offsets, lengths).
+    """
+    n_slices = len(starts)
+    # Only candidate slices (and at most max_slices of them) can land in the
+    # buffer, which is often far less than the whole file
+    spans = ends - starts
+    budget = 0
+    if n_slices > 0:
+        budget = min(spans.sum(), max_slices * spans.max())
+    out = np.empty(budget, dtype=audio.dtype)
+    offsets = np.empty(min(n_slices, max_slices), dtype=np.int64)
+    lengths = np.empty(min(n_slices, max_slices), dtype=np.int64)
+    count = 0
+    pos = 0
+
+    for i in range(n_slices):
+        if count >= max_slices:
+            break
+        start = starts[i]
+        length = ends[i] - start
+
+        segment = audio[start:start + length]
+        if dsp_utils.peak_abs(segment) < min_peak_lin:
+            continue
+
+        dst = out[pos:pos + length]
+        dst[:] = segment
+        peak = dsp_utils.fade_normalize_inplace(dst, fade_in_ramp, fade_out_ramp, target_peak_lin)
+        if not np.isfinite(peak):
+            raise ValueError("Audio contains NaN or Inf values")
+        if peak < 1e-8:
+            # Silent after fades; the next slice overwrites this span
+            continue
+
+        offsets[count] = pos
+        lengths[count] = length
+        count += 1
+        pos += length
+
+    return out[:pos], offsets[:count], lengths[:count]
+
+
 def extract_drum_slices(audio: np.ndarray, sr: int, config: dict) -> list:
     """
     Detect onsets and slice audio into individual hits.
+
+    Returns:
+        List of processed hits. Each is a view into one contiguous buffer
+        (at most len(audio) samples), not a separate allocation, so callers
+        that want to modify a hit independently should copy it first.
     """
     dm_config = config['drum_miner']
 
     logger.info("    Analyzing onsets...")
 
-    # onset_detect returns frame indices
-    onset_frames = librosa.onset.onset_detect(
-        y=audio,
-        sr=sr,
+    onset_env = _onset_envelope(audio, sr, dm_config.get('onset_chunk_sec', 30.0))
+
+    # Onset positions in samples
+    onset_frames = dsp_utils.detect_onsets(
+        onset_env, sr,
         backtrack=dm_config['onset_backtrack'],
-        pre_max=dm_config['pre_max'],
-        post_max=dm_config['post_max'],
-        pre_avg=dm_config['pre_avg'],
-        post_avg=dm_config['post_avg'],
-        delta=dm_config['delta'],
-        wait=dm_config['wait'],
-        units='samples' # Get samples directly
+        pre_max=dm_config['pre_max'], post_max=dm_config['post_max'],
+        pre_avg=dm_config['pre_avg'], post_avg=dm_config['post_avg'],
+        delta=dm_config['delta'], wait=dm_config['wait'],
     )
 
     if len(onset_frames) == 0:
@@ -97,82 +194,39 @@ def extract_drum_slices(audio: np.ndarray, sr: int, config: dict) -> list:
 
     logger.info(f"    Found {len(onset_frames)} raw onsets.")
     
-    slices = []
-    
-    for i, start_sample in enumerate(onset_frames):
-        # Determine end sample
-        if i < len(onset_frames) - 1:
-            end_sample = onset_frames[i+1]
-        else:
-            end_sample = len(audio)
-            
-        # Enforce max length
-        max_len_samples = int(dm_config['max_length_sec'] * sr)
-        if (end_sample - start_sample) > max_len_samples:
-            end_sample = start_sample + max_len_samples
-            
-        # Check minimum length
-        min_len_samples = int(dm_config['min_length_sec'] * sr)
-        if (end_sample - start_sample) < min_len_samples:
-            continue
-            
-        # Extract audio
-        drum_audio = audio[start_sample:end_sample]
-        
-        # Check peak level
-        peak_db = dsp_utils.linear_to_db(np.max(np.abs(drum_audio)))
-        if peak_db < dm_config['min_peak_db']:
-            continue
-        if peak_db > dm_config['max_peak_db']:
-            # Maybe too hot, but usually we want loud drums. 
-            # If strictly clipping, maybe skip? 
-            # Let's keep it but warn? Or just keep.
-            pass
-            
-        # Apply fades
-        fade_in_samples = int(dm_config['fade_in_ms'] * sr / 1000)
-        fade_out_samples = int(dm_config['fade_out_ms'] * sr / 1000)
-        
-        drum_audio = dsp_utils.apply_fade_in(drum_audio, fade_in_samples)
-        drum_audio = dsp_utils.apply_fade_out(drum_audio, fade_out_samples)
-
-        # Normalize (skip if audio is silent/invalid)
-        try:
-            drum_audio = dsp_utils.normalize_audio(drum_audio, config['global']['target_peak_dbfs'])
-        except SilentArtifact as e:
-            logger.debug(f"Skipping drum slice: {e}")
-            continue
+    starts, ends = _slice_bounds(
+        onset_frames,
+        len(audio),
+        int(dm_config['max_length_sec'] * sr),
+        int(dm_config['min_length_sec'] * sr),
+    )
+    buffer, offsets, lengths = _slice_and_filter(
+        np.ascontiguousarray(audio),
+        starts,
+        ends,
+        dsp_utils.fade_ramp(int(dm_config['fade_in_ms'] * sr / 1000), rising=True),
+        dsp_utils.fade_ramp(int(dm_config['fade_out_ms'] * sr / 1000), rising=False),
+        dsp_utils.db_to_linear(dm_config['min_peak_db']),
+        dsp_utils.db_to_linear(config['global']['target_peak_dbfs']),
+        int(dm_config['max_saved_per_file']),
+    )
+    # Plain ints: cheaper to slice with than NumPy scalars
+    slices = [buffer[o:o + n] for o, n in zip(offsets.tolist(), lengths.tolist())]
 
-        slices.append(drum_audio)
-        
-        if len(slices) >= dm_config['max_saved_per_file']:
-            break
-            
     return slices
 
-def main():
-    parser = argparse.ArgumentParser(description="Mine drum/percussion sounds")
-    parser.add_argument('--config', type=str, help='Path to config (optional)')
-    parser.add_argument('--source', type=str, required=True, help='Source audio file path')
-    args = parser.parse_args()
-    
-    # Setup config
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    if args.config and os.path.exists(args.config):
-        with open(args.config, 'r') as f:
-            user_config = yaml.safe_load(f)
-            if isinstance(user_config, dict):
-                deep_update(config, user_config)
-            else:
-                logger.warning(f"Ignoring invalid config format in {args.config}")
-    # Basic validation of required sections
-    for section in ("paths", "global", "drum_miner"):
-        if section not in config:
-            logger.error(f"Config missing required section '{section}'")
-            return 1
+def process_source(source_path: str, config: dict, use_cache: bool = True) -> int:
+    """
+    Mine and save drum slices for a single source file.
 
-    # Paths
-    source_path = args.source
+    Args:
+        source_path: Source audio file path
+        config: Merged drum miner configuration
+        use_cache: Read/write the decoded-audio cache (see io_utils.load_audio)
+
+    Returns:
+        0 on success, 1 on failure (process exit code convention)
+    """
     export_base = config['paths']['export_dir']
 
     if not os.path.exists(source_path):
@@ -184,7 +238,7 @@ def main():
     # Load audio
     sr = config['global']['sample_rate']
     try:
-        audio, _ = io_utils.load_audio(source_path, sr=sr, mono=True)
+        audio, _ = io_utils.load_audio(source_path, sr=sr, mono=True, use_cache=use_cache)
     except Exception as e:
         logger.error(f"Failed to load audio: {e}")
         return 1
@@ -202,23 +256,72 @@ def main():
     output_dir = os.path.join(export_base, stem, "drums")
     os.makedirs(output_dir, exist_ok=True)
     
+    # libsndfile releases the GIL while encoding, so a few writer threads
+    # keep many small WAV writes in flight at once
     saved_count = 0
-    for i, drum_audio in enumerate(slices):
-        filename = f"{stem}_drum_{i+1:03d}.wav"
-        out_path = os.path.join(output_dir, filename)
+    with ThreadPoolExecutor(max_workers=4) as writer:
+        pending = []
+        for i, drum_audio in enumerate(slices):
+            filename = f"{stem}_drum_{i+1:03d}.wav"
+            out_path = os.path.join(output_dir, filename)
+            pending.append((out_path, writer.submit(
+                io_utils.save_audio, out_path, drum_audio, sr, bit_depth=24
+            )))
 
-        # Compute minimal metadata for grading?
-        # For now just save everything we found
-
-        if not io_utils.save_audio(out_path, drum_audio, sr, bit_depth=24):
-            logger.warning(f"    Failed to save: {out_path}")
-            continue
-        saved_count += 1
-        if saved_count % 50 == 0:
-            logger.info(f"    Saved {saved_count}...")
+        for out_path, future in pending:
+            if not future.result():
+                logger.warning(f"    Failed to save: {out_path}")
+                continue
+            saved_count += 1
+            if saved_count % 50 == 0:
+                logger.info(f"    Saved {saved_count}...")
 
     log_success(logger, f"Saved {saved_count} drum/percussion files to {output_dir}")
     return 0
 
+
+def main():
+    parser = argparse.ArgumentParser(description="Mine drum/percussion sounds")
+    parser.add_argument('--config', type=str, help='Path to config (optional)')
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--source', type=str, help='Source audio file path')
+    source_group.add_argument('--sources', type=str, nargs='+',
+                              help='Several source files, mined in parallel')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for --sources (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Don't read or write the decoded-audio cache")
+    args = parser.parse_args()
+    
+    # Setup config (DEFAULT_CONFIG is two levels of scalars, so copying each
+    # section is enough to keep deep_update from mutating the module default)
+    config = {section: dict(values) for section, values in DEFAULT_CONFIG.items()}
+    if args.config and os.path.exists(args.config):
+        with open(args.config, 'r') as f:
+            user_config = yaml.safe_load(f)
+            if isinstance(user_config, dict):
+                deep_update(config, user_config)
+            else:
+                logger.warning(f"Ignoring invalid config format in {args.config}")
+    # Basic validation of required sections
+    for section in ("paths", "global", "drum_miner"):
+        if section not in config:
+            logger.error(f"Config missing required section '{section}'")
+            return 1
+
+    sources = args.sources or [args.source]
+    use_cache = not args.no_cache
+    workers = max(1, min(args.workers, len(sources)))
+    if workers == 1:
+        return max(process_source(path, config, use_cache) for path in sources)
+
+    # Files are independent end to end (decode, onsets, writes), so each
+    # one runs in its own process
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("forkserver")) as executor:
+        return max(executor.map(
+            process_source, sources, [config] * len(sources), [use_cache] * len(sources)
+        ))
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,33 +4,119 @@ mine_silences.py: Extract quiet, textural spaces (room tone, dust, low-level noi
 
 Usage:
   python mine_silences.py --source "path/to/audio.flac"
+  python mine_silences.py --sources a.flac b.flac c.flac
 """
 
 import os
 import sys
 import argparse
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
-import librosa
 from pathlib import Path
 from musiclib import io_utils, dsp_utils
 from musiclib.logger import get_logger
-from musiclib.exceptions import SilentArtifact
 
 logger = get_logger(__name__)
 
+if dsp_utils.NUMBA_AVAILABLE:
+    @dsp_utils.njit(cache=True)
+    def _scan_chunks(block, chunk_len, step, n_chunks, min_rms_lin, max_rms_lin, max_crest):
+        """
+        Gate grid chunks on RMS, crest factor and variance (True = keep).
+
+        One pass per chunk accumulates sum, sum of squares and min/max.
+        Serial on purpose: blocks are only a few dozen chunks, and a numba
+        threading layer does not survive the forked --sources pool.
+        """
+        keep = np.zeros(n_chunks, dtype=np.bool_)
+        for i in range(n_chunks):
+            chunk = block[i * step:i * step + chunk_len]
+            total = 0.0
+            total_sq = 0.0
+            hi = chunk[0]
+            lo = chunk[0]
+            for v in chunk:
+                x = np.float64(v)
+                total += x
+                total_sq += x * x
+                if v > hi:
+                    hi = v
+                if v < lo:
+                    lo = v
+            rms_val = np.sqrt(total_sq / chunk_len)
+            # Use conservative threshold to avoid division by zero
+            crest = max(hi, -lo) / rms_val if rms_val > 1e-10 else 0.0
+            variance = total_sq / chunk_len - (total / chunk_len) ** 2
+            keep[i] = (min_rms_lin <= rms_val <= max_rms_lin
+                       and crest <= max_crest and variance >= 1e-9)
+        return keep
+else:
+    def _scan_chunks(block, chunk_len, step, n_chunks, min_rms_lin, max_rms_lin, max_crest):
+        """Gate grid chunks on RMS, crest factor and variance (NumPy fallback)."""
+        # Windows are strided views, not copies
+        chunks = np.lib.stride_tricks.sliding_window_view(block, chunk_len)[::step][:n_chunks]
+        sums = chunks.sum(axis=1, dtype=np.float64)
+        sum_sq = np.einsum('ij,ij->i', chunks, chunks, dtype=np.float64)
+        peak = np.maximum(chunks.max(axis=1), -chunks.min(axis=1))
+        rms_val = np.sqrt(sum_sq / chunk_len)
+        variance = sum_sq / chunk_len - (sums / chunk_len) ** 2
+        # Use conservative threshold to avoid division by zero
+        crest = np.divide(peak, rms_val, out=np.zeros_like(rms_val), where=rms_val > 1e-10)
+        return ((rms_val >= min_rms_lin) & (rms_val <= max_rms_lin)
+                & (crest <= max_crest) & (variance >= 1e-9))
+
+
+def _chunk_blocks(source_path: str, sr: int, chunk_len: int, step: int,
+                  chunks_per_block: int = 32, use_cache: bool = True):
+    """
+    Open a source as blocks of whole grid chunks.
+
+    Files already at ``sr`` are streamed with soundfile.blocks, each block
+    holding ``chunks_per_block`` chunks and overlapping the previous block by
+    ``chunk_len - step``, so chunk k of block b is grid chunk
+    ``b * chunks_per_block + k``. Only one block is in memory at a time.
+    Other files need resampling, so they are loaded whole (through the
+    decode cache unless ``use_cache`` is False) and yielded as a single block.
+
+    Returns:
+        (n_samples, iterator of (first_chunk_index, mono_block)), or
+        (0, None) if the file cannot be read
+    """
+    try:
+        info = sf.info(source_path)
+    except RuntimeError:
+        info = None
+
+    if info is None or info.samplerate != sr:
+        audio, _ = io_utils.load_audio(source_path, sr=sr, mono=True, use_cache=use_cache)
+        if audio is None:
+            return 0, None
+        return len(audio), iter([(0, audio)])
+
+    blocksize = chunk_len + (chunks_per_block - 1) * step
+    out = np.empty((blocksize, info.channels), dtype=np.float32)
+
+    def blocks():
+        with sf.SoundFile(source_path) as f:
+            for b, block in enumerate(f.blocks(out=out, overlap=chunk_len - step)):
+                mono = block[:, 0] if info.channels == 1 else block.mean(axis=1)
+                yield b * chunks_per_block, mono
+
+    return info.frames, blocks()
+
+
 def mine_silences(
     source_path: str,
     export_dir: str,
     sr: int = 44100,
-    normalization_target_db: float = -12.0
+    normalization_target_db: float = -12.0,
+    use_cache: bool = True
 ):
     logger.info(f"\n[SILENCE MINER] Processing: {source_path}")
 
-    audio, _ = io_utils.load_audio(source_path, sr=sr, mono=True)
-    if audio is None:
-        return
-
     # Configuration for "Soft Silence"
     # We want things that are NOT silent (digital zero) but ARE quiet.
     min_rms_db = -80.0
@@ -40,17 +126,13 @@ def mine_silences(
     min_duration_sec = 0.1
     max_duration_sec = 0.6
     
-    # Analysis
-    # We'll use a sliding window
-    # Calculate RMS envelope
-    frame_length = 2048
-    hop_length = 512
-    rms = librosa.feature.rms(y=audio, frame_length=frame_length, hop_length=hop_length)[0]
-    rms_db_env = librosa.amplitude_to_db(rms, ref=1.0)
-    
     # Grid strategy with overlap
     chunk_len_samples = int(0.3 * sr) # ~300ms average
     step = int(chunk_len_samples / 2)
+
+    n_samples, blocks = _chunk_blocks(source_path, sr, chunk_len_samples, step, use_cache=use_cache)
+    if blocks is None:
+        return
     
     found_count = 0
     
@@ -61,61 +143,91 @@ def mine_silences(
     
     # Limit total extraction to avoid thousands
     max_extracted = 50
-    
-    # Walk through audio
-    for start in range(0, len(audio) - chunk_len_samples, step):
-        chunk = audio[start : start + chunk_len_samples]
-        
-        # 1. Check RMS
-        chunk_rms_db = dsp_utils.rms_energy_db(chunk)
-        if not (min_rms_db <= chunk_rms_db <= max_rms_db):
-            continue
-            
-        # 2. Check for transients (we want "silence/texture", not "quiet drum hit")
-        # High crest factor = transient. Low crest factor = noise/hum.
-        peak = np.max(np.abs(chunk))
-        rms_val = dsp_utils.db_to_linear(chunk_rms_db)
-        # Use conservative threshold to avoid division by zero
-        crest = peak / rms_val if rms_val > 1e-10 else 0.0
-        
-        if crest > 5.0: # Arbitrary threshold: strictly flat(ish) textures
-            continue
-            
-        # 3. Check for digital silence (variance)
-        if np.var(chunk) < 1e-9:
-            continue
-            
-        # It's a valid soft silence!
-
-        # Normalize to target level (makes silence audible as texture)
-        try:
-            chunk_norm = dsp_utils.normalize_audio(chunk, normalization_target_db)
-        except SilentArtifact as e:
-            logger.debug(f"Skipping silence chunk: {e}")
-            continue
-
-        # Apply fades to avoid clicks
-        chunk_norm = dsp_utils.apply_fade_in(chunk_norm, 200) # Short micro-fade
-        chunk_norm = dsp_utils.apply_fade_out(chunk_norm, 200)
-
-        filename = f"{stem}_silence_{found_count+1:03d}.wav"
-        out_path = os.path.join(output_dir, filename)
-
-        if not io_utils.save_audio(out_path, chunk_norm, sr, bit_depth=24):
-            logger.warning(f"    Failed to save: {out_path}")
-            continue
-
-        found_count += 1
-        if found_count >= max_extracted:
-            break
+
+    # Gate in the linear domain: no log10 per chunk
+    min_rms_lin = dsp_utils.db_to_linear(min_rms_db)
+    max_rms_lin = dsp_utils.db_to_linear(max_rms_db)
+
+    # Fade and normalization constants shared by every chunk
+    fade_in = dsp_utils.fade_ramp(200, rising=True)  # Short micro-fade
+    fade_out = dsp_utils.fade_ramp(200, rising=False)
+    target_peak_lin = dsp_utils.db_to_linear(normalization_target_db)
+
+    n_chunks = len(range(0, n_samples - chunk_len_samples, step))
+    # libsndfile releases the GIL while encoding, so writes drain on a few
+    # threads while the scan moves on to the next block
+    pending = []
+    with ThreadPoolExecutor(max_workers=4) as writer:
+        for first_chunk, block in blocks:
+            n_block = min(
+                max(0, (len(block) - chunk_len_samples) // step + 1), n_chunks - first_chunk
+            )
+            if n_block <= 0:
+                break
+
+            # Keep chunks that are quiet (RMS within bounds), flat (crest factor
+            # <= 5: noise/hum, not a quiet drum hit) and not digital silence
+            keep = _scan_chunks(block, chunk_len_samples, step, n_block,
+                                min_rms_lin, max_rms_lin, 5.0)
+
+            # Only the surviving chunks reach the normalize/fade/write path
+            for idx in np.flatnonzero(keep):
+                start = idx * step
+                # Chunks overlap, so work on a copy rather than the source buffer
+                chunk_norm = np.array(block[start : start + chunk_len_samples])
+
+                # It's a valid soft silence!
+
+                # Fade to avoid clicks, then normalize to target level (makes silence
+                # audible as texture), in one pass
+                peak_faded = dsp_utils.fade_normalize_inplace(chunk_norm, fade_in, fade_out, target_peak_lin)
+                if not np.isfinite(peak_faded):
+                    raise ValueError(f"Silence chunk {first_chunk + idx} contains NaN or Inf values")
+                if peak_faded < 1e-8:
+                    logger.debug(f"Skipping silent silence chunk {first_chunk + idx} (peak={peak_faded:.2e})")
+                    continue
+
+                filename = f"{stem}_silence_{len(pending)+1:03d}.wav"
+                out_path = os.path.join(output_dir, filename)
+                pending.append((out_path, writer.submit(
+                    io_utils.save_audio, out_path, chunk_norm, sr, bit_depth=24
+                )))
+                if len(pending) >= max_extracted:
+                    break
+            if len(pending) >= max_extracted:
+                break
+
+        for out_path, future in pending:
+            if not future.result():
+                logger.warning(f"    Failed to save: {out_path}")
+                continue
+            found_count += 1
 
     logger.info(f"    → Extracted {found_count} soft silence/texture samples.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument('--source', required=True)
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--source')
+    source_group.add_argument('--sources', nargs='+', help="Several source files, mined in parallel")
     parser.add_argument('--export', default='export/tr8s')
     parser.add_argument('--norm_db', type=float, default=-12.0, help="Normalization target in dB")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for --sources (default: CPU count)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Don't read or write the decoded-audio cache")
     args = parser.parse_args()
-    
-    mine_silences(args.source, args.export, normalization_target_db=args.norm_db)
+
+    sources = args.sources or [args.source]
+    mine_one = functools.partial(
+        mine_silences, export_dir=args.export, normalization_target_db=args.norm_db,
+        use_cache=not args.no_cache,
+    )
+    workers = max(1, min(args.workers, len(sources)))
+    if workers == 1:
+        for path in sources:
+            mine_one(path)
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("forkserver")) as executor:
+            list(executor.map(mine_one, sources))
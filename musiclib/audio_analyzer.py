@@ -7,15 +7,83 @@ mining pads or extracting grains. All stats are precomputed once per file
 and reused across modules.
 """
 
-from typing import Tuple, Dict
+import hashlib
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Tuple, Dict, List, Optional
 import numpy as np
 import librosa
-from . import dsp_utils
+from . import dsp_utils, io_utils
 from .logger import get_logger
 from .exceptions import AudioError
 
 logger = get_logger(__name__)
 
+# Bump when any cached curve's definition changes so old entries are ignored
+_ANALYSIS_CACHE_VERSION = 1
+_CACHED_CURVES = (
+    "rms_curve", "dc_offset", "crest_factor", "onset_frames", "spectral_centroid",
+)
+
+
+@dsp_utils.njit(cache=True, fastmath=True)
+def _window_stats_kernel(audio, window, hop, n_windows):
+    """
+    Per-window sum, sum of squares and absolute peak in one compiled loop.
+
+    Accumulates in float64 whatever the input dtype, so float32 audio is
+    never copied. Serial: callers already run one analyzer per worker.
+    """
+    sums = np.empty(n_windows)
+    sum_sq = np.empty(n_windows)
+    peaks = np.empty(n_windows)
+    for i in range(n_windows):
+        total = 0.0
+        total_sq = 0.0
+        peak = 0.0
+        base = i * hop
+        for j in range(window):
+            x = np.float64(audio[base + j])
+            total += x
+            total_sq += x * x
+            peak = max(peak, abs(x))
+        sums[i] = total
+        sum_sq[i] = total_sq
+        peaks[i] = peak
+    return sums, sum_sq, peaks
+
+
+@dsp_utils.njit(cache=True)
+def _find_runs(mask, min_len):
+    """
+    Find runs of True in a boolean mask in a single pass.
+
+    Returns:
+        (n_runs, 2) int64 array of [start, end) pairs, keeping only runs of
+        at least min_len entries
+    """
+    runs = np.empty((len(mask), 2), dtype=np.int64)
+    n_runs = 0
+    i = 0
+    while i < len(mask):
+        if mask[i]:
+            j = i
+            while j < len(mask) and mask[j]:
+                j += 1
+            if j - i >= min_len:
+                runs[n_runs, 0] = i
+                runs[n_runs, 1] = j
+                n_runs += 1
+            i = j
+        else:
+            i += 1
+    return runs[:n_runs]
+
 
 class AudioAnalyzer:
     """Precompute and cache audio statistics for quality-aware processing."""
@@ -26,15 +94,28 @@ class AudioAnalyzer:
         sr: int,
         window_size_sec: float = 1.0,
         hop_sec: float = 0.5,
+        n_fft: int = 2048,
+        stft_hop: int = 512,
+        seed: Optional[int] = None,
     ):
         """
         Initialize analyzer with audio and window parameters.
 
         Args:
-            audio: Input audio array (mono)
+            audio: Input audio array (mono). Analyzed as float32: other
+                dtypes are converted once here, which halves memory traffic
+                for float64 input. Window sums still accumulate in float64,
+                and float32 resolves far below the dB and Hz thresholds the
+                stats are gated on.
             sr: Sample rate
             window_size_sec: Analysis window size in seconds
             hop_sec: Hop size in seconds
+            n_fft: STFT frame length for onset and spectral features
+            stft_hop: STFT hop length (samples) for onset and spectral features
+            seed: Seed for a private generator used by sample_from_stable_region.
+                If None, sampling draws from the global np.random stream, so
+                np.random.seed() (as the cloud renderer uses per cloud) still
+                controls it.
 
         Raises:
             ValueError: If parameters are invalid (negative/zero sample rate, etc.)
@@ -49,12 +130,18 @@ class AudioAnalyzer:
         if hop_sec < 0:
             raise ValueError(f"Hop size must be non-negative, got {hop_sec}")
 
-        self.audio = audio
+        if n_fft <= 0 or stft_hop <= 0:
+            raise ValueError(f"STFT size and hop must be positive, got {n_fft}, {stft_hop}")
+
+        self.audio = np.ascontiguousarray(audio, dtype=np.float32)
         self.sr = sr
         self.window_size_sec = window_size_sec
         self.hop_sec = hop_sec
         self.window_size_samples = int(window_size_sec * sr)
         self.hop_samples = int(hop_sec * sr)
+        self.n_fft = int(n_fft)
+        self.stft_hop = int(stft_hop)
+        self._rng = np.random.default_rng(seed) if seed is not None else None
 
         # Ensure window doesn't exceed audio length
         if self.window_size_samples > len(audio):
@@ -68,8 +155,168 @@ class AudioAnalyzer:
         self._spectral_centroid = None
         self._dc_offset = None
         self._crest_factor = None
-        self._stability_mask = None
+        self._stability_mask = {}  # Stable-region masks keyed by thresholds
         self._stft_cache = None  # Shared STFT for onset and spectral analysis
+        self._stft_power_cache = None  # |STFT|**2, shared by spectral features
+        self._centroid_frames = None  # Per-STFT-frame centroid (magnitude-weighted)
+        self._window_stats = None  # Per-window (sum, sum of squares, peak)
+        self._window_starts_cache = None  # Per-window start offsets (samples)
+
+    def __getstate__(self) -> dict:
+        """Pickle without the STFT: it is large and only feeds curves already cached."""
+        state = self.__dict__.copy()
+        state['_stft_cache'] = None
+        state['_stft_power_cache'] = None
+        return state
+
+    @classmethod
+    def from_cache(
+        cls,
+        audio: np.ndarray,
+        sr: int,
+        window_size_sec: float = 1.0,
+        hop_sec: float = 0.5,
+        spectral: bool = False,
+        n_fft: int = 2048,
+        stft_hop: int = 512,
+    ) -> "AudioAnalyzer":
+        """
+        Build an analyzer whose curves come from the on-disk analysis cache.
+
+        Entries live under get_cache_dir("analysis"), keyed by a blake2b
+        digest of the samples plus sr, window, hop and STFT layout, so
+        re-running a batch over the same audio skips the STFT and window
+        reductions. On a miss the curves are computed (see precompute) and
+        stored.
+
+        Args:
+            audio: Input audio array (mono)
+            sr: Sample rate
+            window_size_sec: Analysis window size in seconds
+            hop_sec: Hop size in seconds
+            spectral: Also cache the spectral centroid curve
+            n_fft: STFT frame length for onset and spectral features
+            stft_hop: STFT hop length (samples) for onset and spectral features
+
+        Returns:
+            AudioAnalyzer with its per-window curves filled in
+        """
+        analyzer = cls(
+            audio, sr, window_size_sec=window_size_sec, hop_sec=hop_sec,
+            n_fft=n_fft, stft_hop=stft_hop,
+        )
+        cache_path = analyzer._analysis_cache_path()
+        try:
+            with np.load(cache_path) as cached:
+                for name in cached.files:
+                    setattr(analyzer, f"_{name}", cached[name])
+        except (OSError, ValueError) as e:
+            if cache_path.exists():
+                logger.debug(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+
+        missing = [name for name in _CACHED_CURVES if getattr(analyzer, f"_{name}") is None]
+        if not missing or (missing == ["spectral_centroid"] and not spectral):
+            return analyzer
+
+        analyzer.precompute(spectral=spectral)
+        curves = {
+            name: getattr(analyzer, f"_{name}") for name in _CACHED_CURVES
+            if getattr(analyzer, f"_{name}") is not None
+        }
+        # Write-then-rename so a concurrent reader never sees a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp.npz")
+        try:
+            np.savez_compressed(tmp_path, **curves)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write analysis cache {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+        return analyzer
+
+    def _analysis_cache_path(self) -> Path:
+        """Cache file for this audio and window layout."""
+        audio = np.ascontiguousarray(self.audio)
+        digest = hashlib.blake2b(audio.view(np.uint8), digest_size=16)
+        digest.update(
+            f"{audio.dtype.str}|{self.sr}|{self.window_size_samples}|"
+            f"{self.hop_samples}|{self.n_fft}|{self.stft_hop}|"
+            f"{_ANALYSIS_CACHE_VERSION}".encode("utf-8")
+        )
+        return io_utils.get_cache_dir("analysis") / f"{digest.hexdigest()}.npz"
+
+    def precompute(self, spectral: bool = False) -> "AudioAnalyzer":
+        """
+        Fill the per-window caches up front.
+
+        Useful before handing the analyzer to worker processes, which then
+        reuse the curves instead of each recomputing them.
+
+        Args:
+            spectral: Also compute the spectral centroid curve
+
+        Returns:
+            self, for chaining
+        """
+        self._compute_rms_curve()
+        self._compute_dc_offset()
+        self._compute_crest_factor()
+        self._compute_onset_density()
+        if spectral:
+            self._compute_spectral_centroid()
+        return self
+
+    def _compute_window_stats(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute per-window sum, sum of squares, and absolute peak in one pass.
+
+        With numba, a compiled kernel accumulates each window in registers
+        straight from the input dtype. Otherwise each sample is read once, in
+        blocks of gcd(window, hop) samples, and windows combine their blocks.
+        The RMS, DC offset, and crest factor curves all derive from these.
+
+        Returns:
+            Tuple of (sums, sums_of_squares, peaks), one entry per window
+        """
+        if self._window_stats is not None:
+            return self._window_stats
+
+        if self.window_size_samples <= 0 or len(self.audio) < self.window_size_samples:
+            empty = np.zeros(0)
+            self._window_stats = (empty, empty, empty)
+            return self._window_stats
+
+        n_windows = (len(self.audio) - self.window_size_samples) // self.hop_samples + 1
+        if dsp_utils.NUMBA_AVAILABLE:
+            self._window_stats = _window_stats_kernel(
+                np.ascontiguousarray(self.audio), self.window_size_samples,
+                self.hop_samples, n_windows,
+            )
+            return self._window_stats
+
+        audio = np.asarray(self.audio, dtype=np.float64)
+        # Reduce each block of gcd(window, hop) samples once, then combine
+        # whole blocks per window: overlapping windows share block results
+        # instead of re-reading their samples
+        block = math.gcd(self.window_size_samples, self.hop_samples)
+        span = (n_windows - 1) * self.hop_samples + self.window_size_samples
+        blocks = audio[:span].reshape(-1, block)
+        block_sums = blocks.sum(axis=1)
+        block_sq = np.einsum('ij,ij->i', blocks, blocks)
+        block_peaks = np.maximum(blocks.max(axis=1), -blocks.min(axis=1))
+
+        per_window = self.window_size_samples // block
+        stride = self.hop_samples // block
+
+        def combine(values, reduce):
+            view = np.lib.stride_tricks.sliding_window_view(values, per_window)[::stride]
+            return reduce(view, axis=1)
+
+        sums = combine(block_sums, np.sum)
+        sum_sq = combine(block_sq, np.sum)
+        peaks = combine(block_peaks, np.max)
+
+        self._window_stats = (sums, sum_sq, peaks)
+        return self._window_stats
 
     def _compute_rms_curve(self) -> np.ndarray:
         """
@@ -81,14 +328,13 @@ class AudioAnalyzer:
         if self._rms_curve is not None:
             return self._rms_curve
 
-        rms_values = []
-        for start in range(0, len(self.audio) - self.window_size_samples + 1, self.hop_samples):
-            end = start + self.window_size_samples
-            segment = self.audio[start:end]
-            rms_db = dsp_utils.rms_energy_db(segment)
-            rms_values.append(rms_db)
+        _, sum_sq, _ = self._compute_window_stats()
+        if len(sum_sq) == 0:
+            self._rms_curve = np.array([-80.0])
+            return self._rms_curve
 
-        self._rms_curve = np.array(rms_values) if rms_values else np.array([-80.0])
+        # Mean-square straight to dB: no sqrt pass over the windows
+        self._rms_curve = dsp_utils.ms_to_db(sum_sq / self.window_size_samples)
         return self._rms_curve
 
     def _get_stft(self) -> np.ndarray:
@@ -102,9 +348,54 @@ class AudioAnalyzer:
             Complex STFT matrix (shape: freq_bins x time_frames)
         """
         if self._stft_cache is None:
-            self._stft_cache = librosa.stft(y=self.audio)
+            self._stft_cache = librosa.stft(
+                y=self.audio, n_fft=self.n_fft, hop_length=self.stft_hop
+            )
         return self._stft_cache
 
+    def _get_stft_power(self) -> np.ndarray:
+        """
+        Compute and cache the STFT power spectrogram.
+
+        Squares the real and imaginary parts directly rather than taking
+        np.abs(S)**2, which skips the complex magnitude (and its square
+        root) and one spectrogram-sized temporary.
+
+        Returns:
+            Power spectrogram (shape: freq_bins x time_frames)
+        """
+        if self._stft_power_cache is None:
+            S = self._get_stft()
+            power = np.square(S.real)
+            power += np.square(S.imag)
+            self._stft_power_cache = power
+        return self._stft_power_cache
+
+    def _get_centroid_frames(self) -> np.ndarray:
+        """
+        Compute and cache the spectral centroid of every STFT frame.
+
+        Weighted by magnitude, as librosa.feature.spectral_centroid(y=...)
+        does; frames with no energy get a centroid of 0.
+
+        Returns:
+            Array of centroid frequencies (Hz), one per STFT frame
+        """
+        if self._centroid_frames is None:
+            self._centroid_frames = self._frame_centroids(np.sqrt(self._get_stft_power()))
+        return self._centroid_frames
+
+    def _frame_centroids(self, S: np.ndarray) -> np.ndarray:
+        """
+        Spectral centroid of each column of a spectrogram.
+
+        Same as librosa.feature.spectral_centroid(S=S) but one weighted sum
+        per frame, with no re-normalized copy of S; silent frames get 0.
+        """
+        freqs = librosa.fft_frequencies(sr=self.sr, n_fft=self.n_fft).astype(S.dtype)
+        totals = S.sum(axis=0)
+        return np.divide(freqs @ S, totals, out=np.zeros_like(totals), where=totals > 0)
+
     def _compute_onset_density(self) -> np.ndarray:
         """
         Compute windowed onset density.
@@ -118,10 +409,12 @@ class AudioAnalyzer:
         try:
             # Use cached STFT to avoid redundant computation
             S = self._get_stft()
-            onset_strength = librosa.onset.onset_strength(S=S, sr=self.sr)
+            onset_strength = librosa.onset.onset_strength(
+                S=S, sr=self.sr, n_fft=self.n_fft, hop_length=self.stft_hop
+            )
             self._onset_strength = onset_strength
-            onset_frames = librosa.onset.onset_detect(
-                onset_envelope=onset_strength, sr=self.sr, units='samples'
+            onset_frames = dsp_utils.detect_onsets(
+                onset_strength, self.sr, hop_length=self.stft_hop
             )
             self._onset_frames = onset_frames
             return onset_frames
@@ -142,32 +435,33 @@ class AudioAnalyzer:
             return self._spectral_centroid
 
         try:
-            # Use cached STFT to avoid redundant computation
-            S = self._get_stft()
-            # Get per-STFT-frame centroid values
-            # spectral_centroid needs power spectrogram (magnitude squared)
-            S_power = np.abs(S)**2
-            centroid_frames = librosa.feature.spectral_centroid(S=S_power, sr=self.sr)[0]
+            # Get per-STFT-frame centroid values from the cached power
+            # spectrogram (magnitude squared)
+            centroid_frames = self._frame_centroids(self._get_stft_power())
 
             # Average centroid over each analysis window
-            # (STFT hop is typically 512 samples; analysis hop is ~22050 samples)
-            centroid_values = []
-            stft_hop_length = 512  # librosa default
-            for start in range(0, len(self.audio) - self.window_size_samples + 1, self.hop_samples):
-                end = start + self.window_size_samples
-                # Map analysis window to STFT frame indices
-                start_frame = librosa.samples_to_frames(start, hop_length=stft_hop_length)
-                end_frame = librosa.samples_to_frames(end, hop_length=stft_hop_length)
-                # Average centroid over this window's frames
-                if end_frame > start_frame and end_frame <= len(centroid_frames):
-                    avg_centroid = np.mean(centroid_frames[start_frame:end_frame])
-                elif start_frame < len(centroid_frames):
-                    avg_centroid = np.mean(centroid_frames[start_frame:])
-                else:
-                    avg_centroid = 2000.0  # Fallback for edge case
-                centroid_values.append(avg_centroid)
-
-            self._spectral_centroid = np.array(centroid_values) if centroid_values else np.array([2000.0])
+            # (STFT hop is stft_hop samples; analysis hop is ~22050 samples).
+            # Windows overlap, so each mean is a difference of prefix sums
+            # rather than a per-window slice.
+            stft_hop_length = self.stft_hop
+            n_frames = len(centroid_frames)
+            starts = self._window_starts()
+            if len(starts) == 0:
+                self._spectral_centroid = np.array([2000.0])
+                return self._spectral_centroid
+            start_frames = starts // stft_hop_length
+            end_frames = (starts + self.window_size_samples) // stft_hop_length
+            # Windows running past the last frame (or shorter than one hop)
+            # average from their first frame to the end
+            end_frames = np.where(
+                (end_frames > start_frames) & (end_frames <= n_frames), end_frames, n_frames
+            )
+            in_range = start_frames < n_frames
+            start_frames = np.minimum(start_frames, n_frames)
+            prefix = np.concatenate(([0.0], np.cumsum(centroid_frames, dtype=np.float64)))
+            counts = np.maximum(end_frames - start_frames, 1)
+            means = (prefix[end_frames] - prefix[start_frames]) / counts
+            self._spectral_centroid = np.where(in_range, means, 2000.0)  # Fallback for edge case
             return self._spectral_centroid
         except Exception as e:
             # Fallback for very short audio or other edge cases
@@ -185,14 +479,12 @@ class AudioAnalyzer:
         if self._dc_offset is not None:
             return self._dc_offset
 
-        dc_values = []
-        for start in range(0, len(self.audio) - self.window_size_samples + 1, self.hop_samples):
-            end = start + self.window_size_samples
-            segment = self.audio[start:end]
-            dc = np.abs(np.mean(segment))
-            dc_values.append(dc)
+        sums, _, _ = self._compute_window_stats()
+        if len(sums) == 0:
+            self._dc_offset = np.array([0.0])
+            return self._dc_offset
 
-        self._dc_offset = np.array(dc_values) if dc_values else np.array([0.0])
+        self._dc_offset = np.abs(sums / self.window_size_samples)
         return self._dc_offset
 
     def _compute_crest_factor(self) -> np.ndarray:
@@ -205,23 +497,48 @@ class AudioAnalyzer:
         if self._crest_factor is not None:
             return self._crest_factor
 
-        crest_values = []
-        rms_curve = self._compute_rms_curve()
-        for start in range(0, len(self.audio) - self.window_size_samples + 1, self.hop_samples):
-            end = start + self.window_size_samples
-            segment = self.audio[start:end]
-            peak = np.max(np.abs(segment))
-            rms = dsp_utils.rms_energy(segment)
-            # Use conservative threshold to avoid division by zero / floating point issues
-            if rms > 1e-10:
-                crest = peak / rms
-            else:
-                crest = 0.0
-            crest_values.append(crest)
-
-        self._crest_factor = np.array(crest_values) if crest_values else np.array([1.0])
+        _, sum_sq, peaks = self._compute_window_stats()
+        if len(sum_sq) == 0:
+            self._crest_factor = np.array([1.0])
+            return self._crest_factor
+
+        rms = np.sqrt(sum_sq / self.window_size_samples)
+        # Use conservative threshold to avoid division by zero / floating point issues
+        safe_rms = np.where(rms > 1e-10, rms, 1.0)
+        self._crest_factor = np.where(rms > 1e-10, peaks / safe_rms, 0.0)
         return self._crest_factor
 
+    def _window_starts(self) -> np.ndarray:
+        """
+        Sample offsets of each analysis window (computed once, shared by the
+        onset counts, centroid averaging and window ranking). Read-only.
+        """
+        if self._window_starts_cache is None:
+            starts = np.arange(
+                0, len(self.audio) - self.window_size_samples + 1, self.hop_samples, dtype=np.int64
+            )
+            starts.setflags(write=False)
+            self._window_starts_cache = starts
+        return self._window_starts_cache
+
+    def _window_onset_counts(self, onset_frames: np.ndarray) -> np.ndarray:
+        """
+        Count onsets falling in each analysis window.
+
+        Onsets come back from librosa sorted, so each window's count is the
+        difference of two binary searches rather than a boolean scan.
+
+        Args:
+            onset_frames: Sorted onset positions (samples)
+
+        Returns:
+            Array of onset counts per window
+        """
+        starts = self._window_starts()
+        lo = np.searchsorted(onset_frames, starts, side='left')
+        hi = np.searchsorted(onset_frames, starts + self.window_size_samples, side='left')
+        return hi - lo
+
     def get_stable_regions(
         self,
         max_onset_rate: float = 3.0,
@@ -256,6 +573,7 @@ class AudioAnalyzer:
         Returns:
             Boolean mask (length = number of windows) indicating stable regions
         """
+        # Window layout is fixed per analyzer, so the thresholds alone key the cache
         cache_key = (
             max_onset_rate,
             rms_low_db,
@@ -264,13 +582,10 @@ class AudioAnalyzer:
             max_crest,
             centroid_low_hz,
             centroid_high_hz,
-            self.window_size_sec,
-            self.hop_sec,
         )
-        if isinstance(self._stability_mask, dict) and cache_key in self._stability_mask:
-            return self._stability_mask[cache_key]
-        if self._stability_mask is None:
-            self._stability_mask = {}
+        cached = self._stability_mask.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Get all metrics
         rms = self._compute_rms_curve()
@@ -278,65 +593,51 @@ class AudioAnalyzer:
         dc = self._compute_dc_offset()
         crest = self._compute_crest_factor()
 
-        # Initialize mask (all True)
-        mask = np.ones(len(rms), dtype=bool)
+        onset_counts = self._window_onset_counts(onset_frames)
+        onset_rate = onset_counts / (self.window_size_samples / self.sr)
 
-        # Filter by RMS
+        # Compose the gates as whole-array expressions
         rms_mask = (rms >= rms_low_db) & (rms <= rms_high_db)
-        if verbose:
-            for i, passes in enumerate(rms_mask):
-                if not passes and mask[i]:
-                    logger.debug(f"  [analyzer] Window {i} rejected: RMS {rms[i]:.1f} dB outside [{rms_low_db}, {rms_high_db}]")
-        mask &= rms_mask
-
-        # Filter by DC offset
         dc_mask = dc < max_dc_offset
-        if verbose:
-            for i, passes in enumerate(dc_mask):
-                if not passes and mask[i]:
-                    logger.debug(f"  [analyzer] Window {i} rejected: DC offset {dc[i]:.4f} >= {max_dc_offset}")
-        mask &= dc_mask
-
-        # Filter by crest factor
         crest_mask = crest < max_crest
-        if verbose:
-            for i, passes in enumerate(crest_mask):
-                if not passes and mask[i]:
-                    logger.debug(f"  [analyzer] Window {i} rejected: Crest factor {crest[i]:.2f} >= {max_crest}")
-        mask &= crest_mask
-
-        # Filter by spectral centroid (optional tonal gate)
+        mask = rms_mask & dc_mask & crest_mask
+        centroid = None
         if centroid_low_hz is not None or centroid_high_hz is not None:
             centroid = self._compute_spectral_centroid()
             if centroid_low_hz is not None:
-                centroid_low_mask = centroid >= centroid_low_hz
-                if verbose:
-                    for i, passes in enumerate(centroid_low_mask):
-                        if not passes and mask[i]:
-                            logger.debug(f"  [analyzer] Window {i} rejected: Centroid {centroid[i]:.1f} Hz < {centroid_low_hz}")
-                mask &= centroid_low_mask
+                mask &= centroid >= centroid_low_hz
             if centroid_high_hz is not None:
-                centroid_high_mask = centroid <= centroid_high_hz
-                if verbose:
-                    for i, passes in enumerate(centroid_high_mask):
-                        if not passes and mask[i]:
-                            logger.debug(f"  [analyzer] Window {i} rejected: Centroid {centroid[i]:.1f} Hz > {centroid_high_hz}")
-                mask &= centroid_high_mask
-
-        # Filter by onset density
-        for i, start in enumerate(
-            range(0, len(self.audio) - self.window_size_samples + 1, self.hop_samples)
-        ):
-            end = start + self.window_size_samples
-            onsets_in_window = np.sum((onset_frames >= start) & (onset_frames < end))
-            onset_rate = onsets_in_window / (self.window_size_samples / self.sr)
-            if onset_rate > max_onset_rate:
-                if verbose and mask[i]:
-                    logger.debug(f"  [analyzer] Window {i} rejected: Onset rate {onset_rate:.2f} > {max_onset_rate}")
-                mask[i] = False
+                mask &= centroid <= centroid_high_hz
+        onset_mask = onset_rate <= max_onset_rate
+        mask[:len(onset_mask)] &= onset_mask
+
+        if verbose and logger.isEnabledFor(logging.DEBUG):
+            # Report each window once, for the first gate it fails, in one
+            # batched message per gate
+            gates = [
+                (rms_mask, lambda i: f"RMS {rms[i]:.1f} dB outside [{rms_low_db}, {rms_high_db}]"),
+                (dc_mask, lambda i: f"DC offset {dc[i]:.4f} >= {max_dc_offset}"),
+                (crest_mask, lambda i: f"Crest factor {crest[i]:.2f} >= {max_crest}"),
+            ]
+            if centroid_low_hz is not None:
+                gates.append((centroid >= centroid_low_hz,
+                              lambda i: f"Centroid {centroid[i]:.1f} Hz < {centroid_low_hz}"))
+            if centroid_high_hz is not None:
+                gates.append((centroid <= centroid_high_hz,
+                              lambda i: f"Centroid {centroid[i]:.1f} Hz > {centroid_high_hz}"))
+            gates.append((onset_mask, lambda i: f"Onset rate {onset_rate[i]:.2f} > {max_onset_rate}"))
+
+            pending = np.ones(len(rms), dtype=bool)
+            for passes, describe in gates:
+                rejected = np.flatnonzero(~passes & pending[:len(passes)])
+                if len(rejected):
+                    logger.debug("\n".join(
+                        f"  [analyzer] Window {i} rejected: {describe(i)}" for i in rejected
+                    ))
+                pending[:len(passes)] &= passes
 
         self._stability_mask[cache_key] = mask
-        return self._stability_mask[cache_key]
+        return mask
 
     def get_sorted_windows(
         self,
@@ -367,48 +668,69 @@ class AudioAnalyzer:
         if centroid_low_hz is not None or centroid_high_hz is not None:
             centroid = self._compute_spectral_centroid()
         
-        window_onset_counts = []
-        window_rms_scores = []
-        keep_mask = []
-        
-        for i, start in enumerate(range(0, len(self.audio) - self.window_size_samples + 1, self.hop_samples)):
-            end = start + self.window_size_samples
-
-            keep = True
-            if not (rms_low_db <= rms[i] <= rms_high_db):
-                keep = False
-            if dc[i] >= max_dc_offset:
-                keep = False
-            if crest[i] >= max_crest:
-                keep = False
-            if centroid is not None:
-                if centroid_low_hz is not None and centroid[i] < centroid_low_hz:
-                    keep = False
-                if centroid_high_hz is not None and centroid[i] > centroid_high_hz:
-                    keep = False
-            keep_mask.append(keep)
-            
-            # Onset count
-            count = np.sum((onset_frames >= start) & (onset_frames < end))
-            window_onset_counts.append(count)
-            
-            # RMS score: distance from ideal -24dB (lower distance is better)
-            # We use the already computed window RMS
-            dist = abs(rms[i] - (-24.0))
-            window_rms_scores.append(dist)
-            
-        keep_mask = np.array(keep_mask, dtype=bool)
+        n_windows = len(self._window_starts())
+        rms = rms[:n_windows]
+        keep_mask = (rms >= rms_low_db) & (rms <= rms_high_db)
+        keep_mask &= dc[:n_windows] < max_dc_offset
+        keep_mask &= crest[:n_windows] < max_crest
+        if centroid is not None:
+            if centroid_low_hz is not None:
+                keep_mask &= centroid[:n_windows] >= centroid_low_hz
+            if centroid_high_hz is not None:
+                keep_mask &= centroid[:n_windows] <= centroid_high_hz
         if not np.any(keep_mask):
             keep_mask = np.ones_like(keep_mask, dtype=bool)
 
-        window_onset_counts = np.array(window_onset_counts)
-        window_rms_scores = np.array(window_rms_scores)
+        window_onset_counts = self._window_onset_counts(onset_frames)
+        # RMS score: distance from ideal -24dB (lower distance is better)
+        window_rms_scores = np.abs(rms + 24.0)
 
         # Lexical sort: primary=onsets (ascending), secondary=rms_dist (ascending)
         # np.lexsort sorts by last key first, so we pass (rms, onsets)
         sorted_indices = np.lexsort((window_rms_scores, window_onset_counts))
         return sorted_indices[keep_mask[sorted_indices]]
 
+    def get_quiet_windows(
+        self,
+        rms_low_db: float = -80.0,
+        rms_high_db: float = -45.0,
+        max_crest: float = 5.0,
+        min_variance: float = 1e-9,
+    ) -> np.ndarray:
+        """
+        Return indices of quiet, flat windows (room tone, hum, noise beds).
+
+        Uses the same gates as the silence miner: RMS within bounds, crest
+        factor at most ``max_crest`` (not a quiet transient) and variance of at
+        least ``min_variance`` (not digital silence). Everything derives from
+        the cached window stats, so no further pass over the audio is made.
+
+        Args:
+            rms_low_db: Min RMS (dB) to accept
+            rms_high_db: Max RMS (dB) to accept
+            max_crest: Max crest factor
+            min_variance: Min per-window variance
+
+        Returns:
+            Array of window indices, in time order
+        """
+        sums, sum_sq, peaks = self._compute_window_stats()
+        if len(sum_sq) == 0:
+            return np.zeros(0, dtype=np.intp)
+
+        n = self.window_size_samples
+        # Gate on mean-square against squared thresholds: no sqrt or log10
+        # per window (crest <= c is peak**2 <= c**2 * ms)
+        ms = sum_sq / n
+        variance = ms - (sums / n) ** 2
+        mask = (
+            (ms >= dsp_utils.db_to_linear(rms_low_db) ** 2)
+            & (ms <= dsp_utils.db_to_linear(rms_high_db) ** 2)
+            & ((ms <= 1e-20) | (peaks ** 2 <= max_crest ** 2 * ms))
+            & (variance >= min_variance)
+        )
+        return np.flatnonzero(mask)
+
     def get_sample_range_for_window(self, window_idx: int) -> Tuple[int, int]:
         """
         Get sample range corresponding to a window index.
@@ -449,27 +771,19 @@ class AudioAnalyzer:
 
         duration_samples = int(duration_sec * self.sr)
 
-        # Find consecutive runs of stable windows
-        # Pad with False at edges to detect run boundaries
-        padded = np.concatenate([[False], stable_mask, [False]])
-        diff = np.diff(padded.astype(int))
-        run_starts = np.where(diff == 1)[0]
-        run_ends = np.where(diff == -1)[0]
-
-        # Filter runs by minimum length
-        consecutive_runs = []
-        for start_idx, end_idx in zip(run_starts, run_ends):
-            run_length = end_idx - start_idx
-            if run_length >= min_stable_windows:
-                consecutive_runs.append((start_idx, end_idx))
-
-        if not consecutive_runs:
+        # Consecutive runs of stable windows, at least min_stable_windows long
+        consecutive_runs = _find_runs(np.asarray(stable_mask, dtype=np.bool_), min_stable_windows)
+
+        if len(consecutive_runs) == 0:
             return None
 
         # Pick a random run and choose a window from it
-        chosen_run = consecutive_runs[np.random.randint(len(consecutive_runs))]
-        start_window_idx, end_window_idx = chosen_run
-        window_idx = np.random.randint(start_window_idx, end_window_idx)
+        if self._rng is not None:
+            start_window_idx, end_window_idx = consecutive_runs[self._rng.integers(len(consecutive_runs))]
+            window_idx = self._rng.integers(start_window_idx, end_window_idx)
+        else:
+            start_window_idx, end_window_idx = consecutive_runs[np.random.randint(len(consecutive_runs))]
+            window_idx = np.random.randint(start_window_idx, end_window_idx)
         start, _ = self.get_sample_range_for_window(window_idx)
 
         # Extend to requested duration
@@ -493,25 +807,92 @@ class AudioAnalyzer:
         segment = self.audio[start_sample:end_sample]
 
         # Compute spectral centroid, with guard for very short segments
-        if len(segment) >= 512:
-            if librosa is not None:
-                centroid_hz = np.mean(librosa.feature.spectral_centroid(y=segment, sr=self.sr))
-            else:
-                # Fallback FFT-based centroid if librosa unavailable
-                fft = np.fft.rfft(segment)
-                freqs = np.fft.rfftfreq(len(segment), 1 / self.sr)
-                magnitudes = np.abs(fft)
-                if np.sum(magnitudes) > 0:
-                    centroid_hz = np.sum(freqs * magnitudes) / np.sum(magnitudes)
-                else:
-                    centroid_hz = 2000.0
+        if len(segment) >= self.stft_hop:
+            # Average the cached per-frame centroid over the frames this
+            # segment spans, rather than running a fresh STFT per query
+            centroid_frames = self._get_centroid_frames()
+            hop_length = self.stft_hop
+            first = start_sample // hop_length
+            last = max(end_sample // hop_length, first + 1)
+            frames = centroid_frames[first:last]
+            centroid_hz = float(np.mean(frames)) if len(frames) > 0 else 2000.0
         else:
             # For very short segments, use default
             centroid_hz = 2000.0  # Neutral midrange default
 
+        peak, mean_square = dsp_utils.peak_and_mean_square(segment)
         return {
-            'rms_db': dsp_utils.rms_energy_db(segment),
+            'rms_db': dsp_utils.ms_to_db(mean_square),
             'dc_offset': np.abs(np.mean(segment)),
-            'crest_factor': np.max(np.abs(segment)) / (dsp_utils.rms_energy(segment) + 1e-6),
+            'crest_factor': peak / (math.sqrt(mean_square) + 1e-6),
             'centroid_hz': centroid_hz,
         }
+
+
+def _analyze_one(
+    filepath: str,
+    sr: int,
+    window_size_sec: float,
+    hop_sec: float,
+    spectral: bool,
+    use_cache: bool,
+) -> Optional[Dict[str, np.ndarray]]:
+    """Load and analyze one file (top-level so it can run in a worker process)."""
+    audio, _ = io_utils.load_audio(filepath, sr=sr, mono=True)
+    if audio is None:
+        return None
+    if use_cache:
+        analyzer = AudioAnalyzer.from_cache(
+            audio, sr, window_size_sec=window_size_sec, hop_sec=hop_sec, spectral=spectral
+        )
+    else:
+        analyzer = AudioAnalyzer(
+            audio, sr, window_size_sec=window_size_sec, hop_sec=hop_sec
+        ).precompute(spectral=spectral)
+    return {
+        name: getattr(analyzer, f"_{name}") for name in _CACHED_CURVES
+        if getattr(analyzer, f"_{name}") is not None
+    }
+
+
+def analyze_files(
+    paths: List[str],
+    sr: int = 44100,
+    window_size_sec: float = 1.0,
+    hop_sec: float = 0.5,
+    spectral: bool = False,
+    workers: int = None,
+    use_cache: bool = False,
+) -> Dict[str, Optional[Dict[str, np.ndarray]]]:
+    """
+    Analyze many files, one worker process per file at a time.
+
+    Files are independent, so each worker loads and analyzes whole files
+    and only the small per-window curves come back.
+
+    Args:
+        paths: Audio files to analyze
+        sr: Sample rate to load at
+        window_size_sec: Analysis window size in seconds
+        hop_sec: Hop size in seconds
+        spectral: Also compute the spectral centroid curve
+        workers: Worker processes (default: CPU count; 1 = serial)
+        use_cache: Read/write the on-disk analysis cache (see from_cache)
+
+    Returns:
+        Dict mapping each path to its curves (keys: rms_curve, dc_offset,
+        crest_factor, onset_frames and, if spectral, spectral_centroid),
+        or None if the file could not be loaded
+    """
+    analyze = partial(
+        _analyze_one, sr=sr, window_size_sec=window_size_sec, hop_sec=hop_sec,
+        spectral=spectral, use_cache=use_cache,
+    )
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    if workers == 1:
+        return {path: analyze(path) for path in paths}
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+    ) as executor:
+        return dict(zip(paths, executor.map(analyze, paths, chunksize=4)))
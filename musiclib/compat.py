@@ -3,16 +3,46 @@ Compatibility helpers for migrating from print() to logging.
 
 Provides drop-in replacement functions that preserve existing behavior
 while enabling structured logging. Use these during gradual migration.
+
+Each print_* helper returns immediately when its level is disabled. The
+message has already been formatted by then, so in hot loops build expensive
+messages only under _compat_logger.isEnabledFor(level), as with any logger.
 """
 
+import logging
 import sys
 from typing import Optional
-from musiclib.logger import get_logger, log_success
+from musiclib.logger import SUCCESS, get_logger, log_success
 
 
 # Global logger for compatibility functions
 _compat_logger = get_logger("afterglow.compat")
 
+# Legacy message prefixes and the level each one implies. Lookups slice the
+# message at each known prefix length and hit these tables directly, instead
+# of trying startswith() once per prefix.
+_PREFIX_LEVELS = {
+    "[*]": "INFO",
+    "[!]": "WARNING",
+    "[✓]": "SUCCESS",
+    "[✗✗]": "CRITICAL",
+    "[✗]": "ERROR",
+    "[·]": "DEBUG",
+}
+_STRIPPED_PREFIXES = frozenset(_PREFIX_LEVELS) | {"[config]"}
+_PREFIX_LENGTHS = sorted({len(prefix) for prefix in _STRIPPED_PREFIXES})
+
+
+def _match_prefix(message: str, prefixes) -> Optional[str]:
+    """Return the known prefix that message starts with, if any."""
+    if not message.startswith("["):
+        return None
+    for length in _PREFIX_LENGTHS:
+        head = message[:length]
+        if head in prefixes:
+            return head
+    return None
+
 
 def print_info(message: str, file=sys.stdout) -> None:
     """
@@ -32,6 +62,8 @@ def print_info(message: str, file=sys.stdout) -> None:
         from musiclib.compat import print_info
         print_info(f"Processing {filename}")
     """
+    if not _compat_logger.isEnabledFor(logging.INFO):
+        return
     _compat_logger.info(message)
 
 
@@ -53,6 +85,8 @@ def print_warning(message: str, file=sys.stderr) -> None:
         from musiclib.compat import print_warning
         print_warning(f"Warning: {issue}")
     """
+    if not _compat_logger.isEnabledFor(logging.WARNING):
+        return
     _compat_logger.warning(message)
 
 
@@ -74,6 +108,8 @@ def print_success(message: str, file=sys.stdout) -> None:
         from musiclib.compat import print_success
         print_success(f"Saved {count} textures")
     """
+    if not _compat_logger.isEnabledFor(SUCCESS):
+        return
     log_success(_compat_logger, message)
 
 
@@ -95,6 +131,8 @@ def print_error(message: str, file=sys.stderr) -> None:
         from musiclib.compat import print_error
         print_error(f"Error: {error}")
     """
+    if not _compat_logger.isEnabledFor(logging.ERROR):
+        return
     _compat_logger.error(message)
 
 
@@ -119,11 +157,10 @@ def migrate_prefix(message: str) -> str:
         >>> migrate_prefix("No prefix here")
         "No prefix here"
     """
-    prefixes = ["[*]", "[!]", "[✓]", "[✗]", "[✗✗]", "[·]", "[config]"]
-    for prefix in prefixes:
-        if message.startswith(prefix):
-            # Remove prefix and any following whitespace
-            return message[len(prefix):].lstrip()
+    prefix = _match_prefix(message, _STRIPPED_PREFIXES)
+    if prefix is not None:
+        # Remove prefix and any following whitespace
+        return message[len(prefix):].lstrip()
     return message
 
 
@@ -147,16 +184,6 @@ def detect_log_level(message: str) -> str:
         >>> detect_log_level("[✓] Success")
         "SUCCESS"
     """
-    if message.startswith("[!]"):
-        return "WARNING"
-    elif message.startswith("[✓]"):
-        return "SUCCESS"
-    elif message.startswith("[✗✗]"):
-        return "CRITICAL"
-    elif message.startswith("[✗]"):
-        return "ERROR"
-    elif message.startswith("[·]"):
-        return "DEBUG"
-    else:
-        # Default to INFO for [*] or no prefix
-        return "INFO"
+    prefix = _match_prefix(message, _PREFIX_LEVELS)
+    # Default to INFO for [*] or no prefix
+    return _PREFIX_LEVELS[prefix] if prefix is not None else "INFO"
@@ -2,7 +2,10 @@
 Drone/pad/swell maker: generate pad loops and swells with processing variants.
 """
 
-from typing import List, Tuple
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Tuple, Union
 import numpy as np
 import librosa
 from tqdm import tqdm
@@ -12,6 +15,43 @@ from .exceptions import SilentArtifact
 
 logger = get_logger(__name__)
 
+# Phase-vocoder frame length for pitch shifts and time stretches
+VOCODER_FRAME_SEC = 0.040
+
+# Largest time-stretch factor applied; larger requests are capped
+MAX_STRETCH = 4.0
+
+# Minimum middle-of-file context loaded for key/BPM detection
+SOURCE_ANALYSIS_SEC = 30.0
+
+
+def vocoder_n_fft(sr: int, frame_sec: float = VOCODER_FRAME_SEC) -> int:
+    """
+    Largest power-of-two FFT size that fits in ``frame_sec`` at ``sr``.
+
+    About 40 ms (1024 samples at 44.1/48 kHz, half librosa's 2048 default)
+    halves the transform cost per frame and smears transients less, while
+    still resolving pad material.
+    """
+    return 1 << max(int(np.log2(frame_sec * sr)), 8)
+
+
+def _phase_vocode(
+    stft: np.ndarray,
+    rate: float,
+    length: int,
+    stft_kwargs: dict,
+    dtype,
+) -> np.ndarray:
+    """
+    Time-stretch a precomputed STFT by ``rate`` and invert it.
+
+    Same as librosa.effects.time_stretch on the signal the STFT came from,
+    minus the forward transform, so several rates can share one STFT.
+    """
+    stretched = librosa.phase_vocoder(stft, rate=rate, **stft_kwargs)
+    return librosa.istft(stretched, dtype=dtype, length=int(round(length / rate)), **stft_kwargs)
+
 
 def process_pad_source(
     audio: np.ndarray,
@@ -19,13 +59,24 @@ def process_pad_source(
     pitch_shifts: List[int],
     time_stretches: List[float],
     musical_context: dict = None,
+    n_fft: int = None,
 ) -> List[Tuple[np.ndarray, str]]:
     """
     Apply pitch shifts and time stretches to audio.
 
     If musical_context has 'transposition_semitones', it is applied relative to the base.
+    The phase vocoder uses ``n_fft`` (default: vocoder_n_fft(sr)) with a
+    quarter-frame hop. All pitch shifts and time stretches start from the
+    same base audio, so its STFT is computed once and shared.
+
+    Audio is processed as float32 from here on (loops, swells, filters and
+    reversals keep that dtype); it is quantized only when saved.
     """
     results = []
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    if n_fft is None:
+        n_fft = vocoder_n_fft(sr)
+    stft_kwargs = {"n_fft": n_fft, "hop_length": n_fft // 4}
 
     # Base transposition (global fix)
     base_shift = 0
@@ -35,7 +86,7 @@ def process_pad_source(
     # Original (with optional fix)
     if base_shift != 0 and librosa is not None:
         try:
-            audio_base = librosa.effects.pitch_shift(audio, sr=sr, n_steps=base_shift)
+            audio_base = librosa.effects.pitch_shift(audio, sr=sr, n_steps=base_shift, **stft_kwargs)
             results.append((audio_base, "original_tuned"))
         except Exception as e:
             logger.debug(f"Pitch shift failed (base_shift={base_shift}), using original: {e}")
@@ -45,37 +96,45 @@ def process_pad_source(
         audio_base = audio
         results.append((audio, "original"))
 
-    # Pitch shifts (relative to base)
-    for shift in pitch_shifts:
-        if shift != 0:
-            if librosa is None:
-                continue
-            try:
-                # Apply shift to the potentially already-transposed base
-                shifted = librosa.effects.pitch_shift(audio_base, sr=sr, n_steps=shift)
-                results.append((shifted, f"pitch_{shift:+d}"))
-            except Exception as e:
-                logger.debug(f"Pitch shift failed (shift={shift:+d}), skipping: {e}")
-                continue
+    # The original is always emitted above; only real changes remain
+    shifts = [shift for shift in pitch_shifts if shift != 0]
+    stretches = [factor for factor in valid_stretch_factors(time_stretches) if factor != 1.0]
+    if librosa is None or not (shifts or stretches):
+        return results
 
-    # Time stretches
-    for factor in time_stretches:
-        if factor != 1.0:
-            # Guard against invalid or extreme stretch factors
-            if factor <= 0:
-                continue
-            if factor > 4.0:
-                factor = 4.0
+    base_stft = None
 
-            if librosa is None:
-                continue
+    def get_base_stft():
+        nonlocal base_stft
+        if base_stft is None:
+            base_stft = librosa.stft(audio_base, **stft_kwargs)
+        return base_stft
 
-            try:
-                stretched = librosa.effects.time_stretch(audio_base, rate=factor)
-                results.append((stretched, f"stretch_{factor:.1f}x"))
-            except Exception as e:
-                logger.debug(f"Time stretch failed (factor={factor:.1f}x), skipping: {e}")
-                continue
+    # Pitch shifts (relative to base)
+    for shift in shifts:
+        try:
+            # Apply shift to the potentially already-transposed base:
+            # stretch by the pitch ratio, then resample back to length
+            # (as librosa.effects.pitch_shift does)
+            rate = 2.0 ** (-float(shift) / 12)
+            stretched = _phase_vocode(
+                get_base_stft(), rate, len(audio_base), stft_kwargs, audio_base.dtype
+            )
+            shifted = librosa.resample(stretched, orig_sr=float(sr) / rate, target_sr=sr)
+            shifted = librosa.util.fix_length(shifted, size=len(audio_base))
+            results.append((shifted, f"pitch_{shift:+d}"))
+        except Exception as e:
+            logger.debug(f"Pitch shift failed (shift={shift:+d}), skipping: {e}")
+
+    # Time stretches
+    for factor in stretches:
+        try:
+            stretched = _phase_vocode(
+                get_base_stft(), factor, len(audio_base), stft_kwargs, audio_base.dtype
+            )
+            results.append((stretched, f"stretch_{factor:.1f}x"))
+        except Exception as e:
+            logger.debug(f"Time stretch failed (factor={factor:.1f}x), skipping: {e}")
 
     return results
 
@@ -122,56 +181,59 @@ def create_tonal_variant(
         config: Configuration dictionary
 
     Returns:
-        Processed audio
+        Processed audio (a new array when filtered; ``audio`` itself for an
+        unknown variant or audio too short to filter)
     """
     drone_config = config['drones']
-    audio_out = audio.copy()
 
     if variant_type == "warm":
         # Low-pass filter for warmth
         cutoff = drone_config['warm_lowpass_hz']
-        b, a = dsp_utils.design_butterworth_lowpass(cutoff, sr, order=4)
-        audio_out = dsp_utils.apply_filter(audio_out, b, a)
+        sos = dsp_utils.design_butterworth_lowpass(cutoff, sr, order=4, output='sos')
+        return dsp_utils.apply_filter(audio, sos)
 
     elif variant_type == "airy":
         # High-pass filter for air/brightness
         cutoff = drone_config['airy_highpass_hz']
-        b, a = dsp_utils.design_butterworth_highpass(cutoff, sr, order=4)
-        audio_out = dsp_utils.apply_filter(audio_out, b, a)
+        sos = dsp_utils.design_butterworth_highpass(cutoff, sr, order=4, output='sos')
+        return dsp_utils.apply_filter(audio, sos)
 
     elif variant_type == "dark":
         # Aggressive high-cut for darkness
         cutoff = drone_config['dark_high_cut_hz']
-        b, a = dsp_utils.design_butterworth_lowpass(cutoff, sr, order=5)
-        audio_out = dsp_utils.apply_filter(audio_out, b, a)
+        sos = dsp_utils.design_butterworth_lowpass(cutoff, sr, order=5, output='sos')
+        return dsp_utils.apply_filter(audio, sos)
 
-    return audio_out
+    # Outputs are only read after this, so the unfiltered pad can be shared
+    return audio
 
 
-def make_pad_loops(
+def _prepare_loop(
     audio: np.ndarray,
     sr: int,
-    stem_name: str,
     config: dict,
-) -> List[Tuple[np.ndarray, str]]:
+) -> np.ndarray:
     """
-    Create multiple tonal variants of a pad loop.
+    Extract, crossfade, and normalize the pad loop for one variant.
+
+    Shared by the pad loops and the reversed variant, so the loop is built
+    once per variant.
 
     Args:
         audio: Input audio
         sr: Sample rate
-        stem_name: Source name for filename
         config: Configuration dictionary
 
     Returns:
-        List of (audio, filename) tuples
+        Loopable pad normalized to the target peak
+
+    Raises:
+        SilentArtifact: If the loop is silent
     """
-    drone_config = config['drones']
     pm_config = config['pad_miner']
 
     # Extract pad loop of target duration
-    duration = drone_config['pad_loop_duration_sec']
-    pad = extract_pad_loop(audio, sr, duration)
+    pad = extract_pad_loop(audio, sr, config['drones']['pad_loop_duration_sec'])
 
     # Make loopable
     crossfade_ms = pm_config.get(
@@ -180,20 +242,37 @@ def make_pad_loops(
     )
     pad = dsp_utils.time_domain_crossfade_loop(pad, crossfade_ms, sr)
 
-    # Normalize (skip if audio is silent/invalid)
-    peak_dbfs = config['global']['target_peak_dbfs']
-    try:
-        pad = dsp_utils.normalize_audio(pad, peak_dbfs)
-    except SilentArtifact as e:
-        logger.warning(f"Skipping pad loop for {stem_name}: {e}")
-        return []
+    return dsp_utils.normalize_audio(
+        pad, config['global']['target_peak_dbfs'], copy=False
+    )
+
+
+def make_pad_loops(
+    pad: np.ndarray,
+    sr: int,
+    stem_name: str,
+    config: dict,
+) -> List[Tuple[np.ndarray, str, str]]:
+    """
+    Create multiple tonal variants of a pad loop.
+
+    Args:
+        pad: Loopable, normalized pad (see _prepare_loop)
+        sr: Sample rate
+        stem_name: Source name for filename
+        config: Configuration dictionary
+
+    Returns:
+        List of (audio, filename, kind) tuples
+    """
+    drone_config = config['drones']
 
     # Create variants
     results = []
     for variant in drone_config['pad_variants']:
         variant_audio = create_tonal_variant(pad, sr, variant, config)
         filename = f"{stem_name}_loop_{variant}.wav"
-        results.append((variant_audio, filename))
+        results.append((variant_audio, filename, "pad"))
 
     return results
 
@@ -204,7 +283,7 @@ def make_swells(
     stem_name: str,
     config: dict,
     swell_index: int = 1,
-) -> List[Tuple[np.ndarray, str]]:
+) -> List[Tuple[np.ndarray, str, str]]:
     """
     Create swell one-shots from audio.
 
@@ -216,7 +295,7 @@ def make_swells(
         swell_index: Index for naming (1, 2, etc.)
 
     Returns:
-        List of (audio, filename) tuples
+        List of (audio, filename, kind) tuples
     """
     drone_config = config['drones']
     peak_dbfs = config['global']['target_peak_dbfs']
@@ -245,76 +324,170 @@ def make_swells(
     if fade_in_samples + fade_out_samples > len(swell):
         fade_out_samples = max(0, len(swell) - fade_in_samples)
 
-    swell = dsp_utils.apply_fade_in(swell, fade_in_samples)
-    swell = dsp_utils.apply_fade_out(swell, fade_out_samples)
-
-    # Normalize (skip if audio is silent/invalid)
-    try:
-        swell = dsp_utils.normalize_audio(swell, peak_dbfs)
-    except SilentArtifact as e:
-        logger.warning(f"Skipping swell for {stem_name}: {e}")
+    # Fade and normalize in one pass over a single copy (skip if silent)
+    swell = np.array(swell, dtype=np.float32)
+    peak = dsp_utils.fade_normalize_inplace(
+        swell,
+        dsp_utils.fade_ramp(fade_in_samples, rising=True),
+        dsp_utils.fade_ramp(fade_out_samples, rising=False),
+        dsp_utils.db_to_linear(peak_dbfs),
+    )
+    if not np.isfinite(peak):
+        logger.warning(f"Skipping swell for {stem_name}: audio contains NaN or Inf values")
+        return []
+    if peak < 1e-8:
+        logger.warning(f"Skipping swell for {stem_name}: silent after fades (peak={peak:.2e})")
         return []
 
     filename = f"{stem_name}_swell{swell_index:02d}.wav"
-    return [(swell, filename)]
+    return [(swell, filename, "swell")]
 
 
 def make_reversed_variants(
-    audio: np.ndarray,
+    pad: np.ndarray,
     sr: int,
     stem_name: str,
     config: dict,
-) -> List[Tuple[np.ndarray, str]]:
+) -> List[Tuple[np.ndarray, str, str]]:
     """
-    Create reversed variants of audio (optional).
+    Create reversed variants of a pad loop (optional).
 
     Args:
-        audio: Input audio
+        pad: Loopable, normalized pad (see _prepare_loop)
         sr: Sample rate
         stem_name: Source name
         config: Configuration dictionary
 
     Returns:
-        List of (audio, filename) tuples
+        List of (audio, filename, kind) tuples
     """
     if not config['drones']['enable_reversal']:
         return []
 
+    # Reversal keeps the peak, so the normalized loop needs no second pass.
+    # A negative-stride view is enough: nothing downstream writes to it, and
+    # save_audio quantizes into a fresh array anyway.
+    reversed_audio = pad[::-1]
+
+    filename = f"{stem_name}_reversed.wav"
+    return [(reversed_audio, filename, "pad")]
+
+
+def valid_stretch_factors(time_stretches: List[float]) -> List[float]:
+    """Drop non-positive stretch factors and cap the rest at MAX_STRETCH."""
+    return [min(factor, MAX_STRETCH) for factor in time_stretches if factor > 0]
+
+
+def source_window_sec(config: dict) -> float:
+    """
+    Seconds of each pad source the drone maker actually uses.
+
+    Loops and swells come from the middle of every variant, and a time
+    stretch by ``f`` draws on ``f`` times as much input, so only the middle
+    max(loop, swell) * max(f) seconds matter. Key/BPM detection gets at
+    least SOURCE_ANALYSIS_SEC of context.
+    """
     drone_config = config['drones']
-    pm_config = config['pad_miner']
+    longest_output = max(drone_config['pad_loop_duration_sec'], drone_config['swell_duration_sec'])
+    max_stretch = max([1.0] + valid_stretch_factors(drone_config['time_stretch_factors']))
+    return max(longest_output * max_stretch, SOURCE_ANALYSIS_SEC)
 
-    # Reuse loop extraction so reversed clips stay short and consistent
-    loop_audio = extract_pad_loop(audio, sr, drone_config['pad_loop_duration_sec'])
 
-    crossfade_ms = pm_config.get(
-        "loop_crossfade_ms",
-        pm_config.get("crossfade_ms", 100),
-    )
-    loop_audio = dsp_utils.time_domain_crossfade_loop(loop_audio, crossfade_ms, sr)
+def _process_one_source(filepath: str, config: dict, audio: np.ndarray = None) -> dict:
+    """
+    Analyze one pad source and build all of its drone outputs.
 
-    reversed_audio = np.flip(loop_audio)
-    # Normalize (skip if audio is silent/invalid)
-    try:
-        reversed_audio = dsp_utils.normalize_audio(
-            reversed_audio, config['global']['target_peak_dbfs']
+    Top-level so worker processes can run it; loads the middle
+    source_window_sec(config) of the file itself when ``audio`` is not
+    supplied.
+
+    Args:
+        filepath: Path to the source file
+        config: Configuration dictionary
+        audio: Already-loaded mono audio (optional)
+
+    Returns:
+        {"outputs": [(audio, filename, kind), ...], "context": {...}}, or None if
+        the file could not be loaded
+    """
+    sr = config['global']['sample_rate']
+    if audio is None:
+        audio, _ = io_utils.load_audio_window(filepath, sr=sr, duration_sec=source_window_sec(config))
+        if audio is None:
+            return None
+
+    stem = io_utils.get_filename_stem(filepath)
+    target_key = config.get("musicality", {}).get("target_key")
+
+    # Musical Analysis
+    detected_key = music_theory.detect_key(audio, sr)
+    bpm, conf = music_theory.detect_bpm(audio, sr)
+
+    musical_context = {
+        "key": detected_key,
+        "bpm": bpm if conf > 0.4 else None
+    }
+
+    if target_key and detected_key:
+        musical_context["transposition_semitones"] = music_theory.get_transposition_interval(
+            detected_key, target_key
         )
-    except SilentArtifact as e:
-        logger.warning(f"Skipping reversed variant for {stem_name}: {e}")
-        return []
 
-    filename = f"{stem_name}_reversed.wav"
-    return [(reversed_audio, filename)]
+    # Get all pitch/stretch variants
+    drone_config = config['drones']
+    variants = process_pad_source(
+        audio,
+        sr=sr,
+        pitch_shifts=drone_config['pitch_shift_semitones'],
+        time_stretches=drone_config['time_stretch_factors'],
+        musical_context=musical_context
+    )
 
+    outputs = []
+    for variant_audio, variant_desc in variants:
+        variant_name = f"{stem}_{variant_desc}"
 
-def process_pad_sources(config: dict) -> dict:
+        # Loopable pad shared by the pad loops and the reversed variant
+        # (skip if audio is silent/invalid)
+        try:
+            pad = _prepare_loop(variant_audio, sr, config)
+        except SilentArtifact as e:
+            logger.warning(f"Skipping pad loop for {variant_name}: {e}")
+            pad = None
+
+        # Create pad loops
+        if pad is not None:
+            outputs.extend(make_pad_loops(pad, sr, variant_name, config))
+
+        # Create swells
+        swells = make_swells(variant_audio, sr, variant_name, config, swell_index=1)
+        outputs.extend(swells)
+
+        # Create reversed variants
+        if pad is not None:
+            outputs.extend(make_reversed_variants(pad, sr, variant_name, config))
+
+    return {
+        "outputs": outputs,
+        "context": musical_context
+    }
+
+
+def iter_pad_sources(config: dict) -> Iterator[Tuple[str, dict]]:
     """
-    Process all audio files in pad_sources directory.
+    Process pad_sources files one at a time, yielding each file's outputs.
+
+    Consumers such as save_drone_outputs can write and drop every source's
+    audio before the next one is produced, so peak memory holds one source's
+    outputs rather than the whole run's. With ``drones.workers`` > 1 files
+    are processed in worker processes, at most two per worker in flight;
+    progress is still reported from the parent.
 
     Args:
         config: Configuration dictionary
 
-    Returns:
-        Dictionary {source_name: [(audio, filename), ...]}
+    Yields:
+        (source_name, {"outputs": [(audio, filename, kind), ...], "context": {...}})
     """
     sr = config['global']['sample_rate']
     pad_sources_dir = config['paths']['pad_sources_dir']
@@ -325,84 +498,103 @@ def process_pad_sources(config: dict) -> dict:
 
     if not files:
         logger.info(f"No pad source files found in {pad_sources_dir}")
-        return {}
+        return
 
     logger.info(f"\n[DRONE MAKER] Processing {len(files)} pad source file(s)...")
 
-    results = {}
-    for filepath in tqdm(files, desc="Processing drones", unit="file"):
-        stem = io_utils.get_filename_stem(filepath)
-        tqdm.write(f"  Processing: {stem}")
+    workers = config['drones'].get('workers', 1) or 1
+    if workers > 1 and len(files) > 1:
+        # Each worker loads its own file. The manifest stays in the parent,
+        # so don't ship it to workers.
+        worker_config = {k: v for k, v in config.items() if k != '_manifest'}
+        workers = min(workers, len(files))
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
 
-        audio, _ = io_utils.load_audio(filepath, sr=sr, mono=True)
-        if audio is None:
-            continue
-
-        # Musical Analysis
-        detected_key = music_theory.detect_key(audio, sr)
-        bpm, conf = music_theory.detect_bpm(audio, sr)
-
-        musical_context = {
-            "key": detected_key,
-            "bpm": bpm if conf > 0.4 else None
-        }
-
-        transposition = 0
-        if target_key and detected_key:
-            transposition = music_theory.get_transposition_interval(detected_key, target_key)
-            musical_context["transposition_semitones"] = transposition
-            tqdm.write(f"    > Detected Key: {detected_key} -> Target: {target_key} (Shift: {transposition:+d})")
-        elif detected_key:
-            tqdm.write(f"    > Detected Key: {detected_key}")
-
-        if musical_context["bpm"]:
-            tqdm.write(f"    > Detected BPM: {musical_context['bpm']:.1f}")
-
-        # Get all pitch/stretch variants
-        drone_config = config['drones']
-        variants = process_pad_source(
-            audio,
-            sr=sr,
-            pitch_shifts=drone_config['pitch_shift_semitones'],
-            time_stretches=drone_config['time_stretch_factors'],
-            musical_context=musical_context
+        def pooled():
+            # Bounded submission: finished sources wait for the consumer
+            # instead of piling up behind it
+            pending = deque()
+            for filepath in files:
+                pending.append(executor.submit(_process_one_source, filepath, worker_config))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+        processed = pooled()
+    else:
+        executor = None
+        loaded = io_utils.iter_audio_files_async(
+            files, sr=sr, mono=True, window_sec=source_window_sec(config)
+        )
+        processed = (
+            _process_one_source(filepath, config, audio) if audio is not None else None
+            for filepath, audio in loaded
         )
 
-        outputs = []
-        for variant_audio, variant_desc in variants:
-            variant_name = f"{stem}_{variant_desc}"
+    try:
+        for filepath, result in tqdm(zip(files, processed), total=len(files), desc="Processing drones", unit="file"):
+            stem = io_utils.get_filename_stem(filepath)
+            # Results arrive once a source is finished (and, with workers,
+            # possibly several submissions later), so report completion
+            if result is None:
+                tqdm.write(f"  Skipped: {stem} (could not load)")
+                continue
+            tqdm.write(f"  Processed: {stem}")
 
-            # Create pad loops
-            loops = make_pad_loops(variant_audio, sr, variant_name, config)
-            outputs.extend(loops)
+            musical_context = result["context"]
+            detected_key = musical_context["key"]
+            if "transposition_semitones" in musical_context:
+                transposition = musical_context["transposition_semitones"]
+                tqdm.write(f"    > Detected Key: {detected_key} -> Target: {target_key} (Shift: {transposition:+d})")
+            elif detected_key:
+                tqdm.write(f"    > Detected Key: {detected_key}")
 
-            # Create swells
-            swells = make_swells(variant_audio, sr, variant_name, config, swell_index=1)
-            outputs.extend(swells)
+            if musical_context["bpm"]:
+                tqdm.write(f"    > Detected BPM: {musical_context['bpm']:.1f}")
 
-            # Create reversed variants
-            reversed_vars = make_reversed_variants(variant_audio, sr, variant_name, config)
-            outputs.extend(reversed_vars)
+            tqdm.write(f"    → Generated {len(result['outputs'])} audio file(s)")
+            yield stem, result
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-        results[stem] = {
-            "outputs": outputs,
-            "context": musical_context
-        }
-        tqdm.write(f"    → Generated {len(outputs)} audio file(s)")
 
-    return results
+def process_pad_sources(config: dict) -> dict:
+    """
+    Process all audio files in pad_sources directory.
+
+    Collects iter_pad_sources into a dict; prefer streaming the iterator
+    into save_drone_outputs when the outputs are only being saved.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Dictionary {source_name: {"outputs": [(audio, filename, kind), ...], "context": {...}}}
+    """
+    return dict(iter_pad_sources(config))
 
 
 def save_drone_outputs(
-    drone_dict: dict,
+    drone_dict: Union[dict, Iterable[Tuple[str, dict]]],
     config: dict,
     manifest: list = None,
 ) -> Tuple[int, int]:
     """
     Save drone maker outputs to export directories.
 
+    Metadata and grading run on the calling thread while WAV writes run on
+    a small thread pool; each source's writes finish before the next source
+    is taken, and manifest entries keep output order.
+
     Args:
-        drone_dict: Dictionary {source_name: {"outputs": [(audio, filename), ...], "context": {...}}}
+        drone_dict: Dictionary {source_name: {"outputs": [(audio, filename, kind), ...], "context": {...}}},
+            or an iterable of (source_name, data) pairs such as iter_pad_sources(config),
+            which is saved source by source as it is produced
         config: Configuration dictionary
 
     Returns:
@@ -411,65 +603,80 @@ def save_drone_outputs(
     sr = config['global']['sample_rate']
     bit_depth = config['global']['output_bit_depth']
     export_dir = config['paths']['export_dir']
+    curation = config.get("curation", {})
+    thresholds = curation.get("thresholds", {})
+    auto_delete = curation.get("auto_delete_grade_f", False)
 
     pads_saved = 0
     swells_saved = 0
 
-    for source_name, data in drone_dict.items():
-        # Handle legacy/simple structure just in case
-        if isinstance(data, list):
-            outputs = data
-            context = {}
-        else:
-            outputs = data["outputs"]
-            context = data.get("context", {})
-
-        # Group by source name
-        pad_export_dir = f"{export_dir}/{source_name}/pads"
-        swell_export_dir = f"{export_dir}/{source_name}/swells"
-        
-        io_utils.ensure_directory(pad_export_dir)
-        io_utils.ensure_directory(swell_export_dir)
-
-        for audio, filename in outputs:
-            if 'swell' in filename:
-                filepath = f"{swell_export_dir}/{filename}"
-                metadata_type = "swell"
-                brightness_bounds = None
+    # libsndfile releases the GIL while encoding, so a few writer threads
+    # overlap the writes with the next outputs' metadata
+    with ThreadPoolExecutor(max_workers=4) as writer:
+        sources = drone_dict.items() if isinstance(drone_dict, dict) else drone_dict
+        for source_name, data in sources:
+            # Handle legacy/simple structure just in case
+            if isinstance(data, list):
+                outputs = data
+                context = {}
             else:
-                filepath = f"{pad_export_dir}/{filename}"
-                metadata_type = "pad"
-                brightness_bounds = (1200, 4000)
-
-            metadata = dsp_utils.compute_audio_metadata(
-                audio,
-                sr,
-                brightness_bounds=brightness_bounds,
-                kind=metadata_type,
-                source=source_name,
-                filename=filename,
-                detected_key=context.get("key"),
-                detected_bpm=context.get("bpm"),
-            )
-            thresholds = config.get("curation", {}).get("thresholds", {})
-            grade = dsp_utils.grade_audio(metadata, thresholds)
-            metadata["grade"] = grade
-            metadata["saved"] = True
-            auto_delete = config.get("curation", {}).get("auto_delete_grade_f", False)
-            if auto_delete and grade == "F":
-                metadata["saved"] = False
-                if manifest is not None:
-                    manifest.append(metadata)
-                logger.info(f"    ✕ {filename} (grade F, skipped)")
-                continue
-
-            if io_utils.save_audio(filepath, audio, sr=sr, bit_depth=bit_depth):
+                outputs = data["outputs"]
+                context = data.get("context", {})
+
+            # Group by source name
+            pad_export_dir = f"{export_dir}/{source_name}/pads"
+            swell_export_dir = f"{export_dir}/{source_name}/swells"
+            
+            io_utils.ensure_directory(pad_export_dir)
+            io_utils.ensure_directory(swell_export_dir)
+
+            pending = []
+            for audio, filename, *tag in outputs:
+                # Producers tag each output "pad" or "swell"; untagged legacy
+                # pairs fall back to the filename
+                metadata_type = tag[0] if tag else ("swell" if 'swell' in filename else "pad")
                 if metadata_type == "swell":
-                    swells_saved += 1
+                    filepath = f"{swell_export_dir}/{filename}"
+                    brightness_bounds = None
                 else:
-                    pads_saved += 1
-                if manifest is not None:
-                    manifest.append(metadata)
-                log_success(logger, f"    {filename}")
+                    filepath = f"{pad_export_dir}/{filename}"
+                    brightness_bounds = (1200, 4000)
+
+                metadata = dsp_utils.compute_audio_metadata(
+                    audio,
+                    sr,
+                    brightness_bounds=brightness_bounds,
+                    kind=metadata_type,
+                    source=source_name,
+                    filename=filename,
+                    detected_key=context.get("key"),
+                    detected_bpm=context.get("bpm"),
+                )
+                grade = dsp_utils.grade_audio(metadata, thresholds)
+                metadata["grade"] = grade
+                metadata["saved"] = True
+                if auto_delete and grade == "F":
+                    metadata["saved"] = False
+                    pending.append((metadata, None))
+                    continue
+
+                pending.append((metadata, writer.submit(
+                    io_utils.save_audio, filepath, audio, sr=sr, bit_depth=bit_depth
+                )))
+
+            for metadata, future in pending:
+                filename = metadata["filename"]
+                if future is None:
+                    if manifest is not None:
+                        manifest.append(metadata)
+                    logger.info(f"    ✕ {filename} (grade F, skipped)")
+                elif future.result():
+                    if metadata["type"] == "swell":
+                        swells_saved += 1
+                    else:
+                        pads_saved += 1
+                    if manifest is not None:
+                        manifest.append(metadata)
+                    log_success(logger, f"    {filename}")
 
     return pads_saved, swells_saved
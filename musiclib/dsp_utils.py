@@ -2,8 +2,9 @@
 DSP utilities: filters, envelopes, windowing, normalization.
 """
 
+import functools
 import numpy as np
-from scipy import signal
+from scipy import fft as sp_fft, ndimage, signal
 import math
 import sys
 
@@ -20,6 +21,20 @@ except ImportError:
     logger.warning("  → Install with: pip install librosa")
     librosa = None
 
+try:
+    from numba import njit
+    from numba import types as numba_types
+    from numba.extending import overload as numba_overload
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit: kernels run as plain NumPy code."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 # Global verbose flag for pre-analysis logging
 _verbose = False
@@ -58,13 +73,84 @@ def set_random_seed(seed: int = None):
             pass
 
 
-def normalize_audio(audio: np.ndarray, target_peak_dbfs: float = -1.0) -> np.ndarray:
+if NUMBA_AVAILABLE:
+    # |x| of an IEEE float is its bit pattern with the sign bit cleared, and
+    # non-negative floats order like their bit patterns. LLVM will not
+    # vectorize a float max reduction, but it does vectorize an unsigned one.
+    @njit(cache=True)
+    def _peak_abs_f32(flat):
+        bits = flat.view(np.uint32)
+        m = np.uint32(0)
+        for i in range(bits.shape[0]):
+            v = bits[i] & np.uint32(0x7FFFFFFF)
+            m = v if v > m else m
+        out = np.empty(1, dtype=np.uint32)
+        out[0] = m
+        return float(out.view(np.float32)[0])
+
+    @njit(cache=True)
+    def _peak_abs_f64(flat):
+        bits = flat.view(np.uint64)
+        m = np.uint64(0)
+        for i in range(bits.shape[0]):
+            v = bits[i] & np.uint64(0x7FFFFFFFFFFFFFFF)
+            m = v if v > m else m
+        out = np.empty(1, dtype=np.uint64)
+        out[0] = m
+        return out.view(np.float64)[0]
+
+    @njit(cache=True)
+    def _peak_abs_float(x):
+        flat = np.ascontiguousarray(x).ravel()
+        if flat.itemsize == 4:
+            return _peak_abs_f32(flat)
+        return _peak_abs_f64(flat)
+
+    @njit(cache=True)
+    def _peak_abs_any(x):
+        m = 0.0
+        for v in x.ravel():
+            a = abs(float(v))
+            if a > m:
+                m = a
+        return m
+
+    def peak_abs(x: np.ndarray) -> float:
+        """
+        Peak absolute sample value in one pass, without an np.abs temporary.
+
+        float32/float64 arrays take the SIMD bit-pattern kernel, where NaN
+        and Inf patterns sort above every finite value, so a non-finite
+        input yields a NaN or Inf peak; other dtypes use a plain compiled
+        loop.
+        """
+        if x.dtype == np.float32 or x.dtype == np.float64:
+            return float(_peak_abs_float(x))
+        return float(_peak_abs_any(x))
+
+    @numba_overload(peak_abs)
+    def _peak_abs_overload(x):
+        # Same dtype dispatch when peak_abs is called from inside a kernel
+        if x.dtype in (numba_types.float32, numba_types.float64):
+            return lambda x: _peak_abs_float(x)
+        return lambda x: _peak_abs_any(x)
+else:
+    def peak_abs(x: np.ndarray) -> float:
+        """Peak absolute sample value (NumPy fallback)."""
+        return float(np.max(np.abs(x))) if x.size else 0.0
+
+
+def normalize_audio(
+    audio: np.ndarray, target_peak_dbfs: float = -1.0, copy: bool = True
+) -> np.ndarray:
     """
     Normalize audio to a target peak level.
 
     Args:
         audio: Input audio array
         target_peak_dbfs: Target peak in dBFS (e.g., -1.0)
+        copy: If False and audio is a writable float array, scale and clip
+              it in place instead of allocating a new buffer
 
     Returns:
         Normalized audio array
@@ -77,13 +163,15 @@ def normalize_audio(audio: np.ndarray, target_peak_dbfs: float = -1.0) -> np.nda
     if audio.size == 0:
         raise ValueError("Cannot normalize empty audio array")
 
-    if np.any(np.isnan(audio)):
+    # NaN and Inf both propagate through the peak scan, so one pass serves
+    # for validation and for the gain
+    peak = peak_abs(audio)
+    if math.isnan(peak):
         raise ValueError("Audio contains NaN values")
 
-    if np.any(np.isinf(audio)):
+    if math.isinf(peak):
         raise ValueError("Audio contains Inf values")
 
-    peak = np.max(np.abs(audio))
     if peak < 1e-8:
         rms_db = rms_energy_db(audio)
         raise SilentArtifact(
@@ -93,10 +181,13 @@ def normalize_audio(audio: np.ndarray, target_peak_dbfs: float = -1.0) -> np.nda
         )
 
     target_linear = 10 ** (target_peak_dbfs / 20.0)
-    normalized = audio * (target_linear / peak)
+    if not copy and audio.dtype.kind == 'f' and audio.flags.writeable:
+        normalized = np.multiply(audio, target_linear / peak, out=audio)
+    else:
+        normalized = audio * (target_linear / peak)
 
     # Clip to [-1, 1] range to prevent overflow
-    return np.clip(normalized, -1.0, 1.0)
+    return np.clip(normalized, -1.0, 1.0, out=normalized)
 
 
 def linear_to_db(linear: float, min_db: float = -80.0) -> float:
@@ -116,18 +207,103 @@ def rms_energy(audio: np.ndarray) -> float:
     return np.sqrt(np.mean(audio ** 2))
 
 
+def ms_to_db(ms, min_db: float = -80.0):
+    """
+    Convert mean-square (power) to dB.
+
+    10*log10(ms) equals 20*log10(sqrt(ms)), so RMS levels can be taken in
+    dB without the square root. Works on scalars and arrays; zero power
+    maps to ``min_db``.
+    """
+    ms = np.asarray(ms, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        db = np.where(ms > 0, 10 * np.log10(ms), min_db)
+    return db if db.ndim else float(db)
+
+
 def rms_energy_db(audio: np.ndarray, min_db: float = -80.0) -> float:
     """Calculate RMS energy in dB."""
-    rms = rms_energy(audio)
-    return linear_to_db(rms, min_db)
+    return ms_to_db(np.mean(audio ** 2), min_db)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _peak_and_sum_sq(flat):
+        peak = 0.0
+        sum_sq = 0.0
+        for i in range(flat.shape[0]):
+            v = float(flat[i])
+            a = abs(v)
+            if a > peak:
+                peak = a
+            sum_sq += v * v
+        return peak, sum_sq
+
+    def peak_and_mean_square(audio: np.ndarray) -> tuple:
+        """
+        Peak absolute value and mean square of a buffer in one pass.
+
+        Replaces separate peak_abs and rms_energy/rms_energy_db scans when
+        all three levels are needed. The square sum accumulates in float64.
+        Multi-channel input is treated as one flat buffer.
+
+        Returns:
+            (peak, mean_square); (0.0, 0.0) for empty input
+        """
+        if audio.size == 0:
+            return 0.0, 0.0
+        peak, sum_sq = _peak_and_sum_sq(np.ascontiguousarray(audio).ravel())
+        return float(peak), float(sum_sq / audio.size)
+else:
+    def peak_and_mean_square(audio: np.ndarray) -> tuple:
+        """Peak absolute value and mean square of a buffer (NumPy fallback)."""
+        if audio.size == 0:
+            return 0.0, 0.0
+        return peak_abs(audio), float(np.mean(np.square(audio, dtype=np.float64)))
+
+
+@functools.lru_cache(maxsize=256)
+def hann_window(length: int) -> np.ndarray:
+    """
+    Create a Hann window (memoized per length).
 
+    Grain lengths span a small integer range, so granular synthesis requests
+    the same sizes hundreds of times per cloud. The returned array is
+    read-only; multiply into a new array rather than modifying it in place.
+    """
+    window = signal.windows.hann(length, sym=False)
+    window.setflags(write=False)
+    return window
+
+
+@functools.lru_cache(maxsize=32)
+def _rfftfreqs(n: int, sr: int) -> np.ndarray:
+    """rfft bin frequencies for n samples at sr (memoized, read-only)."""
+    freqs = sp_fft.rfftfreq(n, 1 / sr)
+    freqs.setflags(write=False)
+    return freqs
+
+
+def _compute_spectrum(audio: np.ndarray, sr: int) -> tuple:
+    """
+    Magnitude spectrum of a mono buffer as (freqs, mag).
+
+    compute_audio_metadata takes it once and shares it between the FFT
+    centroid and the pitch estimate.
+    """
+    mag = np.abs(sp_fft.rfft(audio, workers=-1))
+    return _rfftfreqs(len(audio), sr), mag
 
-def hann_window(length: int) -> np.ndarray:
-    """Create a Hann window."""
-    return signal.windows.hann(length, sym=False)
 
+def _fft_centroid(freqs: np.ndarray, mag: np.ndarray) -> float or None:
+    """Magnitude-weighted mean frequency, or None for an all-zero spectrum."""
+    total = np.sum(mag)
+    if total == 0:
+        return None
+    return float(np.dot(freqs, mag) / total)
 
-def _spectral_centroid(audio: np.ndarray, sr: int) -> float:
+
+def _spectral_centroid(audio: np.ndarray, sr: int, spectrum: tuple = None) -> float:
     """Compute spectral centroid using librosa if available, else FFT."""
     if len(audio) == 0:
         return 0.0
@@ -138,35 +314,155 @@ def _spectral_centroid(audio: np.ndarray, sr: int) -> float:
         # Fall back to FFT if librosa fails (e.g., due to invalid audio)
         logger.debug(f"librosa spectral_centroid failed, using FFT fallback: {e}")
 
-    # FFT-based fallback
-    fft = np.fft.rfft(audio)
-    freqs = np.fft.rfftfreq(len(audio), 1 / sr)
-    mag = np.abs(fft)
-    if np.sum(mag) == 0:
-        return 0.0
-    return float(np.sum(freqs * mag) / np.sum(mag))
+    # FFT-based fallback (scipy.fft reuses plans per length and keeps float32
+    # input in single precision, unlike np.fft)
+    if spectrum is None:
+        spectrum = _compute_spectrum(audio, sr)
+    centroid = _fft_centroid(*spectrum)
+    return 0.0 if centroid is None else centroid
 
 
-def estimate_pitch_hz(audio: np.ndarray, sr: int, fmin: float = 30.0, fmax: float = 6000.0) -> float or None:
-    """Rough pitch estimate via dominant FFT bin."""
+def estimate_pitch_hz(
+    audio: np.ndarray, sr: int, fmin: float = 30.0, fmax: float = 6000.0,
+    spectrum: tuple = None,
+) -> float or None:
+    """
+    Rough pitch estimate via dominant FFT bin.
+
+    Args:
+        audio: Input audio
+        sr: Sample rate
+        fmin, fmax: Accepted pitch range in Hz
+        spectrum: Optional (freqs, mag) of the mono audio, from
+                  _compute_spectrum, to reuse instead of a new FFT
+    """
     if len(audio) == 0:
         return None
     # If stereo/stacked, collapse to mono for robust FFT sizing
     if audio.ndim > 1:
         audio = np.mean(audio, axis=0)
-    audio = audio - np.mean(audio)
-    if np.max(np.abs(audio)) < 1e-4:
+    centered = audio - np.mean(audio)
+    if np.max(np.abs(centered)) < 1e-4:
         return None
-    fft = np.fft.rfft(audio)
-    freqs = np.fft.rfftfreq(len(audio), 1 / sr)
-    mag = np.abs(fft)
-    peak_idx = np.argmax(mag)
+    if spectrum is None:
+        spectrum = _compute_spectrum(centered, sr)
+    freqs, mag = spectrum
+    # Removing the mean only changes the DC bin, so skip it rather than
+    # requiring the spectrum of the centered signal
+    peak_idx = np.argmax(mag[1:]) + 1
     peak_freq = freqs[peak_idx]
     if peak_freq < fmin or peak_freq > fmax:
         return None
     return float(peak_freq)
 
 
+@njit(cache=True)
+def _peak_pick_finish(x, mov_max, mov_avg, pre_avg, post_avg, delta, wait):
+    """Edge-corrected moving average, peak mask and wait gating of peak_pick."""
+    n = len(x)
+    # Truncate the averaging window at both ends (mean of x[start:i + post_avg])
+    for i in range(min(pre_avg, n)):
+        mov_avg[i] = np.mean(x[max(0, i - pre_avg):i + post_avg])
+    for i in range(max(n - post_avg, 0), n):
+        mov_avg[i] = np.mean(x[max(0, i - pre_avg):i + post_avg])
+
+    peaks = np.empty(n, dtype=np.int64)
+    count = 0
+    last_onset = -wait - 1
+    for i in range(n):
+        value = x[i]
+        if value == 0.0 or value != mov_max[i] or value < mov_avg[i] + delta:
+            continue
+        if i > last_onset + wait:
+            peaks[count] = i
+            count += 1
+            last_onset = i
+    return peaks[:count]
+
+
+def peak_pick(x: np.ndarray, pre_max: int, post_max: int, pre_avg: int,
+              post_avg: int, delta: float, wait: int) -> np.ndarray:
+    """
+    librosa.util.peak_pick with its Python loops compiled.
+
+    The sliding max/mean still use scipy.ndimage (same windows and origins
+    as librosa); the per-frame edge correction and greedy wait gating run
+    in a numba kernel when available.
+
+    Returns:
+        Indices of the picked peaks
+    """
+    pre_max, post_max, pre_avg, post_avg, wait = (
+        int(np.ceil(v)) for v in (pre_max, post_max, pre_avg, post_avg, wait)
+    )
+    mov_max = ndimage.maximum_filter1d(
+        x, pre_max + post_max, mode="constant",
+        origin=int(np.ceil(0.5 * (pre_max - post_max))), cval=x.min(),
+    )
+    mov_avg = ndimage.uniform_filter1d(
+        x, pre_avg + post_avg, mode="nearest",
+        origin=int(np.ceil(0.5 * (pre_avg - post_avg))),
+    )
+    return _peak_pick_finish(x, mov_max, mov_avg, pre_avg, post_avg, delta, wait)
+
+
+def detect_onsets(
+    onset_env: np.ndarray,
+    sr: int,
+    hop_length: int = 512,
+    backtrack: bool = False,
+    pre_max: float = None,
+    post_max: float = None,
+    pre_avg: float = None,
+    post_avg: float = None,
+    delta: float = 0.07,
+    wait: float = None,
+) -> np.ndarray:
+    """
+    librosa.onset.onset_detect(onset_envelope=..., units='samples') on peak_pick.
+
+    Normalizes the envelope to [0, 1] and picks peaks the way librosa does,
+    including its defaults (30 ms pre-max/wait, 100 ms averaging windows),
+    so results are identical.
+
+    Args:
+        onset_env: Onset strength envelope (frames)
+        sr: Sample rate
+        hop_length: Hop between envelope frames (samples)
+        backtrack: Shift onsets back to the preceding energy minimum
+        pre_max, post_max, pre_avg, post_avg, delta, wait: peak_pick parameters
+
+    Returns:
+        Onset positions in samples
+    """
+    env = onset_env - np.min(onset_env)
+    env /= np.max(env) + np.finfo(env.dtype).tiny
+    if not env.any() or not np.all(np.isfinite(env)):
+        return np.array([], dtype=np.int64)
+
+    onsets = peak_pick(
+        env,
+        0.03 * sr // hop_length if pre_max is None else pre_max,
+        0.00 * sr // hop_length + 1 if post_max is None else post_max,
+        0.10 * sr // hop_length if pre_avg is None else pre_avg,
+        0.10 * sr // hop_length + 1 if post_avg is None else post_avg,
+        delta,
+        0.03 * sr // hop_length if wait is None else wait,
+    )
+    if backtrack:
+        onsets = librosa.onset.onset_backtrack(onsets, env)
+    return onsets * hop_length
+
+
+# Columns of a manifest row, in the order compute_audio_metadata() builds
+# them, followed by the grade and saved flags added by each maker's save step
+MANIFEST_FIELDS = (
+    "filename", "source", "type", "duration_sec", "rms_db", "peak",
+    "crest_factor", "centroid_hz", "est_freq_hz", "loop_error_db",
+    "brightness", "detected_key", "detected_bpm", "grade", "saved",
+)
+
+
 def compute_audio_metadata(
     audio: np.ndarray,
     sr: int,
@@ -185,12 +481,18 @@ def compute_audio_metadata(
     centroid_hz, est_freq_hz, loop_error_db, brightness, detected_key, detected_bpm
     """
     duration_sec = len(audio) / sr if sr else 0.0
-    rms = rms_energy(audio)
-    rms_db = rms_energy_db(audio)
-    peak = float(np.max(np.abs(audio))) if len(audio) else 0.0
+    peak, mean_square = peak_and_mean_square(audio)
+    rms = math.sqrt(mean_square)
+    rms_db = ms_to_db(mean_square)
     crest = float(peak / rms) if rms > 1e-9 else math.inf
-    centroid = _spectral_centroid(audio, sr)
-    est_freq = estimate_pitch_hz(audio, sr) if kind in ("pad", "drone", "swell") else None
+    wants_pitch = kind in ("pad", "drone", "swell")
+    # One FFT serves the pitch estimate and, without librosa, the centroid
+    # and brightness
+    spectrum = None
+    if audio.ndim == 1 and len(audio) and (librosa is None or wants_pitch):
+        spectrum = _compute_spectrum(audio, sr)
+    centroid = _spectral_centroid(audio, sr, spectrum)
+    est_freq = estimate_pitch_hz(audio, sr, spectrum=spectrum) if wants_pitch else None
     seam_len = min(len(audio) // 8, 2048)
     loop_error_db = None
     if seam_len > 0:
@@ -202,7 +504,17 @@ def compute_audio_metadata(
     brightness_tag = None
     if brightness_bounds is not None:
         low, high = brightness_bounds
-        brightness_tag = classify_brightness(audio, sr, low, high)
+        if audio.ndim == 1 and librosa is not None and len(audio):
+            # classify_brightness would recompute the same librosa centroid
+            brightness_tag = _brightness_from_centroid(centroid, low, high)
+        elif spectrum is not None:
+            fft_centroid = _fft_centroid(*spectrum)
+            brightness_tag = (
+                "mid" if fft_centroid is None
+                else _brightness_from_centroid(fft_centroid, low, high)
+            )
+        else:
+            brightness_tag = classify_brightness(audio, sr, low, high)
 
     return {
         "filename": filename,
@@ -245,6 +557,19 @@ def grade_audio(metadata: dict, thresholds: dict) -> str:
     return "B"
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _overlap_add_into(dst, a, fade_a, b, fade_b):
+        """dst = a * fade_a + b * fade_b in one fused pass, without temporaries."""
+        for i in range(dst.shape[0]):
+            dst[i] = a[i] * fade_a[i] + b[i] * fade_b[i]
+else:
+    def _overlap_add_into(dst, a, fade_a, b, fade_b):
+        """dst = a * fade_a + b * fade_b (NumPy fallback)."""
+        np.multiply(a, fade_a, out=dst)
+        dst += b * fade_b
+
+
 def crossfade(audio1: np.ndarray, audio2: np.ndarray, fade_length: int, equal_power: bool = True) -> np.ndarray:
     """
     Crossfade between two audio signals.
@@ -259,86 +584,201 @@ def crossfade(audio1: np.ndarray, audio2: np.ndarray, fade_length: int, equal_po
     Returns:
         Crossfaded audio
     """
-    t = np.linspace(0, 1, fade_length)
+    fade_in, fade_out = crossfade_curves(fade_length, equal_power)
+
+    # Write both bodies and the overlap-add straight into the output buffer
+    head_len = len(audio1) - fade_length
+    result = np.empty(
+        head_len + len(audio2),
+        dtype=np.result_type(audio1.dtype, audio2.dtype, np.float32),
+    )
+    result[:head_len] = audio1[:head_len]
+    _overlap_add_into(
+        result[head_len:head_len + fade_length],
+        audio1[head_len:], fade_out, audio2[:fade_length], fade_in,
+    )
+    result[head_len + fade_length:] = audio2[fade_length:]
+    return result
 
-    if equal_power:
-        # Equal-power crossfade maintains constant perceived loudness
-        fade_out = np.sqrt(1 - t)  # Convex curve
-        fade_in = np.sqrt(t)        # Convex curve
-    else:
-        # Linear crossfade
-        fade_out = 1 - t
-        fade_in = t
 
-    # Overlap-add the crossfade
-    overlap_region = (audio1[-fade_length:] * fade_out + audio2[:fade_length] * fade_in)
-    result = np.concatenate([audio1[:-fade_length], overlap_region, audio2[fade_length:]])
-    return result
+@functools.lru_cache(maxsize=64)
+def fade_ramp(fade_length: int, rising: bool = True) -> np.ndarray:
+    """
+    Linear fade ramp (0->1 if rising, else 1->0), memoized per length.
+
+    Fades use a handful of fixed lengths per run, so the ramp is built once.
+    The returned array is read-only.
+    """
+    ramp = np.linspace(0, 1, fade_length) if rising else np.linspace(1, 0, fade_length)
+    ramp.setflags(write=False)
+    return ramp
 
 
-def apply_fade_in(audio: np.ndarray, fade_length: int) -> np.ndarray:
-    """Apply fade-in envelope."""
+def apply_fade_in(audio: np.ndarray, fade_length: int, inplace: bool = False) -> np.ndarray:
+    """
+    Apply fade-in envelope.
+
+    With inplace=True only the faded samples are touched and audio itself
+    is returned; otherwise the result is written to a new buffer in one pass.
+    """
     if fade_length > len(audio):
         fade_length = len(audio)
-    fade = np.linspace(0, 1, fade_length)
-    audio_out = audio.copy()
-    audio_out[:fade_length] *= fade
+    fade = fade_ramp(fade_length, rising=True)
+    if inplace:
+        audio[:fade_length] *= fade
+        return audio
+    audio_out = np.empty_like(audio)
+    np.multiply(audio[:fade_length], fade, out=audio_out[:fade_length])
+    audio_out[fade_length:] = audio[fade_length:]
     return audio_out
 
 
-def apply_fade_out(audio: np.ndarray, fade_length: int) -> np.ndarray:
-    """Apply fade-out envelope."""
+def apply_fade_out(audio: np.ndarray, fade_length: int, inplace: bool = False) -> np.ndarray:
+    """
+    Apply fade-out envelope.
+
+    With inplace=True only the faded samples are touched and audio itself
+    is returned; otherwise the result is written to a new buffer in one pass.
+    """
     if fade_length > len(audio):
         fade_length = len(audio)
-    fade = np.linspace(1, 0, fade_length)
-    audio_out = audio.copy()
-    audio_out[-fade_length:] *= fade
+    fade = fade_ramp(fade_length, rising=False)
+    start = len(audio) - fade_length
+    if inplace:
+        audio[start:] *= fade
+        return audio
+    audio_out = np.empty_like(audio)
+    audio_out[:start] = audio[:start]
+    np.multiply(audio[start:], fade, out=audio_out[start:])
     return audio_out
 
 
-def apply_hann_window_edge(audio: np.ndarray, window_length: int) -> np.ndarray:
-    """Apply Hann window at start and end of audio."""
+@njit(cache=True)
+def fade_normalize_inplace(audio, fade_in_ramp, fade_out_ramp, target_peak_lin):
+    """
+    Fade in, fade out and peak-normalize a mono buffer in place.
+
+    Fusing the three steps avoids the copies apply_fade_in, apply_fade_out
+    and normalize_audio each make. Ramps longer than the buffer are replaced
+    by a full-length linear ramp, as in apply_fade_in/apply_fade_out. The
+    gain comes from the peak after fading, and the result is clipped to
+    [-1, 1].
+
+    Args:
+        audio: Float buffer to modify (must be writable)
+        fade_in_ramp: Rising ramp, e.g. fade_ramp(n, rising=True)
+        fade_out_ramp: Falling ramp, e.g. fade_ramp(n, rising=False)
+        target_peak_lin: Target peak (linear)
+
+    Returns:
+        Peak after fading. Below 1e-8 the buffer is left faded but unscaled
+        (callers treat it as silent). A NaN or Inf peak means the input was
+        not finite; the buffer is likewise left unscaled and callers must
+        reject it, as normalize_audio would have raised ValueError.
+    """
+    n = audio.shape[0]
+    n_in = len(fade_in_ramp)
+    n_out = len(fade_out_ramp)
+    if n >= n_in:
+        audio[:n_in] *= fade_in_ramp
+    else:
+        audio *= np.linspace(0.0, 1.0, n)
+    if n >= n_out:
+        audio[n - n_out:] *= fade_out_ramp
+    else:
+        audio *= np.linspace(1.0, 0.0, n)
+
+    peak = peak_abs(audio)
+    if not np.isfinite(peak) or peak < 1e-8:
+        return peak
+    audio *= target_peak_lin / peak
+    np.clip(audio, -1.0, 1.0, audio)
+    return peak
+
+
+def apply_hann_window_edge(audio: np.ndarray, window_length: int, inplace: bool = False) -> np.ndarray:
+    """
+    Apply Hann window at start and end of audio.
+
+    With inplace=True only the windowed edges are touched and audio itself
+    is returned; otherwise the result is written to a new buffer in one pass.
+    """
     if window_length > len(audio) // 2:
         window_length = len(audio) // 2
 
     window = hann_window(window_length * 2)
-    audio_out = audio.copy()
-    audio_out[:window_length] *= window[:window_length]
-    audio_out[-window_length:] *= window[window_length:]
+    start = len(audio) - window_length
+    if inplace:
+        audio[:window_length] *= window[:window_length]
+        audio[start:] *= window[window_length:]
+        return audio
+    audio_out = np.empty_like(audio)
+    np.multiply(audio[:window_length], window[:window_length], out=audio_out[:window_length])
+    audio_out[window_length:start] = audio[window_length:start]
+    np.multiply(audio[start:], window[window_length:], out=audio_out[start:])
     return audio_out
 
 
-def design_butterworth_lowpass(cutoff_hz: float, sr: int, order: int = 5) -> tuple:
+def _butter(order: int, wn, btype: str, output: str) -> tuple:
+    """signal.butter, always returning a tuple of arrays ((b, a) or (sos,))."""
+    if output == 'sos':
+        return (signal.butter(order, wn, btype=btype, output='sos'),)
+    return signal.butter(order, wn, btype=btype)
+
+
+def _read_only(*arrays):
+    """
+    Mark memoized filter coefficients read-only so cached designs stay intact.
+
+    Returns the single array for one argument, else the tuple.
+    """
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays[0] if len(arrays) == 1 else arrays
+
+
+@functools.lru_cache(maxsize=256)
+def design_butterworth_lowpass(
+    cutoff_hz: float, sr: int, order: int = 5, output: str = 'ba'
+):
     """
-    Design a Butterworth low-pass filter.
+    Design a Butterworth low-pass filter (memoized per spec).
 
     Args:
         cutoff_hz: Cutoff frequency in Hz
         sr: Sample rate in Hz
         order: Filter order
+        output: 'ba' for transfer-function coefficients, 'sos' for
+                second-order sections
 
     Returns:
-        (b, a) coefficients for scipy.signal.filtfilt
+        (b, a) coefficients, or an SOS array if output='sos' (read-only);
+        either form can be passed to apply_filter
     """
     nyquist = sr / 2
     normalized_cutoff = cutoff_hz / nyquist
     if normalized_cutoff >= 1.0:
         normalized_cutoff = 0.99
-    b, a = signal.butter(order, normalized_cutoff, btype='low')
-    return b, a
+    return _read_only(*_butter(order, normalized_cutoff, 'low', output))
 
 
-def design_butterworth_highpass(cutoff_hz: float, sr: int, order: int = 5) -> tuple:
+@functools.lru_cache(maxsize=32)
+def design_butterworth_highpass(
+    cutoff_hz: float, sr: int, order: int = 5, output: str = 'ba'
+):
     """
-    Design a Butterworth high-pass filter.
+    Design a Butterworth high-pass filter (memoized per spec).
 
     Args:
         cutoff_hz: Cutoff frequency in Hz
         sr: Sample rate in Hz
         order: Filter order
+        output: 'ba' for transfer-function coefficients, 'sos' for
+                second-order sections
 
     Returns:
-        (b, a) coefficients for scipy.signal.filtfilt
+        (b, a) coefficients, or an SOS array if output='sos' (read-only);
+        either form can be passed to apply_filter
     """
     nyquist = sr / 2
     normalized_cutoff = cutoff_hz / nyquist
@@ -346,24 +786,27 @@ def design_butterworth_highpass(cutoff_hz: float, sr: int, order: int = 5) -> tu
         normalized_cutoff = 0.99
     if normalized_cutoff <= 0.01:
         normalized_cutoff = 0.01
-    b, a = signal.butter(order, normalized_cutoff, btype='high')
-    return b, a
+    return _read_only(*_butter(order, normalized_cutoff, 'high', output))
 
 
+@functools.lru_cache(maxsize=32)
 def design_butterworth_bandpass(
-    low_hz: float, high_hz: float, sr: int, order: int = 5
-) -> tuple:
+    low_hz: float, high_hz: float, sr: int, order: int = 5, output: str = 'ba'
+):
     """
-    Design a Butterworth band-pass filter.
+    Design a Butterworth band-pass filter (memoized per spec).
 
     Args:
         low_hz: Low cutoff frequency in Hz
         high_hz: High cutoff frequency in Hz
         sr: Sample rate in Hz
         order: Filter order
+        output: 'ba' for transfer-function coefficients, 'sos' for
+                second-order sections
 
     Returns:
-        (b, a) coefficients for scipy.signal.filtfilt
+        (b, a) coefficients, or an SOS array if output='sos' (read-only);
+        either form can be passed to apply_filter
 
     Raises:
         ValueError: If frequencies or sample rate are invalid
@@ -389,27 +832,96 @@ def design_butterworth_bandpass(
     high_norm = high_hz / nyquist
     low_norm = np.clip(low_norm, 0.01, 0.99)
     high_norm = np.clip(high_norm, 0.01, 0.99)
-    b, a = signal.butter(order, [low_norm, high_norm], btype='band')
-    return b, a
+    return _read_only(*_butter(order, [low_norm, high_norm], 'band', output))
 
 
-def apply_filter(audio: np.ndarray, b: np.ndarray, a: np.ndarray) -> np.ndarray:
+def apply_filter(audio: np.ndarray, b: np.ndarray, a: np.ndarray = None) -> np.ndarray:
     """
-    Apply IIR filter using filtfilt (zero-phase).
+    Apply IIR filter using sosfiltfilt (zero-phase).
+
+    Accepts either second-order sections, as apply_filter(audio, sos), or
+    transfer-function coefficients, as apply_filter(audio, b, a). The (b, a)
+    form is converted to sections first: filtering the polynomial form
+    directly loses precision at order 5 and above. Runs in the input's float
+    precision, so float32 audio stays float32.
 
     Args:
         audio: Input audio
-        b, a: Filter coefficients
+        b, a: Filter coefficients, or an SOS array as b with a omitted
+              (e.g. design_butterworth_lowpass(..., output='sos'))
 
     Returns:
         Filtered audio
     """
-    min_len = 3 * max(len(a), len(b))
-    if len(audio) < min_len:
-        # Too short for filtfilt stability; return unfiltered audio
+    if a is None:
+        sos = np.asarray(b)
+        if sos.ndim != 2:
+            raise ValueError(f"Expected SOS array of shape (n, 6), got {sos.shape}")
+    else:
+        sos = signal.tf2sos(b, a)
+    if len(audio) <= 3 * (2 * len(sos) + 1):
+        # Too short for sosfiltfilt's edge padding; return unfiltered audio
         # to avoid crashes on tiny hiss/flicker segments.
         return audio
-    return signal.filtfilt(b, a, audio)
+    # The cast also copies: scipy's SOS kernel wants a writable buffer and
+    # memoized designs are read-only
+    dtype = np.result_type(audio.dtype, np.float32)
+    return signal.sosfiltfilt(sos.astype(dtype), audio)
+
+
+@functools.lru_cache(maxsize=32)
+def design_fir_filter(
+    sr: int, num_taps: int, low_hz: float = None, high_hz: float = None
+) -> np.ndarray:
+    """
+    Design a linear-phase (windowed-sinc) FIR filter, memoized per spec.
+
+    Band-pass when both cutoffs are given, high-pass with only low_hz and
+    low-pass with only high_hz. The returned taps are read-only.
+
+    Args:
+        sr: Sample rate in Hz
+        num_taps: Filter length (must be odd for high-pass/band-pass)
+        low_hz: Low cutoff frequency in Hz (optional)
+        high_hz: High cutoff frequency in Hz (optional)
+
+    Returns:
+        FIR taps for apply_fir_filter
+
+    Raises:
+        ValueError: If no cutoff is given
+    """
+    if low_hz and high_hz:
+        taps = signal.firwin(num_taps, [low_hz, high_hz], pass_zero=False, fs=sr)
+    elif low_hz:
+        taps = signal.firwin(num_taps, low_hz, pass_zero=False, fs=sr)
+    elif high_hz:
+        taps = signal.firwin(num_taps, high_hz, fs=sr)
+    else:
+        raise ValueError("FIR filter needs at least one cutoff frequency")
+    taps.setflags(write=False)
+    return taps
+
+
+def apply_fir_filter(audio: np.ndarray, taps: np.ndarray) -> np.ndarray:
+    """
+    Apply a linear-phase FIR filter via overlap-add FFT convolution.
+
+    Unlike the recursive IIR path this has no sample-to-sample dependency,
+    so long buffers are filtered in FFT-sized blocks. Output is aligned
+    with the input (mode='same'), which makes a symmetric FIR zero-phase.
+
+    Args:
+        audio: Input audio
+        taps: FIR coefficients (see design_fir_filter)
+
+    Returns:
+        Filtered audio
+    """
+    if len(audio) < len(taps):
+        # Too short to filter meaningfully; mirror apply_filter's guard
+        return audio
+    return signal.oaconvolve(audio, taps, mode='same')
 
 
 def apply_tremolo(audio: np.ndarray, rate_hz: float, depth: float, sr: int) -> np.ndarray:
@@ -490,12 +1002,15 @@ def find_best_loop_trim(audio: np.ndarray, fade_length: int, search_window: int
     # Search region: the end of the file
     # We want to find where 'ref' occurs best in the 'search_region'
     # The search region effectively represents the 'predecessor' to the loop start.
+    # ref is zero-mean, so a constant offset in the search region adds
+    # nothing to any lag; it needs no mean removal (or copy) of its own.
     search_region = audio[-search_window:]
-    search_region = search_region - np.mean(search_region)
 
     # Correlate
-    # Mode 'valid' returns correlations where the signals fully overlap
-    corr = signal.correlate(search_region, ref, mode='valid')
+    # Mode 'valid' returns correlations where the signals fully overlap.
+    # Force the FFT path: direct correlation is O(search_window * fade_length),
+    # and scipy's 'auto' heuristic still picks it for mid-sized fades.
+    corr = signal.correlate(search_region, ref, mode='valid', method='fft')
     
     if len(corr) == 0:
         return 0
@@ -519,6 +1034,30 @@ def find_best_loop_trim(audio: np.ndarray, fade_length: int, search_window: int
     return trim_amount
 
 
+@functools.lru_cache(maxsize=32)
+def crossfade_curves(length: int, equal_power: bool = True) -> tuple:
+    """
+    Loop crossfade curves (fade_in, fade_out), memoized per length.
+
+    Every pad and loop in a run uses the same crossfade length, so the
+    curves are built once. The returned arrays are read-only.
+    """
+    t = np.linspace(0, 1, length)
+
+    if equal_power:
+        # Equal-power crossfade maintains constant perceived loudness
+        fade_out = np.sqrt(1 - t)  # Convex curve
+        fade_in = np.sqrt(t)        # Convex curve
+    else:
+        # Linear crossfade
+        fade_out = 1 - t
+        fade_in = t
+
+    fade_in.setflags(write=False)
+    fade_out.setflags(write=False)
+    return fade_in, fade_out
+
+
 def time_domain_crossfade_loop(
     audio: np.ndarray, crossfade_ms: float, sr: int, optimize_loop: bool = True, equal_power: bool = True
 ) -> np.ndarray:
@@ -556,24 +1095,16 @@ def time_domain_crossfade_loop(
         if trim > 0:
             audio = audio[:-trim]
 
-    t = np.linspace(0, 1, crossfade_samples)
+    fade_in, fade_out = crossfade_curves(crossfade_samples, equal_power)
 
-    if equal_power:
-        # Equal-power crossfade maintains constant perceived loudness
-        fade_out = np.sqrt(1 - t)  # Convex curve
-        fade_in = np.sqrt(t)        # Convex curve
-    else:
-        # Linear crossfade
-        fade_out = 1 - t
-        fade_in = t
-
-    # Crossfade: end of audio fades out, beginning fades in
+    # Crossfade: end of audio fades out, beginning fades in, and the faded-out
+    # end is added onto the faded-in beginning (overlap-add)
     audio_out = audio.copy()
+    _overlap_add_into(
+        audio_out[:crossfade_samples],
+        audio[:crossfade_samples], fade_in, audio[-crossfade_samples:], fade_out,
+    )
     audio_out[-crossfade_samples:] *= fade_out
-    audio_out[:crossfade_samples] *= fade_in
-
-    # Add the faded-out end to the faded-in beginning (overlap-add)
-    audio_out[:crossfade_samples] += audio[-crossfade_samples:] * fade_out
 
     return audio_out
 
@@ -598,16 +1129,18 @@ def classify_brightness(audio: np.ndarray, sr: int, centroid_low_hz: float = 150
     if librosa is None:
         # Fallback if librosa not available: compute simple spectral centroid
         # using FFT-based approach
-        fft = np.fft.rfft(audio)
-        freqs = np.fft.rfftfreq(len(audio), 1 / sr)
-        magnitudes = np.abs(fft)
-        if np.sum(magnitudes) == 0:
+        centroid = _fft_centroid(*_compute_spectrum(audio, sr))
+        if centroid is None:
             return "mid"
-        centroid = np.sum(freqs * magnitudes) / np.sum(magnitudes)
     else:
         # Use librosa's spectral centroid
         centroid = np.mean(librosa.feature.spectral_centroid(y=audio, sr=sr))
 
+    return _brightness_from_centroid(centroid, centroid_low_hz, centroid_high_hz)
+
+
+def _brightness_from_centroid(centroid: float, centroid_low_hz: float, centroid_high_hz: float) -> str:
+    """Map a spectral centroid (Hz) to "dark", "mid" or "bright"."""
     if centroid < centroid_low_hz:
         return "dark"
     elif centroid > centroid_high_hz:
@@ -616,6 +1149,11 @@ def classify_brightness(audio: np.ndarray, sr: int, centroid_low_hz: float = 150
         return "mid"
 
 
+# Channel gains for ensure_mono's mixing methods: "average" is the channel
+# mean, "sum" divides the sum by sqrt(2) for roughly constant power
+_MONO_GAINS = {"average": 0.5, "sum": 1 / math.sqrt(2.0)}
+
+
 def ensure_mono(audio: np.ndarray, method: str = "average") -> np.ndarray:
     """
     Normalize audio to mono (samples,) regardless of input convention.
@@ -643,27 +1181,9 @@ def ensure_mono(audio: np.ndarray, method: str = "average") -> np.ndarray:
         return audio
     elif audio.ndim == 2:
         if audio.shape[0] == 2:  # librosa convention: (2, samples)
-            if method == "average":
-                return np.mean(audio, axis=0)
-            elif method == "sum":
-                return np.sum(audio, axis=0) / np.sqrt(2.0)  # Normalize power
-            elif method == "left":
-                return audio[0]
-            elif method == "right":
-                return audio[1]
-            else:
-                raise ValueError(f"Unknown stereo conversion method: {method}")
+            left, right = audio[0], audio[1]
         elif audio.shape[1] == 2:  # soundfile convention: (samples, 2)
-            if method == "average":
-                return np.mean(audio, axis=1)
-            elif method == "sum":
-                return np.sum(audio, axis=1) / np.sqrt(2.0)  # Normalize power
-            elif method == "left":
-                return audio[:, 0]
-            elif method == "right":
-                return audio[:, 1]
-            else:
-                raise ValueError(f"Unknown stereo conversion method: {method}")
+            left, right = audio[:, 0], audio[:, 1]
         else:
             raise ValueError(
                 f"Unexpected stereo shape: {audio.shape}. "
@@ -675,6 +1195,20 @@ def ensure_mono(audio: np.ndarray, method: str = "average") -> np.ndarray:
             f"Expected 1D or 2D audio."
         )
 
+    if method == "left":
+        return left
+    if method == "right":
+        return right
+    gain = _MONO_GAINS.get(method)
+    if gain is None:
+        raise ValueError(f"Unknown stereo conversion method: {method}")
+    # One output buffer: add the channels into it, then scale in place.
+    # Integer input is mixed in float64, as np.mean would.
+    dtype = audio.dtype if audio.dtype.kind == 'f' else np.float64
+    mono = np.add(left, right, dtype=dtype)
+    mono *= gain
+    return mono
+
 
 def stereo_to_mono(audio: np.ndarray) -> np.ndarray:
     """
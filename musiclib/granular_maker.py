@@ -13,6 +13,9 @@ make_clouds_from_source, save_clouds) while enhancing the internals with:
 - Full config integration (brightness tags, stereo export, counts)
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Tuple
 import numpy as np
 import librosa
@@ -112,6 +115,20 @@ def analyze_grain_quality(
 # CORE EXTRACTION & SYNTHESIS (IMPROVED)
 # ============================================================================
 
+def _window_grain(segment: np.ndarray, grain_length: int) -> np.ndarray:
+    """
+    Hann-window a source view into a fresh, zero-padded grain buffer.
+
+    Padding and windowing share one allocation: the windowed samples are
+    written straight from the source view into the output.
+    """
+    window = dsp_utils.hann_window(grain_length)
+    grain = np.zeros(grain_length, dtype=np.result_type(segment, window))
+    n = min(len(segment), grain_length)
+    np.multiply(segment[:n], window[:n], out=grain[:n])
+    return grain
+
+
 def extract_grains(
     audio: np.ndarray,
     grain_length_min_ms: float,
@@ -170,12 +187,7 @@ def extract_grains(
         # Audio too short; extract what we can
         for _ in range(num_grains):
             grain_length = np.random.randint(grain_length_min_samples, grain_length_max_samples + 1)
-            grain = audio[:grain_length]
-            if len(grain) < grain_length:
-                grain = np.pad(grain, (0, grain_length - len(grain)))
-            window = dsp_utils.hann_window(len(grain))
-            grain = grain * window
-            grains.append(grain)
+            grains.append(_window_grain(audio[:grain_length], grain_length))
         return grains
 
     # Prepare stability mask if analyzer provided
@@ -265,20 +277,18 @@ def extract_grains(
             start = np.random.randint(0, max(1, max_start - grain_length + 1))
 
         end = min(start + grain_length, len(audio))
-        grain = audio[start:end]
-
-        # Pad if necessary
-        if len(grain) < grain_length:
-            grain = np.pad(grain, (0, grain_length - len(grain)))
-
-        # Quality check
-        if use_quality_filter and analyze_grain_quality(grain, sr) < min_quality:
-            continue
+        segment = audio[start:end]  # view; nothing is copied until windowing
+
+        # Quality check (scored on the zero-padded grain, as it will be placed)
+        if use_quality_filter:
+            candidate = segment
+            if len(candidate) < grain_length:
+                candidate = np.pad(candidate, (0, grain_length - len(candidate)))
+            if analyze_grain_quality(candidate, sr) < min_quality:
+                continue
 
         # Apply Hann window
-        window = dsp_utils.hann_window(len(grain))
-        grain = grain * window
-        grains.append(grain)
+        grains.append(_window_grain(segment, grain_length))
 
     return grains
 
@@ -344,12 +354,13 @@ def apply_pitch_shift_grain(
             # Calculate safe cutoff frequency (Nyquist after resampling)
             # Target sample rate will be sr/rate, so new Nyquist is (sr/rate)/2
             nyquist_after_shift = (sr / rate) / 2.0
-            # Use a conservative cutoff at 80% of new Nyquist to leave transition band
-            cutoff = nyquist_after_shift * 0.8
+            # Use a conservative cutoff at 80% of new Nyquist to leave transition band.
+            # Rounded to 10 Hz so the memoized filter design is reused across grains
+            cutoff = round(nyquist_after_shift * 0.8, -1)
             # Only filter if cutoff is below current Nyquist (sr/2)
             if cutoff < sr / 2:
-                b, a = dsp_utils.design_butterworth_lowpass(cutoff, sr, order=4)
-                processed_grain = dsp_utils.apply_filter(processed_grain, b, a)
+                sos = dsp_utils.design_butterworth_lowpass(cutoff, sr, order=4, output='sos')
+                processed_grain = dsp_utils.apply_filter(processed_grain, sos)
 
         # Resample using clamped rate
         # Use kaiser_fast for better performance (default kaiser_best is too slow for grains)
@@ -373,6 +384,7 @@ def create_cloud(
     overlap_ratio: float,
     config: dict = None,
     transposition_semitones: float = 0.0,
+    analyzer: audio_analyzer.AudioAnalyzer = None,
 ) -> np.ndarray:
     """
     Generate a granular cloud texture from audio.
@@ -395,6 +407,8 @@ def create_cloud(
         overlap_ratio: Grain overlap ratio (0.5-1.0)
         config: Configuration dictionary (optional; uses defaults if not provided)
         transposition_semitones: Fixed pitch shift to apply to all grains
+        analyzer: Pre-built AudioAnalyzer for ``audio`` (optional; built from
+            config when pre-analysis is enabled and none is given)
 
     Returns:
         Generated cloud audio array
@@ -417,13 +431,13 @@ def create_cloud(
     centroid_low = pre_analysis_config.get('centroid_low_hz')
     centroid_high = pre_analysis_config.get('centroid_high_hz')
 
-    # Create analyzer only if enabled
-    analyzer = None
-    if use_pre_analysis:
+    # Create analyzer only if enabled (and not already supplied)
+    if not use_pre_analysis:
+        analyzer = None
+        logger.debug(f"  [pre-analysis] Disabled: using random grain extraction")
+    elif analyzer is None:
         logger.debug(f"  [pre-analysis] Analyzing audio: {analysis_window_sec}s window, {analysis_hop_sec}s hop, onset_rate={max_onset_rate}, RMS=[{min_rms_db}, {max_rms_db}] dB, DC_offset={max_dc_offset}, crest={max_crest}")
         analyzer = audio_analyzer.AudioAnalyzer(audio, sr, window_size_sec=analysis_window_sec, hop_sec=analysis_hop_sec)
-    else:
-        logger.debug(f"  [pre-analysis] Disabled: using random grain extraction")
 
     # Extract grains with quality filtering and optional pre-analysis
     grains = extract_grains(
@@ -457,15 +471,6 @@ def create_cloud(
             analyzer=None,
         )
 
-    # Apply pitch shifts (resampling)
-    grains = [
-        apply_pitch_shift_grain(g, sr, pitch_shift_min, pitch_shift_max, transposition_semitones=transposition_semitones)
-        for g in grains
-    ]
-
-    # Shuffle grains to avoid temporal linearity
-    np.random.shuffle(grains)
-
     # Create output buffer
     cloud_samples = int(cloud_duration_sec * sr)
     cloud = np.zeros(cloud_samples)
@@ -476,6 +481,18 @@ def create_cloud(
     )
     hop_samples = max(1, int(grain_length_samples * (1 - overlap_ratio)))
 
+    # Shuffle grains to avoid temporal linearity, then drop any that the
+    # placement loop below would never reach before pitch-shifting them
+    np.random.shuffle(grains)
+    num_placements = -(-cloud_samples // hop_samples)
+    grains = grains[:max(1, num_placements)]
+
+    # Apply pitch shifts (resampling)
+    grains = [
+        apply_pitch_shift_grain(g, sr, pitch_shift_min, pitch_shift_max, transposition_semitones=transposition_semitones)
+        for g in grains
+    ]
+
     # Place grains with cycling (cycles through grains to fill buffer)
     grain_idx = 0
     current_pos = 0
@@ -497,8 +514,8 @@ def create_cloud(
     # Apply short fade in/out to prevent clicks (guard so fades don't dominate)
     fade_samples = int(0.01 * sr) # 10ms nominal
     fade_samples = min(fade_samples, len(cloud) // 4)
-    cloud = dsp_utils.apply_fade_in(cloud, fade_samples)
-    cloud = dsp_utils.apply_fade_out(cloud, fade_samples)
+    cloud = dsp_utils.apply_fade_in(cloud, fade_samples, inplace=True)
+    cloud = dsp_utils.apply_fade_out(cloud, fade_samples, inplace=True)
 
     return cloud
 
@@ -520,8 +537,8 @@ def apply_cloud_filtering(
         Filtered cloud audio
     """
     if lowpass_hz and lowpass_hz > 0:
-        b, a = dsp_utils.design_butterworth_lowpass(lowpass_hz, sr, order=3)
-        cloud = dsp_utils.apply_filter(cloud, b, a)
+        sos = dsp_utils.design_butterworth_lowpass(lowpass_hz, sr, order=3, output='sos')
+        cloud = dsp_utils.apply_filter(cloud, sos)
 
     return cloud
 
@@ -530,6 +547,32 @@ def apply_cloud_filtering(
 # HIGH-LEVEL CLOUD GENERATION API (v0.2 COMPATIBLE)
 # ============================================================================
 
+def _render_cloud(
+    audio: np.ndarray,
+    sr: int,
+    lowpass_hz: float,
+    cloud_kwargs: dict,
+    seed: int = None,
+) -> np.ndarray:
+    """
+    Render and filter one cloud (top-level so it can run in a worker process).
+
+    Args:
+        audio: Source audio
+        sr: Sample rate
+        lowpass_hz: Post-processing low-pass cutoff (optional)
+        cloud_kwargs: Keyword arguments for create_cloud()
+        seed: Seed for this cloud's grain placement
+
+    Returns:
+        Filtered cloud audio array
+    """
+    if seed is not None:
+        np.random.seed(seed)
+    cloud = create_cloud(audio, sr=sr, **cloud_kwargs)
+    return apply_cloud_filtering(cloud, sr, lowpass_hz=lowpass_hz)
+
+
 def make_clouds_from_source(
     audio: np.ndarray,
     sr: int,
@@ -544,6 +587,7 @@ def make_clouds_from_source(
 
     Respects config for:
     - clouds_per_source: number of variants to generate
+    - workers: render clouds in parallel processes when > 1
     - grain lengths, pitch ranges, overlap
     - brightness tagging and stereo export settings
 
@@ -614,29 +658,62 @@ def make_clouds_from_source(
     target_bars = musicality.get("bar_lengths", [])
     target_duration_sec = bars_to_seconds(target_bars[0]) if target_bars else cloud_config['cloud_duration_sec']
 
-    for i in range(clouds_per_source):
-        cloud = create_cloud(
-            audio,
-            sr=sr,
-            grain_length_min_ms=cloud_config['grain_length_min_ms'],
-            grain_length_max_ms=cloud_config['grain_length_max_ms'],
-            num_grains=cloud_config['grains_per_cloud'],
-            cloud_duration_sec=target_duration_sec,
-            pitch_shift_min=pitch_min,
-            pitch_shift_max=pitch_max,
-            overlap_ratio=cloud_config['overlap_ratio'],
-            config=config,
-            transposition_semitones=transposition_semitones,
-        )
-
-        # Apply filtering
-        cloud = apply_cloud_filtering(
-            cloud, sr, lowpass_hz=cloud_config.get('lowpass_hz')
-        )
+    cloud_kwargs = {
+        "grain_length_min_ms": cloud_config['grain_length_min_ms'],
+        "grain_length_max_ms": cloud_config['grain_length_max_ms'],
+        "num_grains": cloud_config['grains_per_cloud'],
+        "cloud_duration_sec": target_duration_sec,
+        "pitch_shift_min": pitch_min,
+        "pitch_shift_max": pitch_max,
+        "overlap_ratio": cloud_config['overlap_ratio'],
+        # Only pre_analysis is read downstream; keeps worker pickles small
+        "config": {"pre_analysis": config.get('pre_analysis', {})},
+        "transposition_semitones": transposition_semitones,
+    }
+    # Every cloud analyzes the same source, so analyze it once here. Workers
+    # receive the finished per-window curves rather than rebuilding them.
+    pre_analysis = config.get('pre_analysis', {})
+    if pre_analysis.get('enabled', True):
+        window_sec = pre_analysis.get('analysis_window_sec', 1.0)
+        hop_sec = pre_analysis.get('analysis_hop_sec', 0.5)
+        spectral = (pre_analysis.get('centroid_low_hz') is not None
+                    or pre_analysis.get('centroid_high_hz') is not None)
+        if pre_analysis.get('cache_results', False):
+            analyzer = audio_analyzer.AudioAnalyzer.from_cache(
+                audio, sr, window_size_sec=window_sec, hop_sec=hop_sec, spectral=spectral
+            )
+        else:
+            analyzer = audio_analyzer.AudioAnalyzer(
+                audio, sr, window_size_sec=window_sec, hop_sec=hop_sec
+            ).precompute(spectral=spectral)
+        cloud_kwargs["analyzer"] = analyzer
+    render = partial(_render_cloud, audio, sr, cloud_config.get('lowpass_hz'), cloud_kwargs)
+
+    # Per-cloud seeds are drawn from the parent stream, so a seeded run gives
+    # the same clouds whatever the workers setting
+    seeds = [int(s) for s in np.random.randint(0, 2**31 - 1, size=clouds_per_source)]
+    workers = cloud_config.get('workers', 1) or 1
+    if workers > 1 and clouds_per_source > 1:
+        # Clouds are independent: render them in worker processes. The
+        # forkserver start method keeps loader threads out of the children.
+        with ProcessPoolExecutor(
+            max_workers=min(workers, clouds_per_source),
+            mp_context=multiprocessing.get_context("forkserver"),
+        ) as executor:
+            rendered = list(executor.map(render, seeds))
+    else:
+        # Seeding each cloud reseeds the global stream; put the parent's state
+        # back so later draws match the worker-process path
+        parent_state = np.random.get_state()
+        try:
+            rendered = [render(seed) for seed in seeds]
+        finally:
+            np.random.set_state(parent_state)
 
+    for i, cloud in enumerate(rendered):
         # Normalize (skip if audio is silent/invalid)
         try:
-            cloud = dsp_utils.normalize_audio(cloud, peak_dbfs)
+            cloud = dsp_utils.normalize_audio(cloud, peak_dbfs, copy=False)
         except SilentArtifact as e:
             logger.warning(f"Skipping cloud {i+1} for {stem_name}: {e}")
             continue
@@ -692,11 +769,11 @@ def process_cloud_sources(config: dict) -> dict:
 
     results = {}
     try:
-        for filepath in tqdm(files, desc="Generating clouds", unit="file"):
+        loaded = io_utils.iter_audio_files_async(files, sr=sr, mono=True)
+        for filepath, audio in tqdm(loaded, total=len(files), desc="Generating clouds", unit="file"):
             stem = io_utils.get_filename_stem(filepath)
             tqdm.write(f"  Processing: {stem}")
 
-            audio, _ = io_utils.load_audio(filepath, sr=sr, mono=True)
             if audio is None:
                 continue
 
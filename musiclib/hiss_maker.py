@@ -46,6 +46,7 @@ def make_hiss_loop(
     tremolo_rate: float = 3.0,
     tremolo_depth: float = 0.6,
     config_override: dict = None,
+    fir_taps: int = 0,
 ) -> np.ndarray:
     """
     Create a high-frequency hiss loop from audio or noise.
@@ -61,6 +62,8 @@ def make_hiss_loop(
         tremolo_rate: Amplitude modulation rate in Hz
         tremolo_depth: Modulation depth (0-1)
         config_override: Optional config dict with hiss settings
+        fir_taps: Use a linear-phase FIR of this length (FFT convolution)
+            instead of the Butterworth IIR; 0 keeps the IIR
 
     Returns:
         Processed hiss loop audio
@@ -83,12 +86,19 @@ def make_hiss_loop(
         hiss = hiss[:target_samples]
 
     # Apply band-pass or high-pass filter
-    if bandpass:
-        b, a = dsp_utils.design_butterworth_bandpass(low_hz, high_hz, sr, order=4)
+    if fir_taps:
+        if bandpass:
+            taps = dsp_utils.design_fir_filter(sr, fir_taps, low_hz, high_hz)
+        else:
+            taps = dsp_utils.design_fir_filter(sr, fir_taps, low_hz=highpass_hz)
+        hiss = dsp_utils.apply_fir_filter(hiss, taps)
     else:
-        b, a = dsp_utils.design_butterworth_highpass(highpass_hz, sr, order=4)
+        if bandpass:
+            sos = dsp_utils.design_butterworth_bandpass(low_hz, high_hz, sr, order=4, output='sos')
+        else:
+            sos = dsp_utils.design_butterworth_highpass(highpass_hz, sr, order=4, output='sos')
 
-    hiss = dsp_utils.apply_filter(hiss, b, a)
+        hiss = dsp_utils.apply_filter(hiss, sos)
 
     # Apply tremolo (amplitude modulation)
     hiss = dsp_utils.apply_tremolo(hiss, tremolo_rate, tremolo_depth, sr)
@@ -100,7 +110,7 @@ def make_hiss_loop(
 
     # Normalize (return None if audio is silent/invalid)
     try:
-        hiss = dsp_utils.normalize_audio(hiss, -6.0)  # Slightly lower than main audio
+        hiss = dsp_utils.normalize_audio(hiss, -6.0, copy=False)  # Slightly lower than main audio
     except SilentArtifact as e:
         logger.warning(f"Cannot create hiss loop: {e}")
         return None
@@ -154,22 +164,23 @@ def make_flicker_burst(
 
     # Apply filtering
     if bandpass:
-        b, a = dsp_utils.design_butterworth_bandpass(low_hz, high_hz, sr, order=4)
+        sos = dsp_utils.design_butterworth_bandpass(low_hz, high_hz, sr, order=4, output='sos')
     else:
-        b, a = dsp_utils.design_butterworth_highpass(highpass_hz, sr, order=4)
+        sos = dsp_utils.design_butterworth_highpass(highpass_hz, sr, order=4, output='sos')
 
-    flicker = dsp_utils.apply_filter(flicker, b, a)
+    flicker = dsp_utils.apply_filter(flicker, sos)
 
     # Apply envelope (fast attack, fast release for "flicker" effect)
     fade_in_samples = int(0.01 * sr)  # 10ms fade-in
     fade_out_samples = int(0.05 * sr)  # 50ms fade-out
 
     flicker = dsp_utils.apply_fade_in(flicker, fade_in_samples)
-    flicker = dsp_utils.apply_fade_out(flicker, fade_out_samples)
+    # apply_fade_in returned a fresh buffer, so fade its tail in place
+    flicker = dsp_utils.apply_fade_out(flicker, fade_out_samples, inplace=True)
 
     # Normalize (return None if audio is silent/invalid)
     try:
-        flicker = dsp_utils.normalize_audio(flicker, -3.0)
+        flicker = dsp_utils.normalize_audio(flicker, -3.0, copy=False)
     except SilentArtifact as e:
         logger.warning(f"Cannot create flicker burst: {e}")
         return None
@@ -201,11 +212,11 @@ def process_hiss_from_drums(config: dict) -> dict:
     logger.info(f"\n[HISS MAKER] Processing {len(files)} drum file(s)...")
 
     results = {}
-    for filepath in tqdm(files, desc="Processing hiss", unit="file"):
+    loaded = io_utils.iter_audio_files_async(files, sr=sr, mono=True)
+    for filepath, audio in tqdm(loaded, total=len(files), desc="Processing hiss", unit="file"):
         stem = io_utils.get_filename_stem(filepath)
         tqdm.write(f"  Processing: {stem}")
 
-        audio, _ = io_utils.load_audio(filepath, sr=sr, mono=True)
         if audio is None:
             continue
 
@@ -231,6 +242,7 @@ def process_hiss_from_drums(config: dict) -> dict:
                 highpass_hz=hiss_config['highpass_hz'],
                 tremolo_rate=hiss_config['tremolo_rate_hz'],
                 tremolo_depth=hiss_config['tremolo_depth'],
+                fir_taps=hiss_config.get('fir_taps', 0),
             )
             filename = f"hiss_loop_{stem}_{i + 1:02d}.wav"
             outputs.append((hiss_loop, filename))
@@ -304,6 +316,7 @@ def process_hiss_synthetic(config: dict) -> dict:
             highpass_hz=hiss_config['highpass_hz'],
             tremolo_rate=hiss_config['tremolo_rate_hz'],
             tremolo_depth=hiss_config['tremolo_depth'],
+            fir_taps=hiss_config.get('fir_taps', 0),
         )
         filename = f"hiss_loop_{i + 1:02d}.wav"
         outputs.append((hiss_loop, filename))
@@ -2,11 +2,16 @@
 File I/O utilities: discovery, loading, saving, logging.
 """
 
+import hashlib
 import os
 import sys
 import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 import librosa
 import soundfile as sf
 import numpy as np
@@ -19,10 +24,26 @@ logger = get_logger(__name__)
 SUPPORTED_AUDIO_FORMATS = {'.wav', '.aiff', '.aif', '.flac'}
 
 
+# directory -> ({walked_dir: mtime_ns}, files); see discover_audio_files
+_discovery_cache = {}
+
+
+def _tree_unchanged(dir_mtimes: dict) -> bool:
+    """True if every directory from a previous walk still has the same mtime."""
+    try:
+        return all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items())
+    except OSError:
+        return False
+
+
 def discover_audio_files(directory: str) -> List[str]:
     """
     Recursively discover audio files in a directory.
 
+    Results are memoized per directory. A repeat call only stats the
+    directories seen last time, and walks again if any of their mtimes
+    changed (a file or subdirectory was added, removed or renamed).
+
     Args:
         directory: Path to search
 
@@ -32,17 +53,66 @@ def discover_audio_files(directory: str) -> List[str]:
     if not os.path.isdir(directory):
         return []
 
+    key = (directory, os.path.abspath(directory))
+    cached = _discovery_cache.get(key)
+    if cached is not None and _tree_unchanged(cached[0]):
+        return list(cached[1])
+
     files = []
+    dir_mtimes = {}
     for root, dirs, filenames in os.walk(directory):
+        dir_mtimes[root] = os.stat(root).st_mtime_ns
         for filename in filenames:
             ext = Path(filename).suffix.lower()
             if ext in SUPPORTED_AUDIO_FORMATS:
                 files.append(os.path.join(root, filename))
 
-    return sorted(files)
+    files.sort()
+    # Like git's "racily clean" rule: a directory modified within the mtime
+    # granularity of some filesystems could change again unnoticed
+    if time.time_ns() - max(dir_mtimes.values()) > 2_000_000_000:
+        _discovery_cache[key] = (dir_mtimes, files)
+    return list(files)
 
 
-def load_audio(filepath: str, sr: int = 44100, mono: bool = True) -> Tuple[Optional[np.ndarray], Optional[int]]:
+def _decoded_cache_path(filepath: str, sr: int, mono: bool, dtype) -> Optional[Path]:
+    """
+    Cache file for a decoded/resampled source.
+
+    Named ``<stem>-<source>-<version>.npy``: ``source`` hashes the absolute
+    path and load options, ``version`` the file's mtime and size, so stale
+    versions of one source share a prefix and can be pruned.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    source_key = f"{os.path.abspath(filepath)}|{sr}|{mono}|{np.dtype(dtype).str}"
+    source_digest = hashlib.sha1(source_key.encode("utf-8")).hexdigest()[:16]
+    version_digest = hashlib.sha1(f"{st.st_mtime_ns}|{st.st_size}".encode("utf-8")).hexdigest()[:8]
+    return get_cache_dir("decoded") / f"{Path(filepath).stem}-{source_digest}-{version_digest}.npy"
+
+
+def _prune_decoded_cache(cache_path: Path) -> None:
+    """Delete cached versions of the same source other than ``cache_path``."""
+    prefix = cache_path.name.rsplit("-", 1)[0]
+    for stale in cache_path.parent.glob(f"{prefix}-*.npy"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove stale decode cache {stale}: {e}")
+
+
+def load_audio(
+    filepath: str,
+    sr: int = 44100,
+    mono: bool = True,
+    dtype=np.float32,
+    use_cache: bool = False,
+    offset: float = 0.0,
+    duration: float = None,
+) -> Tuple[Optional[np.ndarray], Optional[int]]:
     """
     Load an audio file using librosa.
 
@@ -50,6 +120,15 @@ def load_audio(filepath: str, sr: int = 44100, mono: bool = True) -> Tuple[Optio
         filepath: Path to audio file
         sr: Target sample rate (Hz)
         mono: Convert to mono if True
+        dtype: Sample dtype. float32 is ample for 16/24-bit output and halves
+            memory traffic versus float64 in every downstream pass
+        use_cache: Keep the decoded, resampled samples as a .npy under
+            get_cache_dir("decoded") and memory-map it on later loads of the
+            same unmodified file (e.g. one source run through several miners).
+            Cached arrays are copy-on-write maps, so callers may modify them.
+            Only whole-file loads are cached
+        offset: Start reading this many seconds into the file
+        duration: Read at most this many seconds (None reads to the end)
 
     Returns:
         (audio_data, sample_rate) tuple, or (None, None) on error
@@ -59,8 +138,18 @@ def load_audio(filepath: str, sr: int = 44100, mono: bool = True) -> Tuple[Optio
         logger.error(f"File not found: {filepath}")
         return None, None
 
+    whole_file = offset == 0.0 and duration is None
+    cache_path = _decoded_cache_path(filepath, sr, mono, dtype) if use_cache and whole_file else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            return np.load(cache_path, mmap_mode="c"), sr
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable decode cache {cache_path}: {e}")
+
     try:
-        y, sr_orig = librosa.load(filepath, sr=sr, mono=mono)
+        y, sr_orig = librosa.load(
+            filepath, sr=sr, mono=mono, dtype=dtype, offset=offset, duration=duration
+        )
 
         # Validate loaded audio
         if y is None or len(y) == 0:
@@ -75,12 +164,117 @@ def load_audio(filepath: str, sr: int = 44100, mono: bool = True) -> Tuple[Optio
             logger.warning(f"Audio contains infinite values: {filepath}")
             return None, None
 
-        return y, sr
-
     except Exception as e:
         logger.warning(f"Failed to load {filepath}: {e}")
         return None, None
 
+    if cache_path is not None:
+        # Write-then-rename so a concurrent reader never maps a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, y)
+            os.replace(tmp_path, cache_path)
+            _prune_decoded_cache(cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write decode cache {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    return y, sr
+
+
+def load_audio_window(
+    filepath: str, sr: int = 44100, duration_sec: float = None, mono: bool = True, dtype=np.float32
+) -> Tuple[Optional[np.ndarray], Optional[int]]:
+    """
+    Load only the middle ``duration_sec`` seconds of an audio file.
+
+    For callers that keep just a central slice of long sources: the decoder
+    seeks past the rest, so I/O and resampling scale with the window rather
+    than the file. Files no longer than the window (or whose length cannot
+    be read from the header) are loaded whole.
+
+    Args:
+        filepath: Path to audio file
+        sr: Target sample rate (Hz)
+        duration_sec: Window length in seconds (None loads the whole file)
+        mono: Convert to mono if True
+        dtype: Sample dtype
+
+    Returns:
+        (audio_data, sample_rate) tuple, or (None, None) on error
+    """
+    offset = 0.0
+    if duration_sec is not None:
+        try:
+            file_duration = sf.info(filepath).duration
+        except Exception as e:
+            logger.debug(f"Could not read length of {filepath}, loading whole file: {e}")
+            file_duration = 0.0
+        if file_duration > duration_sec:
+            offset = (file_duration - duration_sec) / 2
+        else:
+            duration_sec = None
+    return load_audio(filepath, sr=sr, mono=mono, dtype=dtype, offset=offset, duration=duration_sec)
+
+
+def iter_audio_files_async(
+    files: List[str],
+    sr: int = 44100,
+    mono: bool = True,
+    workers: int = 4,
+    window_sec: float = None,
+) -> Iterator[Tuple[str, Optional[np.ndarray]]]:
+    """
+    Load audio files on background threads while the caller processes them.
+
+    Decoding and resampling release the GIL, so up to ``workers`` files are
+    read ahead of the consumer. Files are yielded in the given order.
+
+    Args:
+        files: Paths to load (e.g. from discover_audio_files)
+        sr: Target sample rate (Hz)
+        mono: Convert to mono if True
+        workers: Number of loader threads (also the read-ahead depth)
+        window_sec: Load only the middle ``window_sec`` seconds of each file
+            (see load_audio_window); None loads whole files
+
+    Yields:
+        (filepath, audio_data) tuples; audio_data is None if loading failed
+    """
+    if window_sec is None:
+        load = partial(load_audio, sr=sr, mono=mono)
+    else:
+        load = partial(load_audio_window, sr=sr, duration_sec=window_sec, mono=mono)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending = deque()
+        remaining = iter(files)
+        for filepath in remaining:
+            pending.append((filepath, executor.submit(load, filepath)))
+            if len(pending) >= workers:
+                break
+        while pending:
+            filepath, future = pending.popleft()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(load, next_path)))
+            yield filepath, future.result()[0]
+
+
+def _float_to_pcm32(audio: np.ndarray, bit_depth: int) -> np.ndarray:
+    """
+    Quantize float audio to left-aligned int32 PCM at ``bit_depth`` bits.
+
+    Samples are clipped to [-1, 1], rounded to the nearest step and shifted
+    into the top bits, which is how libsndfile reads int32 input for a
+    narrower PCM subtype.
+    """
+    full_scale = 2 ** (bit_depth - 1) - 1
+    pcm = np.rint(np.clip(audio, -1.0, 1.0) * full_scale).astype(np.int32)
+    pcm <<= 32 - bit_depth
+    return pcm
+
 
 def save_audio(
     filepath: str,
@@ -182,6 +376,11 @@ def save_audio(
         else:  # bit_depth == 24
             subtype = 'PCM_24'
 
+        # Quantize once in NumPy and hand libsndfile integers, rather than
+        # having it convert float samples one at a time on every write
+        if np.issubdtype(audio.dtype, np.floating):
+            audio = _float_to_pcm32(audio, bit_depth)
+
         # Write to the resolved path
         sf.write(str(abs_path), audio, sr, subtype=subtype)
 
@@ -230,6 +429,22 @@ def ensure_directory(directory: str) -> None:
     os.makedirs(directory, exist_ok=True)
 
 
+def get_cache_dir(subdir: str = "") -> Path:
+    """
+    Directory for derived-data caches (config, analysis results).
+
+    Uses AFTERGLOW_CACHE_DIR when set, else $XDG_CACHE_HOME/afterglow
+    (~/.cache/afterglow). The directory is created on demand.
+    """
+    base = os.environ.get("AFTERGLOW_CACHE_DIR")
+    if not base:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg, "afterglow")
+    cache_dir = Path(base) / subdir if subdir else Path(base)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def get_duration_seconds(audio: np.ndarray, sr: int) -> float:
     """Get duration of audio in seconds."""
     return len(audio) / sr
@@ -2,6 +2,9 @@
 Pad mining: extract sustained segments from audio files.
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Tuple
 from pathlib import Path
 import numpy as np
@@ -83,7 +86,10 @@ def extract_sustained_segments(
                 use_pre_analysis_thresholds = True
 
             logger.debug(f"    [pre-analysis] Analyzing for pad mining: onset_rate={pre_max_onset_rate}, RMS=[{pre_min_rms_db}, {pre_max_rms_db}] dB, DC={pre_max_dc_offset}, crest={pre_max_crest}")
-            analyzer = audio_analyzer.AudioAnalyzer(audio, sr, window_size_sec=analysis_window_sec, hop_sec=analysis_hop_sec)
+            if pre_analysis_config.get('cache_results', False):
+                analyzer = audio_analyzer.AudioAnalyzer.from_cache(audio, sr, window_size_sec=analysis_window_sec, hop_sec=analysis_hop_sec)
+            else:
+                analyzer = audio_analyzer.AudioAnalyzer(audio, sr, window_size_sec=analysis_window_sec, hop_sec=analysis_hop_sec)
             stable_mask = analyzer.get_stable_regions(
                 max_onset_rate=pre_max_onset_rate,
                 rms_low_db=pre_min_rms_db,
@@ -319,15 +325,32 @@ def mine_all_pads(config: dict) -> dict:
 
     logger.info(f"\n[PAD MINER] Processing {len(files)} file(s)...")
 
+    workers = config['pad_miner'].get('workers', 1) or 1
+    if workers > 1 and len(files) > 1:
+        # Files are independent: mine them in worker processes. The manifest
+        # stays in the parent, so don't ship it to workers.
+        worker_config = {k: v for k, v in config.items() if k != '_manifest'}
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(files)),
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        mined = executor.map(partial(mine_pads_from_file, config=worker_config), files)
+    else:
+        executor = None
+        mined = (mine_pads_from_file(filepath, config) for filepath in files)
+
     results = {}
-    for filepath in tqdm(files, desc="Mining pads", unit="file"):
-        stem = io_utils.get_filename_stem(filepath)
-        logger.info(f"  Processing: {stem}")
-
-        pads = mine_pads_from_file(filepath, config)
-        if pads:
-            results[stem] = pads
-            logger.info(f"    → Found {len(pads)} pad candidate(s)")
+    try:
+        for filepath, pads in tqdm(zip(files, mined), total=len(files), desc="Mining pads", unit="file"):
+            stem = io_utils.get_filename_stem(filepath)
+            logger.info(f"  Processing: {stem}")
+
+            if pads:
+                results[stem] = pads
+                logger.info(f"    → Found {len(pads)} pad candidate(s)")
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return results
 
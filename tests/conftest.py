@@ -1,5 +1,13 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root to the sys.path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep derived-data caches (decoded audio, parsed configs) out of ~/.cache."""
+    monkeypatch.setenv("AFTERGLOW_CACHE_DIR", str(tmp_path_factory.mktemp("afterglow-cache")))
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from musiclib.audio_analyzer import AudioAnalyzer
 from musiclib.granular_maker import create_cloud
@@ -58,3 +59,246 @@ def test_cloud_fade_guard_preserves_signal():
     )
     assert cloud.size > 0
     assert np.max(np.abs(cloud)) > 0
+
+
+def test_window_stats_match_per_window_loop():
+    """Strided RMS/DC/crest curves should match a per-window computation."""
+    sr = 1000
+    rng = np.random.default_rng(0)
+    audio = (0.2 * rng.standard_normal(sr * 5) + 0.01).astype(np.float32)
+    audio[:sr] = 0.0  # silent first window exercises the floors
+    analyzer = AudioAnalyzer(audio, sr, window_size_sec=0.5, hop_sec=0.25)
+
+    size, hop = analyzer.window_size_samples, analyzer.hop_samples
+    segments = [audio[s:s + size].astype(np.float64) for s in range(0, len(audio) - size + 1, hop)]
+    rms = np.array([np.sqrt(np.mean(seg ** 2)) for seg in segments])
+    expected_rms_db = np.array([20 * np.log10(r) if r > 0 else -80.0 for r in rms])
+    expected_dc = np.array([abs(seg.mean()) for seg in segments])
+    expected_crest = np.array(
+        [np.max(np.abs(seg)) / r if r > 1e-10 else 0.0 for seg, r in zip(segments, rms)]
+    )
+
+    np.testing.assert_allclose(analyzer._compute_rms_curve(), expected_rms_db, rtol=1e-6)
+    np.testing.assert_allclose(analyzer._compute_dc_offset(), expected_dc, atol=1e-9)
+    np.testing.assert_allclose(analyzer._compute_crest_factor(), expected_crest, rtol=1e-6)
+
+
+def test_window_onset_counts_match_boolean_scan():
+    """Binary-search onset counts should match a per-window boolean scan."""
+    sr = 1000
+    analyzer = AudioAnalyzer(np.zeros(sr * 4), sr, window_size_sec=0.5, hop_sec=0.2)
+    onsets = np.random.default_rng(3).integers(0, sr * 4, size=60)
+    onsets[:3] = [0, 500, 500]  # exact window boundaries and duplicates
+    onsets = np.sort(onsets)
+
+    counts = analyzer._window_onset_counts(onsets)
+    expected = [
+        np.sum((onsets >= start) & (onsets < start + analyzer.window_size_samples))
+        for start in range(0, len(analyzer.audio) - analyzer.window_size_samples + 1, analyzer.hop_samples)
+    ]
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_quiet_windows_match_silence_miner_gate():
+    """Quiet-window indices should match the silence miner's chunk gate."""
+    import mine_silences
+
+    sr = 1000
+    rng = np.random.default_rng(7)
+    audio = (0.001 * rng.standard_normal(sr * 6)).astype(np.float32)  # ~-60 dB room tone
+    audio[sr:2 * sr] = 0.0  # digital silence
+    audio[3 * sr + 100] = 0.5  # quiet bed with a transient
+    audio[4 * sr:5 * sr] *= 100.0  # too loud
+    analyzer = AudioAnalyzer(audio, sr, window_size_sec=0.3, hop_sec=0.15)
+    size, hop = analyzer.window_size_samples, analyzer.hop_samples
+    n_windows = (len(audio) - size) // hop + 1
+
+    quiet = analyzer.get_quiet_windows(rms_low_db=-80.0, rms_high_db=-45.0, max_crest=5.0)
+    keep = mine_silences._scan_chunks(
+        audio, size, hop, n_windows, 10 ** (-80.0 / 20), 10 ** (-45.0 / 20), 5.0
+    )
+    np.testing.assert_array_equal(quiet, np.flatnonzero(keep))
+    assert 0 < len(quiet) < n_windows
+
+
+def test_stats_centroid_reuses_whole_file_stft():
+    """Per-segment centroid should come from the cached whole-file spectrum."""
+    import librosa
+
+    sr = 22050
+    t = np.arange(sr * 2) / sr
+    audio = (0.3 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+    audio[sr:] = 0.3 * np.sin(2 * np.pi * 3000 * t[sr:])
+    analyzer = AudioAnalyzer(audio, sr)
+
+    expected = librosa.feature.spectral_centroid(y=audio, sr=sr)[0]
+    np.testing.assert_allclose(analyzer._get_centroid_frames(), expected, rtol=1e-4)
+
+    low = analyzer.get_stats_for_sample(4096, 16384)['centroid_hz']
+    high = analyzer.get_stats_for_sample(sr + 4096, sr + 16384)['centroid_hz']
+    assert abs(low - 1000) < 100
+    assert abs(high - 3000) < 100
+    assert analyzer.get_stats_for_sample(0, 100)['centroid_hz'] == 2000.0
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_block_window_stats_cover_uneven_window_and_hop(monkeypatch, use_numba):
+    """Compiled and block-combined stats should match direct windows for any window/hop pair."""
+    from musiclib import dsp_utils
+
+    monkeypatch.setattr(dsp_utils, "NUMBA_AVAILABLE", dsp_utils.NUMBA_AVAILABLE and use_numba)
+    sr = 1000
+    audio = np.random.default_rng(2).standard_normal(sr * 3 + 17).astype(np.float32)
+    for window_sec, hop_sec in [(0.3, 0.2), (0.3, 0.5), (0.257, 0.1), (1.0, 1.0)]:
+        analyzer = AudioAnalyzer(audio, sr, window_size_sec=window_sec, hop_sec=hop_sec)
+        size, hop = analyzer.window_size_samples, analyzer.hop_samples
+        windows = np.lib.stride_tricks.sliding_window_view(audio.astype(np.float64), size)[::hop]
+        sums, sum_sq, peaks = analyzer._compute_window_stats()
+        np.testing.assert_allclose(sums, windows.sum(axis=1), atol=1e-9)
+        np.testing.assert_allclose(sum_sq, (windows ** 2).sum(axis=1), rtol=1e-12)
+        np.testing.assert_array_equal(peaks, np.abs(windows).max(axis=1))
+
+
+def test_find_runs_matches_diff_scan():
+    """Single-pass run finder should match the padded-diff formulation."""
+    from musiclib.audio_analyzer import _find_runs
+
+    rng = np.random.default_rng(9)
+    for _ in range(20):
+        mask = rng.random(int(rng.integers(0, 40))) < 0.6
+        for min_len in (1, 2, 4):
+            diff = np.diff(np.concatenate([[False], mask, [False]]).astype(int))
+            expected = [
+                (s, e) for s, e in zip(np.flatnonzero(diff == 1), np.flatnonzero(diff == -1))
+                if e - s >= min_len
+            ]
+            np.testing.assert_array_equal(
+                _find_runs(mask, min_len).reshape(-1, 2), np.array(expected, dtype=np.int64).reshape(-1, 2)
+            )
+
+
+def test_seeded_analyzer_sampling_is_independent_of_global_stream():
+    """A seeded analyzer should repeat its stable-region picks regardless of np.random."""
+    sr = 22050
+    audio = np.random.default_rng(4).standard_normal(sr * 4).astype(np.float32) * 0.1
+    mask = np.ones(7, dtype=bool)
+
+    def picks(seed, global_seed):
+        np.random.seed(global_seed)
+        analyzer = AudioAnalyzer(audio, sr, seed=seed)
+        return [analyzer.sample_from_stable_region(0.5, stable_mask=mask) for _ in range(5)]
+
+    assert picks(3, 0) == picks(3, 1)
+    assert picks(None, 0) == picks(None, 0)
+
+
+def test_shared_analyzer_pickles_curves_and_matches_fresh_cloud():
+    """A precomputed analyzer should ship its curves without the STFT and
+    give the same cloud as one built inside create_cloud."""
+    import pickle
+
+    sr = 22050
+    rng = np.random.default_rng(11)
+    audio = 0.2 * np.sin(2 * np.pi * 220 * np.arange(sr * 4) / sr) + 0.01 * rng.standard_normal(sr * 4)
+    analyzer = AudioAnalyzer(audio, sr).precompute(spectral=True)
+    assert analyzer._stft_cache is not None
+
+    shipped = pickle.loads(pickle.dumps(analyzer))
+    assert shipped._stft_cache is None
+    np.testing.assert_array_equal(shipped._compute_rms_curve(), analyzer._compute_rms_curve())
+    np.testing.assert_array_equal(shipped._compute_spectral_centroid(), analyzer._compute_spectral_centroid())
+
+    kwargs = dict(
+        sr=sr, grain_length_min_ms=50, grain_length_max_ms=100, num_grains=20,
+        cloud_duration_sec=1.0, pitch_shift_min=0, pitch_shift_max=0, overlap_ratio=0.5,
+    )
+    np.random.seed(5)
+    fresh = create_cloud(audio, **kwargs)
+    np.random.seed(5)
+    shared = create_cloud(audio, analyzer=shipped, **kwargs)
+    np.testing.assert_array_equal(fresh, shared)
+
+
+def test_window_centroid_matches_per_window_frame_means():
+    """Prefix-sum window centroids should match per-window frame averages."""
+    import librosa
+
+    sr = 22050
+    audio = np.random.default_rng(8).standard_normal(sr * 3 + 100).astype(np.float32) * 0.1
+    for window_sec, hop_sec in [(1.0, 0.5), (0.3, 0.1), (0.01, 0.01)]:
+        analyzer = AudioAnalyzer(audio, sr, window_size_sec=window_sec, hop_sec=hop_sec)
+        frames = librosa.feature.spectral_centroid(S=np.abs(analyzer._get_stft()) ** 2, sr=sr)[0]
+        expected = []
+        for start in range(0, len(audio) - analyzer.window_size_samples + 1, analyzer.hop_samples):
+            first = start // 512
+            last = (start + analyzer.window_size_samples) // 512
+            if first < last <= len(frames):
+                expected.append(frames[first:last].mean())
+            elif first < len(frames):
+                expected.append(frames[first:].mean())
+            else:
+                expected.append(2000.0)
+        np.testing.assert_allclose(analyzer._compute_spectral_centroid(), expected, rtol=1e-6)
+
+
+def test_custom_stft_layout():
+    """n_fft and stft_hop should drive the STFT and the frame-to-sample mapping."""
+    import librosa
+
+    sr = 22050
+    audio = np.random.default_rng(9).standard_normal(sr * 2).astype(np.float32) * 0.1
+    analyzer = AudioAnalyzer(audio, sr, window_size_sec=0.5, hop_sec=0.25, n_fft=1024, stft_hop=256)
+    S = analyzer._get_stft()
+    assert S.shape == (513, len(audio) // 256 + 1)
+
+    frames = librosa.feature.spectral_centroid(S=np.abs(S), sr=sr, n_fft=1024)[0]
+    np.testing.assert_allclose(analyzer._get_centroid_frames(), frames, rtol=1e-4)
+    stats = analyzer.get_stats_for_sample(2560, 5120)
+    assert stats['centroid_hz'] == pytest.approx(frames[10:20].mean(), rel=1e-4)
+
+    with pytest.raises(ValueError):
+        AudioAnalyzer(audio, sr, stft_hop=0)
+
+
+def test_analysis_cache_round_trip(tmp_path, monkeypatch):
+    """A warm analysis cache should restore the curves without an STFT."""
+    monkeypatch.setenv("AFTERGLOW_CACHE_DIR", str(tmp_path))
+    sr = 22050
+    audio = (0.1 * np.random.default_rng(6).standard_normal(sr * 3)).astype(np.float32)
+
+    cold = AudioAnalyzer.from_cache(audio, sr, spectral=True)
+    assert cold._stft_cache is not None
+    assert len(list((tmp_path / "analysis").glob("*.npz"))) == 1
+
+    warm = AudioAnalyzer.from_cache(audio.copy(), sr, spectral=True)
+    assert warm._stft_cache is None
+    np.testing.assert_array_equal(warm.get_stable_regions(), cold.get_stable_regions())
+    np.testing.assert_array_equal(warm._compute_spectral_centroid(), cold._compute_spectral_centroid())
+
+    # Different samples or window layout miss the cache
+    AudioAnalyzer.from_cache(audio * 0.5, sr)
+    AudioAnalyzer.from_cache(audio, sr, window_size_sec=0.5)
+    assert len(list((tmp_path / "analysis").glob("*.npz"))) == 3
+
+
+def test_analyze_files_parallel_matches_serial(tmp_path):
+    """Batch analysis should give the same curves with one or two workers."""
+    import soundfile as sf
+    from musiclib.audio_analyzer import analyze_files
+
+    sr = 22050
+    rng = np.random.default_rng(12)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"src_{i}.wav"
+        sf.write(path, (0.1 * (i + 1) * rng.standard_normal(sr * 2)).astype(np.float32), sr)
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.wav"))
+
+    serial = analyze_files(paths, sr=sr, workers=1)
+    parallel = analyze_files(paths, sr=sr, workers=2)
+    assert serial[paths[-1]] is None and parallel[paths[-1]] is None
+    for path in paths[:-1]:
+        assert serial[path].keys() == parallel[path].keys()
+        for name, curve in serial[path].items():
+            np.testing.assert_array_equal(parallel[path][name], curve)
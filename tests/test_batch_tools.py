@@ -5,6 +5,7 @@ import shutil
 import soundfile as sf
 from pathlib import Path
 import subprocess
+from unittest import mock
 
 # Import the modules to test
 # We need to make sure the root dir is in path or we import relatively
@@ -12,7 +13,10 @@ import sys
 sys.path.append(os.getcwd())
 
 from dust_pads import dust_pad
-from mine_silences import mine_silences
+from mine_silences import mine_silences, _chunk_blocks, _scan_chunks
+from mine_drums import main as mine_drums_main
+from mine_drums import DEFAULT_CONFIG, _onset_envelope, _slice_bounds, _slice_and_filter
+import musiclib.dsp_utils as dsp_utils
 import musiclib.io_utils as io_utils
 
 # Import main function from curate_best
@@ -107,6 +111,157 @@ class TestBatchTools(unittest.TestCase):
         self.assertTrue(os.path.exists(expected_output_dir))
 
 
+    def test_drum_slice_kernel_matches_reference(self):
+        """Packed slice kernel should match the per-slice fade/normalize path"""
+        sr = 44100
+        rng = np.random.default_rng(0)
+        audio = rng.standard_normal(sr * 5) * 0.3
+        audio[sr:2 * sr] *= 1e-4  # quiet hits below the gate
+        onsets = np.sort(rng.choice(len(audio), 60, replace=False)).astype(np.int64)
+        max_len, min_len, fade_in, fade_out = int(0.8 * sr), int(0.05 * sr), 88, 882
+
+        starts, ends = _slice_bounds(onsets, len(audio), max_len, min_len)
+        buffer, offsets, lengths = _slice_and_filter(
+            audio, starts, ends, np.linspace(0.0, 1.0, fade_in), np.linspace(1.0, 0.0, fade_out),
+            dsp_utils.db_to_linear(-30.0), dsp_utils.db_to_linear(-1.0), 2000,
+        )
+
+        expected = []
+        for i, start in enumerate(onsets):
+            end = onsets[i + 1] if i < len(onsets) - 1 else len(audio)
+            end = min(end, start + max_len)
+            if end - start < min_len:
+                continue
+            hit = audio[start:end]
+            if dsp_utils.linear_to_db(np.max(np.abs(hit))) < -30.0:
+                continue
+            hit = dsp_utils.apply_fade_out(dsp_utils.apply_fade_in(hit, fade_in), fade_out)
+            expected.append(dsp_utils.normalize_audio(hit, -1.0))
+
+        self.assertEqual(len(offsets), len(expected))
+        for offset, length, hit in zip(offsets, lengths, expected):
+            np.testing.assert_allclose(buffer[offset:offset + length], hit, atol=1e-12)
+
+        # A non-finite sample fails loudly, as normalize_audio did
+        audio[starts[-1] + 10] = np.nan
+        with self.assertRaises(ValueError):
+            _slice_and_filter(
+                audio, starts, ends, np.linspace(0.0, 1.0, fade_in), np.linspace(1.0, 0.0, fade_out),
+                dsp_utils.db_to_linear(-30.0), dsp_utils.db_to_linear(-1.0), 2000,
+            )
+
+    def test_chunked_onset_envelope_matches_librosa(self):
+        """Chunked onset strength should equal librosa's whole-file envelope"""
+        import librosa
+        sr = 22050
+        rng = np.random.default_rng(1)
+        audio = np.zeros(sr * 7, dtype=np.float32)
+        for start in rng.choice(len(audio) - 3000, 40, replace=False):
+            audio[start:start + 3000] += rng.standard_normal(3000).astype(np.float32) * np.exp(-np.arange(3000) / 400)
+
+        chunked = _onset_envelope(audio, sr, chunk_sec=2.0)
+        expected = librosa.onset.onset_strength(y=audio, sr=sr)
+        self.assertEqual(chunked.shape, expected.shape)
+        np.testing.assert_allclose(chunked, expected, atol=1e-5)
+
+    def test_silence_scan_matches_per_chunk_gates(self):
+        """_scan_chunks should agree with the per-chunk RMS/crest/variance gates"""
+        chunk_len, step = 400, 200
+        rng = np.random.default_rng(4)
+        levels = 10 ** rng.uniform(-5, -1, 60).repeat(step)
+        block = (rng.standard_normal(len(levels)) * levels).astype(np.float32)
+        block[1000:3000] = 0.0  # digital silence
+        block[5000] = 0.05  # quiet transient
+        n_chunks = (len(block) - chunk_len) // step + 1
+        min_rms, max_rms = dsp_utils.db_to_linear(-80.0), dsp_utils.db_to_linear(-45.0)
+
+        expected = []
+        for i in range(n_chunks):
+            chunk = block[i * step:i * step + chunk_len].astype(np.float64)
+            rms = np.sqrt(np.mean(chunk ** 2))
+            crest = np.max(np.abs(chunk)) / rms if rms > 1e-10 else 0.0
+            expected.append(min_rms <= rms <= max_rms and crest <= 5.0 and np.var(chunk) >= 1e-9)
+
+        keep = _scan_chunks(block, chunk_len, step, n_chunks, min_rms, max_rms, 5.0)
+        np.testing.assert_array_equal(keep, expected)
+        self.assertTrue(keep.any() and not keep.all())
+
+    def test_silence_blocks_follow_chunk_grid(self):
+        """Streamed blocks should line up with the full-file chunk grid"""
+        sr, chunk_len, step = 8000, 300, 150
+        audio = np.random.uniform(-0.5, 0.5, (sr, 2)).astype(np.float32)
+        path = os.path.join(self.test_dir, "stream.wav")
+        sf.write(path, audio, sr, subtype="FLOAT")
+        mono = audio.mean(axis=1)
+
+        n_samples, blocks = _chunk_blocks(path, sr, chunk_len, step, chunks_per_block=4)
+        self.assertEqual(n_samples, sr)
+        seen = 0
+        for first_chunk, block in blocks:
+            for k in range(max(0, (len(block) - chunk_len) // step + 1)):
+                start = (first_chunk + k) * step
+                np.testing.assert_allclose(
+                    block[k * step:k * step + chunk_len], mono[start:start + chunk_len], atol=1e-7
+                )
+                seen += 1
+        self.assertEqual(seen, (sr - chunk_len) // step + 1)
+
+    def test_mine_drums_sources_pool(self):
+        """--sources should mine every file through the process pool"""
+        sr = 44100
+        sources = []
+        for name in ("kit_a", "kit_b"):
+            audio = np.zeros(sr * 2, dtype=np.float32)
+            for start in range(sr // 4, len(audio) - sr // 4, sr // 4):
+                audio[start:start + 2000] = np.random.uniform(-0.8, 0.8, 2000) * np.exp(-np.arange(2000) / 300)
+            path = os.path.join(self.test_dir, "src", f"{name}.wav")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            sf.write(path, audio, sr)
+            sources.append(path)
+
+        config_path = os.path.join(self.test_dir, "drums.yaml")
+        with open(config_path, "w") as f:
+            f.write(f"paths:\n  export_dir: {os.path.join(self.test_dir, 'out')}\n")
+
+        argv = ["mine_drums.py", "--config", config_path, "--workers", "2", "--sources", *sources]
+        with mock.patch.object(sys, "argv", argv):
+            self.assertEqual(mine_drums_main(), 0)
+        for name in ("kit_a", "kit_b"):
+            drums = os.listdir(os.path.join(self.test_dir, "out", name, "drums"))
+            self.assertGreater(len(drums), 0)
+
+    def test_compiled_peak_picking_matches_librosa(self):
+        """dsp_utils.detect_onsets should pick the same onsets as librosa.onset.onset_detect"""
+        import librosa
+        sr = 22050
+        rng = np.random.default_rng(2)
+        audio = np.zeros(sr * 10, dtype=np.float32)
+        for start in rng.choice(len(audio) - 3000, 120, replace=False):
+            hit = rng.standard_normal(3000).astype(np.float32) * np.exp(-np.arange(3000) / 400)
+            audio[start:start + 3000] += hit * rng.uniform(0.05, 1.0)
+        env = librosa.onset.onset_strength(y=audio, sr=sr)
+
+        dm_config = DEFAULT_CONFIG["drum_miner"]
+        expected = librosa.onset.onset_detect(
+            onset_envelope=env, sr=sr, backtrack=dm_config["onset_backtrack"],
+            pre_max=dm_config["pre_max"], post_max=dm_config["post_max"],
+            pre_avg=dm_config["pre_avg"], post_avg=dm_config["post_avg"],
+            delta=dm_config["delta"], wait=dm_config["wait"], units="samples",
+        )
+        self.assertGreater(len(expected), 0)
+        actual = dsp_utils.detect_onsets(
+            env, sr, backtrack=dm_config["onset_backtrack"],
+            pre_max=dm_config["pre_max"], post_max=dm_config["post_max"],
+            pre_avg=dm_config["pre_avg"], post_avg=dm_config["post_avg"],
+            delta=dm_config["delta"], wait=dm_config["wait"],
+        )
+        np.testing.assert_array_equal(actual, expected)
+        # librosa's own defaults, as used by AudioAnalyzer
+        np.testing.assert_array_equal(
+            dsp_utils.detect_onsets(env, sr),
+            librosa.onset.onset_detect(onset_envelope=env, sr=sr, units="samples"),
+        )
+
     def test_curate_best_prunes_output_dir(self):
         """
         Verify curate_best does not descend into its own output directory
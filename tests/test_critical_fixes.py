@@ -124,6 +124,28 @@ class TestH3AtomicManifestWrites(unittest.TestCase):
             content = f.read()
             self.assertIn("test.wav", content)
 
+    def test_manifest_writer_streams_and_commits(self):
+        """ManifestWriter writes rows as they arrive and moves the file on commit"""
+        from make_textures import ManifestWriter
+
+        manifest_path = os.path.join(self.test_dir, "manifest.csv")
+        manifest = ManifestWriter(self.test_dir)
+        manifest.append({"filename": "a.wav", "grade": "A", "saved": True})
+        manifest.append({"filename": "b.wav", "grade": "F", "saved": False})
+        self.assertEqual(len(manifest), 2)
+        self.assertFalse(os.path.exists(manifest_path))
+
+        self.assertEqual(manifest.commit(manifest_path), 2)
+        with open(manifest_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([r["filename"] for r in rows], ["a.wav", "b.wav"])
+        self.assertEqual(os.listdir(self.test_dir), ["manifest.csv"])
+
+        # No rows: temp file is removed and nothing is written
+        os.remove(manifest_path)
+        self.assertEqual(ManifestWriter(self.test_dir).commit(manifest_path), 0)
+        self.assertEqual(os.listdir(self.test_dir), [])
+
 class TestH5CrestFactorGuards(unittest.TestCase):
     """H5: Verify crest factor calculations don't crash on silent/near-zero audio"""
 
@@ -182,10 +204,16 @@ class TestH5CrestFactorGuards(unittest.TestCase):
         import mine_silences
         import inspect
 
-        # Check that the conservative threshold guard is in the source
-        source = inspect.getsource(mine_silences.mine_silences)
+        # Check that the conservative threshold guard is in the scan that divides
+        scan = getattr(mine_silences._scan_chunks, "py_func", mine_silences._scan_chunks)
+        source = inspect.getsource(scan)
         self.assertIn("1e-10", source, "Conservative threshold should be present")
-        self.assertIn("if rms_val >", source, "RMS check should exist before division")
+        self.assertIn("rms_val > 1e-10", source, "RMS check should exist before division")
+
+        # An all-zero block must be rejected without dividing by zero
+        with np.errstate(divide="raise", invalid="raise"):
+            keep = mine_silences._scan_chunks(np.zeros(1000, dtype=np.float32), 200, 100, 9, 0.0, 1.0, 5.0)
+        self.assertFalse(keep.any())
 
 class TestH6BitDepthValidation(unittest.TestCase):
     """H6: Verify bit depth validation in save_audio"""
@@ -219,6 +247,23 @@ class TestH6BitDepthValidation(unittest.TestCase):
             info = sf.info(filepath16)
             self.assertEqual(info.subtype, "PCM_16")
 
+    def test_float_quantized_to_nearest_pcm_step(self):
+        """Pre-quantized writes should land on the nearest PCM step, clipped"""
+        import tempfile
+        import soundfile as sf
+        from musiclib import io_utils
+
+        audio = np.concatenate([np.random.uniform(-1, 1, 1000), [1.5, -1.5, 0.0]])
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["AFTERGLOW_EXPORT_ROOT"] = tmp
+            for bit_depth in (16, 24):
+                filepath = os.path.join(tmp, f"q{bit_depth}.wav")
+                self.assertTrue(io_utils.save_audio(filepath, audio, sr=44100, bit_depth=bit_depth))
+                written, _ = sf.read(filepath, dtype="int32")
+                full_scale = 2 ** (bit_depth - 1) - 1
+                expected = np.rint(np.clip(audio, -1, 1) * full_scale)
+                np.testing.assert_array_equal(written >> (32 - bit_depth), expected)
+
 class TestH7PhaseAwareStereoConversion(unittest.TestCase):
     """H7: Verify phase-aware stereo conversion methods"""
 
@@ -42,3 +42,241 @@ def test_loop_optimization_aligns_phase():
     diff = len(audio) - len(out_opt)
     # Ensure some trimming happened but not more than half the buffer
     assert 1 <= diff <= len(audio) // 2
+
+
+def test_hann_window_memoized_and_read_only():
+    """Repeated grain lengths should reuse one immutable window."""
+    w1 = dsp_utils.hann_window(256)
+    w2 = dsp_utils.hann_window(256)
+    assert w1 is w2
+    assert not w1.flags.writeable
+    grain = np.ones(256) * w1  # multiplying into a new array still works
+    assert np.isclose(grain.max(), 1.0)
+
+
+def test_fir_bandpass_attenuates_out_of_band():
+    sr = 44100
+    t = np.arange(sr) / sr
+    in_band = np.sin(2 * np.pi * 8000 * t)
+    out_band = np.sin(2 * np.pi * 500 * t)
+
+    taps = dsp_utils.design_fir_filter(sr, 127, 4000, 14000)
+    assert dsp_utils.design_fir_filter(sr, 127, 4000, 14000) is taps
+
+    kept = dsp_utils.apply_fir_filter(in_band, taps)
+    removed = dsp_utils.apply_fir_filter(out_band, taps)
+    assert kept.shape == in_band.shape
+    core = slice(len(taps), -len(taps))
+    assert np.sqrt(np.mean(kept[core] ** 2)) > 0.6
+    assert np.sqrt(np.mean(removed[core] ** 2)) < 0.01
+
+
+def test_peak_abs_matches_numpy():
+    rng = np.random.default_rng(3)
+    stereo = rng.standard_normal((512, 2))
+    assert dsp_utils.peak_abs(stereo) == np.max(np.abs(stereo))
+    assert dsp_utils.peak_abs(stereo[:, 1]) == np.max(np.abs(stereo[:, 1]))
+    assert dsp_utils.peak_abs(stereo[::3].astype(np.float32)) == np.max(np.abs(stereo[::3].astype(np.float32)))
+    assert dsp_utils.peak_abs(np.zeros(0)) == 0.0
+    assert dsp_utils.peak_abs(np.zeros(0, dtype=np.float32)) == 0.0
+    negative = np.array([0.25, -0.75, 0.5], dtype=np.float32)  # peak on a negative sample
+    assert dsp_utils.peak_abs(negative) == 0.75
+    assert dsp_utils.peak_abs(np.array([-3, 2], dtype=np.int32)) == 3.0
+    np.testing.assert_allclose(
+        dsp_utils.normalize_audio(np.array([0, -16000, 8000], dtype=np.int16)),
+        [0.0, -0.891, 0.446], atol=1e-3,
+    )
+
+
+def test_manifest_fields_follow_metadata_order():
+    metadata = dsp_utils.compute_audio_metadata(np.ones(1024) * 0.1, 44100, kind="pad")
+    assert dsp_utils.MANIFEST_FIELDS == tuple(metadata) + ("grade", "saved")
+
+
+def test_float32_preserved_through_normalize_and_fades():
+    audio = (np.random.default_rng(0).standard_normal(4096) * 0.1).astype(np.float32)
+    out = dsp_utils.normalize_audio(audio, -1.0)
+    out = dsp_utils.apply_fade_out(dsp_utils.apply_fade_in(out, 64), 64)
+    assert out.dtype == np.float32
+
+
+def test_fade_normalize_inplace_matches_composed_steps():
+    rng = np.random.default_rng(5)
+    fade_in, fade_out = dsp_utils.fade_ramp(64, rising=True), dsp_utils.fade_ramp(64, rising=False)
+    for length in (1000, 40):  # second case is shorter than the ramps
+        audio = (0.1 * rng.standard_normal(length)).astype(np.float32)
+        expected = dsp_utils.normalize_audio(
+            dsp_utils.apply_fade_out(dsp_utils.apply_fade_in(audio, 64), 64), -6.0
+        )
+        buf = audio.copy()
+        peak = dsp_utils.fade_normalize_inplace(buf, fade_in, fade_out, dsp_utils.db_to_linear(-6.0))
+        assert peak > 0
+        np.testing.assert_allclose(buf, expected, atol=1e-6)
+
+    silent = np.zeros(100, dtype=np.float32)
+    assert dsp_utils.fade_normalize_inplace(silent, fade_in, fade_out, 0.5) < 1e-8
+    assert not silent.any()
+
+    # Non-finite input comes back as a non-finite peak with the buffer unscaled
+    for bad in (np.nan, np.inf):
+        buf = (0.1 * rng.standard_normal(1000)).astype(np.float32)
+        buf[500] = bad
+        before = buf.copy()
+        peak = dsp_utils.fade_normalize_inplace(buf, fade_in, fade_out, 0.5)
+        assert not np.isfinite(peak)
+        np.testing.assert_array_equal(buf[64:500], before[64:500])
+
+
+def test_ms_to_db_matches_rms_amplitude_db():
+    """Power-domain dB should equal 20*log10 of the RMS, with the same floor."""
+    rng = np.random.default_rng(4)
+    audio = 0.1 * rng.standard_normal(4096)
+    rms = np.sqrt(np.mean(audio ** 2))
+    assert np.isclose(dsp_utils.rms_energy_db(audio), 20 * np.log10(rms))
+    assert dsp_utils.rms_energy_db(np.zeros(16)) == -80.0
+
+    ms = np.array([0.0, 1e-12, 0.25, 1.0])
+    np.testing.assert_allclose(
+        dsp_utils.ms_to_db(ms), [-80.0, -120.0, 20 * np.log10(0.5), 0.0], atol=1e-9
+    )
+
+
+def test_sos_filter_matches_transfer_function_filter():
+    audio = np.random.default_rng(3).standard_normal(8192) * 0.1
+    for cutoff, btype, order in ((3000, 'low', 4), (6000, 'high', 4), (1500, 'low', 5)):
+        design = dsp_utils.design_butterworth_lowpass if btype == 'low' else dsp_utils.design_butterworth_highpass
+        b, a = design(cutoff, 44100, order=order)
+        sos = design(cutoff, 44100, order=order, output='sos')
+        assert design(cutoff, 44100, order=order, output='sos') is sos
+        np.testing.assert_allclose(
+            dsp_utils.apply_filter(audio, sos), dsp_utils.apply_filter(audio, b, a), atol=1e-6
+        )
+    # float32 audio is filtered in single precision
+    assert dsp_utils.apply_filter(audio.astype(np.float32), sos).dtype == np.float32
+
+
+def test_butterworth_designs_are_memoized_and_read_only():
+    b, a = dsp_utils.design_butterworth_bandpass(500, 4000, 44100, order=4)
+    assert dsp_utils.design_butterworth_bandpass(500, 4000, 44100, order=4)[0] is b
+    assert not b.flags.writeable and not a.flags.writeable
+    # Filtering with the shared read-only coefficients still works
+    assert dsp_utils.apply_filter(np.ones(1024), b, a).shape == (1024,)
+
+
+def test_apply_filter_accepts_sos_and_transfer_function():
+    audio = np.random.default_rng(4).standard_normal(8192) * 0.1
+    b, a = dsp_utils.design_butterworth_bandpass(300, 5000, 44100, order=4)
+    sos = dsp_utils.design_butterworth_bandpass(300, 5000, 44100, order=4, output='sos')
+    assert sos.ndim == 2 and not sos.flags.writeable
+    from scipy import signal
+    expected = signal.filtfilt(b, a, audio)
+    np.testing.assert_allclose(dsp_utils.apply_filter(audio, sos), expected, atol=1e-6)
+    np.testing.assert_allclose(dsp_utils.apply_filter(audio, b, a), expected, atol=1e-6)
+
+
+def test_metadata_brightness_reuses_centroid(monkeypatch):
+    import librosa
+
+    calls = []
+    original = librosa.feature.spectral_centroid
+    monkeypatch.setattr(
+        librosa.feature, "spectral_centroid", lambda **kw: calls.append(1) or original(**kw)
+    )
+    sr = 22050
+    for freq in (200, 2000, 6000):
+        audio = (0.3 * np.sin(2 * np.pi * freq * np.arange(sr) / sr)).astype(np.float32)
+        calls.clear()
+        metadata = dsp_utils.compute_audio_metadata(audio, sr, brightness_bounds=(1200, 4000), kind="pad")
+        assert len(calls) == 1
+        assert metadata["brightness"] == dsp_utils.classify_brightness(audio, sr, 1200, 4000)
+
+
+def test_metadata_shares_one_fft_without_librosa(monkeypatch):
+    sr = 22050
+    audio = 0.3 * np.sin(2 * np.pi * 440 * np.arange(sr) / sr) + 0.1
+    expected_pitch = dsp_utils.estimate_pitch_hz(audio, sr)
+    monkeypatch.setattr(dsp_utils, "librosa", None)
+    expected_brightness = dsp_utils.classify_brightness(audio, sr, 1200, 4000)
+
+    calls = []
+    original = dsp_utils._compute_spectrum
+    monkeypatch.setattr(
+        dsp_utils, "_compute_spectrum", lambda *args: calls.append(1) or original(*args)
+    )
+    metadata = dsp_utils.compute_audio_metadata(audio, sr, brightness_bounds=(1200, 4000), kind="pad")
+    assert len(calls) == 1
+    assert metadata["est_freq_hz"] == expected_pitch == 440.0
+    assert metadata["brightness"] == expected_brightness
+
+
+def test_normalize_audio_in_place():
+    audio = (0.1 * np.random.default_rng(9).standard_normal(2048)).astype(np.float32)
+    expected = dsp_utils.normalize_audio(audio, -3.0)
+    buf = audio.copy()
+    out = dsp_utils.normalize_audio(buf, -3.0, copy=False)
+    assert out is buf
+    np.testing.assert_array_equal(out, expected)
+    # Integer input cannot hold the result, so it still gets a new array
+    ints = np.array([0, -16000, 8000], dtype=np.int16)
+    assert dsp_utils.normalize_audio(ints, copy=False) is not ints
+
+
+def test_fused_crossfades_match_reference():
+    rng = np.random.default_rng(12)
+    audio1, audio2 = rng.standard_normal(1000), rng.standard_normal(800)
+    t = np.linspace(0, 1, 256)
+    overlap = audio1[-256:] * np.sqrt(1 - t) + audio2[:256] * np.sqrt(t)
+    expected = np.concatenate([audio1[:-256], overlap, audio2[256:]])
+    np.testing.assert_allclose(dsp_utils.crossfade(audio1, audio2, 256), expected, atol=1e-12)
+
+    loop = dsp_utils.time_domain_crossfade_loop(audio1, 5.0, 44100, optimize_loop=False)
+    n = int(5.0 * 44100 / 1000)
+    fade_in, fade_out = dsp_utils.crossfade_curves(n)
+    expected = audio1.copy()
+    expected[:n] = audio1[:n] * fade_in + audio1[-n:] * fade_out
+    expected[-n:] *= fade_out
+    np.testing.assert_allclose(loop, expected, atol=1e-12)
+
+
+def test_ensure_mono_mixes_without_overflow_and_keeps_float32():
+    ints = np.array([[30000, 30000], [30000, -2]], dtype=np.int16)  # (2, N)
+    np.testing.assert_array_equal(dsp_utils.ensure_mono(ints), [30000.0, 14999.0])
+    stereo = np.random.default_rng(2).standard_normal((512, 2)).astype(np.float32)
+    mono = dsp_utils.ensure_mono(stereo, method="sum")
+    assert mono.dtype == np.float32
+    np.testing.assert_allclose(mono, stereo.sum(axis=1) / np.sqrt(2.0), rtol=1e-6)
+
+
+def test_peak_and_mean_square_matches_separate_scans():
+    rng = np.random.default_rng(21)
+    for audio in (
+        (0.2 * rng.standard_normal(10001)).astype(np.float32),
+        0.5 * rng.standard_normal((2, 4096)),
+        np.array([-3, 2], dtype=np.int16),
+    ):
+        peak, mean_square = dsp_utils.peak_and_mean_square(audio)
+        assert peak == float(np.max(np.abs(audio)))
+        np.testing.assert_allclose(mean_square, np.mean(audio.astype(np.float64) ** 2), rtol=1e-9)
+    assert dsp_utils.peak_and_mean_square(np.zeros(0)) == (0.0, 0.0)
+
+
+def test_edge_envelopes_in_place_match_copies():
+    audio = np.random.default_rng(8).standard_normal(1000).astype(np.float32)
+    window = dsp_utils.hann_window(200)
+    expected_hann = audio.copy()
+    expected_hann[:100] *= window[:100]
+    expected_hann[-100:] *= window[100:]
+    cases = (
+        (dsp_utils.apply_fade_in, 64, audio * np.r_[np.linspace(0, 1, 64), np.ones(936)]),
+        (dsp_utils.apply_fade_out, 64, audio * np.r_[np.ones(936), np.linspace(1, 0, 64)]),
+        (dsp_utils.apply_hann_window_edge, 100, expected_hann),
+    )
+    for func, length, expected in cases:
+        out = func(audio, length)
+        assert out is not audio and out.dtype == np.float32
+        np.testing.assert_allclose(out, expected, rtol=1e-6)
+        buf = audio.copy()
+        assert func(buf, length, inplace=True) is buf
+        np.testing.assert_array_equal(buf, out)
+    # Zero-length envelopes leave the audio unchanged
+    np.testing.assert_array_equal(dsp_utils.apply_fade_out(audio, 0), audio)
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import musiclib.dsp_utils as dsp_utils
 import musiclib.audio_analyzer as audio_analyzer
 import musiclib.granular_maker as granular_maker
+import musiclib.drone_maker as drone_maker
 
 
 class TestSpectralAnalysisRegression(unittest.TestCase):
@@ -249,5 +250,88 @@ class TestGrainSynthesisTHD(unittest.TestCase):
                           f"Shifted grain should have energy (RMS={shifted_rms:.3f})")
 
 
+class TestParallelCloudRendering(unittest.TestCase):
+    """Cloud worker pool should be deterministic under a fixed seed."""
+
+    def _render(self, workers):
+        sr = 22050
+        t = np.linspace(0, 2.0, sr * 2, endpoint=False)
+        audio = 0.3 * np.sin(2 * np.pi * 220 * t)
+        config = {
+            "global": {"target_peak_dbfs": -1.0},
+            "clouds": {
+                "grain_length_min_ms": 50,
+                "grain_length_max_ms": 100,
+                "grains_per_cloud": 20,
+                "cloud_duration_sec": 1.0,
+                "pitch_shift_range": {"min": 0, "max": 0},
+                "overlap_ratio": 0.5,
+                "clouds_per_source": 2,
+                "workers": workers,
+            },
+            "pre_analysis": {"enabled": False},
+            "brightness_tags": {"enabled": False},
+        }
+        np.random.seed(7)
+        return granular_maker.make_clouds_from_source(audio, sr, "sine", config)
+
+    def test_parallel_clouds_reproducible(self):
+        first = self._render(workers=2)
+        second = self._render(workers=2)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual([name for _, _, name in first], ["cloud_sine_01.wav", "cloud_sine_02.wav"])
+        for (a, _, _), (b, _, _) in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+
+    def test_workers_setting_does_not_change_seeded_output(self):
+        serial = self._render(workers=1)
+        parallel = self._render(workers=2)
+
+        self.assertEqual(len(serial), len(parallel))
+        for (a, _, _), (b, _, _) in zip(serial, parallel):
+            np.testing.assert_array_equal(a, b)
+
+
+
+class TestPadVocoderFrame(unittest.TestCase):
+    """Pitch/stretch variants should use a ~40 ms vocoder frame."""
+
+    def test_vocoder_n_fft_tracks_sample_rate(self):
+        self.assertEqual(drone_maker.vocoder_n_fft(44100), 1024)
+        self.assertEqual(drone_maker.vocoder_n_fft(48000), 1024)
+        self.assertEqual(drone_maker.vocoder_n_fft(22050), 512)
+        self.assertEqual(drone_maker.vocoder_n_fft(96000), 2048)
+
+    def test_shifted_variants_keep_pitch_and_length(self):
+        sr = 22050
+        t = np.arange(sr * 2) / sr
+        audio = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+        variants = dict(
+            (name, y) for y, name in drone_maker.process_pad_source(audio, sr, [12], [2.0])
+        )
+
+        self.assertEqual(len(variants["pitch_+12"]), len(audio))
+        self.assertEqual(len(variants["stretch_2.0x"]), len(audio) // 2)
+        spectrum = np.abs(np.fft.rfft(variants["pitch_+12"]))
+        peak_hz = np.argmax(spectrum) * sr / len(audio)
+        self.assertAlmostEqual(peak_hz, 440, delta=10)
+
+    def test_shared_stft_matches_librosa_effects(self):
+        import librosa
+
+        sr = 22050
+        audio = (0.1 * np.random.default_rng(2).standard_normal(sr * 2)).astype(np.float32)
+        variants = dict(
+            (name, y) for y, name in drone_maker.process_pad_source(audio, sr, [0, 7], [1.0, 1.5])
+        )
+        kwargs = {"n_fft": 512, "hop_length": 128}
+        np.testing.assert_array_equal(
+            variants["pitch_+7"], librosa.effects.pitch_shift(audio, sr=sr, n_steps=7, **kwargs)
+        )
+        np.testing.assert_array_equal(
+            variants["stretch_1.5x"], librosa.effects.time_stretch(audio, rate=1.5, **kwargs)
+        )
+
 if __name__ == "__main__":
     unittest.main()
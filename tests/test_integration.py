@@ -82,3 +82,170 @@ def test_full_pipeline_integration(tmp_path, monkeypatch):
     # Check hiss output (may live under export_dir/hiss or nested)
     hiss_files = list(Path(config['paths']['export_dir']).glob("**/hiss/*.wav"))
     assert hiss_files, "No hiss exports found"
+
+
+def test_mine_all_pads_parallel_matches_serial(tmp_path):
+    """Mining with a worker pool should yield the same pads as the serial path."""
+    from musiclib import segment_miner
+
+    source_dir = tmp_path / "source_audio"
+    source_dir.mkdir()
+    create_sine_wave(source_dir / "a.wav", duration_sec=3.0, freq=220.0)
+    create_sine_wave(source_dir / "b.wav", duration_sec=3.0, freq=440.0)
+
+    config = load_or_create_config(str(tmp_path / "config.yaml"))
+    config['paths']['source_audio_dir'] = str(source_dir)
+    config['pad_miner']['min_rms_db'] = -80.0
+    config['pad_miner']['max_rms_db'] = 0.0
+    config['pad_miner']['max_onset_rate_per_second'] = 100.0
+    config['pad_miner']['spectral_flatness_threshold'] = 1.0
+    config['pre_analysis']['enabled'] = False
+
+    serial = segment_miner.mine_all_pads(config)
+    config['pad_miner']['workers'] = 2
+    parallel = segment_miner.mine_all_pads(config)
+
+    assert serial and list(serial) == list(parallel)
+    for stem in serial:
+        assert len(serial[stem]) == len(parallel[stem])
+        for (a, tag_a), (b, tag_b) in zip(serial[stem], parallel[stem]):
+            assert tag_a == tag_b
+            np.testing.assert_allclose(a, b)
+
+
+def test_process_pad_sources_parallel_matches_serial(tmp_path):
+    """Drone outputs from a worker pool should match the serial path."""
+    from musiclib import drone_maker
+
+    pad_dir = tmp_path / "pad_sources"
+    pad_dir.mkdir()
+    create_sine_wave(pad_dir / "a.wav", duration_sec=2.0, sr=22050, freq=220.0)
+    create_sine_wave(pad_dir / "b.wav", duration_sec=2.0, sr=22050, freq=330.0)
+
+    config = load_or_create_config(str(tmp_path / "config.yaml"))
+    config['global']['sample_rate'] = 22050
+    config['paths']['pad_sources_dir'] = str(pad_dir)
+    config['drones']['pitch_shift_semitones'] = [0]
+    config['drones']['time_stretch_factors'] = [1.0]
+
+    serial = drone_maker.process_pad_sources(config)
+    config['drones']['workers'] = 2
+    parallel = drone_maker.process_pad_sources(config)
+
+    assert serial and list(serial) == list(parallel)
+    for stem in serial:
+        assert serial[stem]["context"] == parallel[stem]["context"]
+        assert [out[1:] for out in serial[stem]["outputs"]] == [out[1:] for out in parallel[stem]["outputs"]]
+        assert {kind for _, _, kind in serial[stem]["outputs"]} == {"pad", "swell"}
+        for (a, _, _), (b, _, _) in zip(serial[stem]["outputs"], parallel[stem]["outputs"]):
+            assert a.dtype == np.float32
+            np.testing.assert_allclose(a, b)
+
+
+def test_make_swells_skips_non_finite_audio(tmp_path):
+    """A NaN in the source must not produce a NaN swell."""
+    from musiclib import drone_maker
+
+    config = load_or_create_config(str(tmp_path / "config.yaml"))
+    sr = 22050
+    audio = (0.3 * np.sin(2 * np.pi * 220 * np.arange(sr * 8) / sr)).astype(np.float32)
+    assert drone_maker.make_swells(audio, sr, "tone", config)
+    audio[len(audio) // 2] = np.nan
+    assert drone_maker.make_swells(audio, sr, "tone", config) == []
+
+
+def test_config_cache_tracks_file_changes(tmp_path, monkeypatch):
+    """Parsed configs are cached as JSON, and edits to the YAML invalidate the cache."""
+    monkeypatch.setenv("AFTERGLOW_CACHE_DIR", str(tmp_path / "cache"))
+    config_path = tmp_path / "config.yaml"
+    load_or_create_config(str(config_path))  # writes the default file
+
+    first = load_or_create_config(str(config_path))
+    cache_files = list((tmp_path / "cache").glob("config-*.json"))
+    assert len(cache_files) == 1
+    assert load_or_create_config(str(config_path)) == first
+
+    # A corrupt cache file is ignored and rewritten
+    cache_files[0].write_bytes(b"\x80\x04not json")
+    assert load_or_create_config(str(config_path)) == first
+
+    text = config_path.read_text().replace("sample_rate: 44100", "sample_rate: 48000")
+    config_path.write_text(text)
+    assert load_or_create_config(str(config_path))['global']['sample_rate'] == 48000
+
+
+def test_iter_audio_files_async_preserves_order(tmp_path):
+    """Read-ahead loader yields files in order and None for unreadable ones."""
+    paths = []
+    for i, freq in enumerate([220.0, 330.0, 440.0, 550.0, 660.0]):
+        path = tmp_path / f"tone_{i}.wav"
+        create_sine_wave(path, duration_sec=0.2, sr=22050, freq=freq)
+        paths.append(str(path))
+    broken = tmp_path / "broken.wav"
+    broken.write_bytes(b"not audio")
+    paths.insert(2, str(broken))
+
+    loaded = list(io_utils.iter_audio_files_async(paths, sr=22050, workers=2))
+
+    assert [p for p, _ in loaded] == paths
+    assert loaded[2][1] is None
+    expected, _ = io_utils.load_audio(paths[0], sr=22050)
+    np.testing.assert_array_equal(loaded[0][1], expected)
+
+
+def test_load_audio_decode_cache(tmp_path, monkeypatch):
+    """Cached loads map the decoded .npy and are invalidated by file changes."""
+    monkeypatch.setenv("AFTERGLOW_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "tone.wav"
+    create_sine_wave(path, duration_sec=0.5, sr=22050, freq=220.0)
+
+    first, sr = io_utils.load_audio(str(path), sr=44100, use_cache=True)
+    assert sr == 44100
+    assert len(list((tmp_path / "cache" / "decoded").glob("*.npy"))) == 1
+
+    cached, _ = io_utils.load_audio(str(path), sr=44100, use_cache=True)
+    assert isinstance(cached, np.memmap)
+    np.testing.assert_array_equal(cached, first)
+    cached *= 0.5  # copy-on-write: the cache file is untouched
+    np.testing.assert_array_equal(io_utils.load_audio(str(path), sr=44100, use_cache=True)[0], first)
+
+    create_sine_wave(path, duration_sec=0.25, sr=22050, freq=330.0)
+    changed, _ = io_utils.load_audio(str(path), sr=44100, use_cache=True)
+    assert len(changed) < len(first)
+    # The entry for the previous version of the file is pruned
+    assert len(list((tmp_path / "cache" / "decoded").glob("*.npy"))) == 1
+
+
+def test_discover_audio_files_cache_sees_nested_changes(tmp_path):
+    """Memoized discovery must notice files added in subdirectories."""
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    create_sine_wave(tmp_path / "top.wav", duration_sec=0.1)
+
+    past = os.stat(tmp_path).st_mtime - 60
+    for d in (tmp_path, tmp_path / "a", nested):
+        os.utime(d, (past, past))
+
+    first = io_utils.discover_audio_files(str(tmp_path))
+    assert (str(tmp_path), str(tmp_path)) in io_utils._discovery_cache
+    assert first == io_utils.discover_audio_files(str(tmp_path))
+
+    create_sine_wave(nested / "deep.wav", duration_sec=0.1)
+    assert io_utils.discover_audio_files(str(tmp_path)) == sorted(first + [str(nested / "deep.wav")])
+
+
+def test_load_audio_window_reads_middle_of_file(tmp_path):
+    """Windowed loads should match the middle slice of a whole-file load."""
+    sr = 22050
+    path = tmp_path / "long.wav"
+    ramp = np.linspace(-0.5, 0.5, sr * 10, dtype=np.float32)
+    sf.write(path, ramp, sr, subtype="FLOAT")
+
+    whole, _ = io_utils.load_audio(str(path), sr=sr)
+    window, _ = io_utils.load_audio_window(str(path), sr=sr, duration_sec=4.0)
+    start = (len(whole) - len(window)) // 2
+    assert len(window) == sr * 4
+    np.testing.assert_allclose(window, whole[start:start + len(window)], atol=1e-6)
+
+    short, _ = io_utils.load_audio_window(str(path), sr=sr, duration_sec=20.0)
+    np.testing.assert_array_equal(short, whole)
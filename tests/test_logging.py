@@ -204,6 +204,11 @@ class TestCompatibility(unittest.TestCase):
         """Verify [✗] prefix removal."""
         self.assertEqual(migrate_prefix("[✗] Error message"), "Error message")
 
+    def test_migrate_prefix_longer_prefixes(self):
+        """Verify [✗✗] and [config] prefixes are removed whole."""
+        self.assertEqual(migrate_prefix("[✗✗] Fatal"), "Fatal")
+        self.assertEqual(migrate_prefix("[config] Loaded"), "Loaded")
+
     def test_migrate_prefix_none(self):
         """Verify messages without prefixes pass through unchanged."""
         self.assertEqual(migrate_prefix("No prefix here"), "No prefix here")
@@ -224,6 +229,10 @@ class TestCompatibility(unittest.TestCase):
         """Verify log level detection for [✗]."""
         self.assertEqual(detect_log_level("[✗] Message"), "ERROR")
 
+    def test_detect_log_level_critical(self):
+        """Verify log level detection for [✗✗]."""
+        self.assertEqual(detect_log_level("[✗✗] Message"), "CRITICAL")
+
     def test_detect_log_level_debug(self):
         """Verify log level detection for [·]."""
         self.assertEqual(detect_log_level("[·] Message"), "DEBUG")
@@ -232,6 +241,24 @@ class TestCompatibility(unittest.TestCase):
         """Verify default log level for no prefix."""
         self.assertEqual(detect_log_level("Message"), "INFO")
 
+    def test_print_helpers_skip_disabled_levels(self):
+        """Verify print_* helpers emit nothing below the logger's level."""
+        from unittest import mock
+        from musiclib import compat
+
+        saved_level = compat._compat_logger.level
+        compat._compat_logger.setLevel(logging.ERROR)
+        try:
+            with mock.patch.object(compat._compat_logger, "_log") as log:
+                compat.print_info("info")
+                compat.print_warning("warning")
+                compat.print_success("success")
+                log.assert_not_called()
+                compat.print_error("error")
+                log.assert_called_once()
+        finally:
+            compat._compat_logger.setLevel(saved_level)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -93,6 +93,17 @@ class TestSTFTCaching(unittest.TestCase):
         self.assertIsNotNone(centroid_cached)
         self.assertTrue(len(centroid_cached) > 0)
 
+    def test_stft_power_cached_and_matches_magnitude_squared(self):
+        """Power spectrogram should equal |S|**2 and be computed once."""
+        sr = 22050
+        audio = np.random.default_rng(0).standard_normal(sr).astype(np.float32) * 0.1
+        analyzer = AudioAnalyzer(audio, sr, window_size_sec=0.5)
+
+        power = analyzer._get_stft_power()
+        np.testing.assert_allclose(power, np.abs(analyzer._get_stft()) ** 2, rtol=1e-5)
+        analyzer._compute_spectral_centroid()
+        self.assertIs(analyzer._get_stft_power(), power)
+
 
 if __name__ == '__main__':
     unittest.main()
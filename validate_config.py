@@ -50,6 +50,11 @@ def validate_config(config: dict) -> None:
         elif grains_per_sec > 1000:
             errors.append(f"clouds.grains_per_sec ({grains_per_sec}) is unreasonably high (> 1000)")
 
+    # Clouds: parallel rendering
+    cloud_workers = clouds.get("workers")
+    if cloud_workers is not None and (not isinstance(cloud_workers, int) or cloud_workers <= 0):
+        errors.append("clouds.workers must be a positive integer")
+
     # Clouds: filter length (H4 - Critical for FFT validity)
     filter_length = clouds.get("filter_length_samples")
     if filter_length is not None and sr:
@@ -81,6 +86,11 @@ def validate_config(config: dict) -> None:
     if expand_sec is not None and (not isinstance(expand_sec, (int, float)) or expand_sec < 0):
         errors.append("pad_miner.expand_segment_sec must be a non-negative number")
 
+    # Pad miner: parallel file processing
+    pad_workers = pad_miner.get("workers")
+    if pad_workers is not None and (not isinstance(pad_workers, int) or pad_workers <= 0):
+        errors.append("pad_miner.workers must be a positive integer")
+
     # Pre-analysis: onset rate and RMS bounds
     pre = config.get("pre_analysis", {})
     pre_min_rms = pre.get("min_rms_db")
@@ -91,6 +101,8 @@ def validate_config(config: dict) -> None:
         errors.append("pre_analysis.analysis_window_sec must be > 0")
     if pre.get("analysis_hop_sec") is not None and pre.get("analysis_hop_sec") <= 0:
         errors.append("pre_analysis.analysis_hop_sec must be > 0")
+    if not isinstance(pre.get("cache_results", False), bool):
+        errors.append("pre_analysis.cache_results must be boolean")
     # Pre-analysis: stable windows
     min_stable = pre.get("min_stable_windows")
     if min_stable is not None and (not isinstance(min_stable, int) or min_stable <= 0):
@@ -155,6 +167,10 @@ def validate_config(config: dict) -> None:
     if burst_min is not None and burst_min <= 0:
         errors.append(f"hiss.burst_duration_min_ms ({burst_min}) must be positive")
 
+    fir_taps = hiss.get("fir_taps")
+    if fir_taps and (not isinstance(fir_taps, int) or fir_taps < 0 or fir_taps % 2 == 0):
+        errors.append("hiss.fir_taps must be 0 (IIR) or a positive odd integer")
+
     # Swells and drones (legacy)
     swells = config.get("swells", {})
     attack_sec = swells.get("attack_sec")
@@ -179,6 +195,11 @@ def validate_config(config: dict) -> None:
         elif drone_dur > 600:
             errors.append(f"drones.target_duration_sec ({drone_dur}) is unreasonably large (> 10 minutes)")
 
+    # Drones: parallel file processing
+    drone_workers = drones.get("workers")
+    if drone_workers is not None and (not isinstance(drone_workers, int) or drone_workers <= 0):
+        errors.append("drones.workers must be a positive integer")
+
     # Drone maker (v0.8 schema)
     drone_maker = config.get("drone_maker", {})
     target_durations = drone_maker.get("target_durations_sec")
@@ -236,11 +257,16 @@ if __name__ == "__main__":
     import os
     from musiclib.logger import log_success
 
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+
     config_path = "config.yaml"
     if os.path.exists(config_path):
         with open(config_path, "r") as f:
             try:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
                 validate_config(config)
                 log_success(logger, "Configuration is valid.")
             except Exception as e: